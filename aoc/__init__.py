@@ -8,38 +8,206 @@ __author__ = "nekitdev"
 __license__ = "MIT"
 __version__ = "0.2.0"
 
-from aoc.data import dump_data, get_path_for_key, load_data
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+from aoc.data import (
+    Buffer,
+    dump_data,
+    get_path_for_key,
+    iter_lines,
+    load_data,
+    load_data_bytes,
+    map_data,
+    open_data,
+)
 from aoc.errors import DataNotFound, LogicalError, TokenNotFound
-from aoc.http import HTTPClient, Route
 from aoc.names import get_key_by_name, get_name_by_key
-from aoc.primitives import Day, Key, Year
-from aoc.runners import Results, Runner, run_path
-from aoc.solutions import FinalResult, FinalSolution, Result, Solution
-from aoc.states import State
-from aoc.time import AOC_TIMEZONE, aoc_today, get_key_for_date
-from aoc.timers import Clock, Elapsed, Timer, now
+from aoc.primitives import Day, Key, Phase, Year
+from aoc.states import Reply, State, parse_wait
+from aoc.timers import Clock, Elapsed, Measure, Overhead, Timer, calibrate, now
 from aoc.tokens import dump_token, load_token, remove_token
-from aoc.versions import python_version_info, version_info
+
+if TYPE_CHECKING:
+    from aoc.benchmarks import Statistics, mann_whitney, sample
+    from aoc.caches import Entry, ResultCache, hash_data
+    from aoc.discoveries import Index, discover, find_keys
+    from aoc.downloads import Downloader, TokenBucket, find_missing
+    from aoc.formats import (
+        Format,
+        Writer,
+        serialize_elapsed,
+        serialize_error,
+        serialize_failure,
+        serialize_final_result,
+        serialize_memory,
+        serialize_result,
+        serialize_submission,
+    )
+    from aoc.histories import Comparison, History, Record, compare, get_commit, get_machine
+    from aoc.http import HTTPClient, Response, Route
+    from aoc.inputs import PICKLE_CODEC, Codec, InputCache, InputEntry, PickleCodec
+    from aoc.isolation import (
+        Failure,
+        Isolated,
+        Limits,
+        can_fork,
+        get_safe_context,
+        run_isolated,
+        start_isolated,
+    )
+    from aoc.memory import Allocation, Memory, Size, Tracker
+    from aoc.modules import find_imports, find_local_modules, hash_module
+    from aoc.profiles import Hotspot, Profiler
+    from aoc.registries import REGISTRY, Registry, get_registry
+    from aoc.retries import RETRYABLE_STATUSES, RetryPolicy, parse_retry_after
+    from aoc.runners import (
+        Benchmarks,
+        Fetch,
+        Item,
+        Outcome,
+        ParallelRunner,
+        Results,
+        Runner,
+        Solutions,
+        run_path,
+        run_paths,
+    )
+    from aoc.solutions import (
+        Benchmark,
+        BytesSolution,
+        FinalBenchmark,
+        FinalBytesSolution,
+        FinalLineSolution,
+        FinalResult,
+        FinalSolution,
+        LineSolution,
+        Result,
+        Solution,
+    )
+    from aoc.sources import (
+        DataSource,
+        Fetched,
+        Metadata,
+        dump_metadata,
+        get_metadata_path_for_key,
+        load_metadata,
+    )
+    from aoc.stores import Store, write_atomic
+    from aoc.submissions import (
+        ProblemPart,
+        Submission,
+        SubmissionQueue,
+        get_wait,
+        resubmit_answers,
+        submit_answer,
+    )
+    from aoc.time import AOC_TIMEZONE, aoc_today, get_key_for_date
+    from aoc.versions import python_version_info, version_info
+    from aoc.watchers import Snapshot, Watcher, unload_modules
 
 __all__ = (
     # solutions
     "Result",
+    "Benchmark",
     "Solution",
     "FinalResult",
+    "FinalBenchmark",
     "FinalSolution",
+    "LineSolution",
+    "FinalLineSolution",
+    "BytesSolution",
+    "FinalBytesSolution",
+    # benchmarks
+    "Statistics",
+    "sample",
+    "mann_whitney",
+    # histories
+    "Record",
+    "Comparison",
+    "History",
+    "get_commit",
+    "get_machine",
+    "compare",
+    # registries
+    "REGISTRY",
+    "Registry",
+    "get_registry",
     # runners
+    "Outcome",
+    "Item",
     "Results",
+    "Benchmarks",
+    "Solutions",
+    "Fetch",
     "Runner",
+    "ParallelRunner",
     "run_path",
+    "run_paths",
+    # isolation
+    "Failure",
+    "Limits",
+    "Isolated",
+    "can_fork",
+    "get_safe_context",
+    "start_isolated",
+    "run_isolated",
+    # formats
+    "Format",
+    "Writer",
+    "serialize_elapsed",
+    "serialize_memory",
+    "serialize_result",
+    "serialize_final_result",
+    "serialize_failure",
+    "serialize_error",
+    "serialize_submission",
+    # caches
+    "Entry",
+    "ResultCache",
+    "hash_data",
+    # inputs
+    "Codec",
+    "PickleCodec",
+    "PICKLE_CODEC",
+    "InputEntry",
+    "InputCache",
+    # stores
+    "Store",
+    "write_atomic",
+    # modules
+    "find_imports",
+    "find_local_modules",
+    "hash_module",
+    # discoveries
+    "Index",
+    "find_keys",
+    "discover",
+    # downloads
+    "TokenBucket",
+    "Downloader",
+    "find_missing",
+    # memory
+    "Size",
+    "Allocation",
+    "Memory",
+    "Tracker",
+    # profiles
+    "Hotspot",
+    "Profiler",
     # timers
     "Elapsed",
+    "Measure",
     "Clock",
+    "Overhead",
     "Timer",
+    "calibrate",
     "now",
     # primitives
     "Year",
     "Day",
     "Key",
+    "Phase",
     # names
     "get_key_by_name",
     "get_name_by_key",
@@ -52,19 +220,191 @@ __all__ = (
     "dump_token",
     "remove_token",
     # data
+    "Buffer",
     "get_path_for_key",
     "load_data",
+    "load_data_bytes",
+    "map_data",
+    "open_data",
+    "iter_lines",
     "dump_data",
+    # sources
+    "Metadata",
+    "Fetched",
+    "DataSource",
+    "get_metadata_path_for_key",
+    "load_metadata",
+    "dump_metadata",
     # time
     "AOC_TIMEZONE",
     "aoc_today",
     "get_key_for_date",
     # states
     "State",
+    "Reply",
+    "parse_wait",
+    # submissions
+    "ProblemPart",
+    "Submission",
+    "SubmissionQueue",
+    "get_wait",
+    "submit_answer",
+    "resubmit_answers",
+    # retries
+    "RETRYABLE_STATUSES",
+    "RetryPolicy",
+    "parse_retry_after",
     # HTTP
     "HTTPClient",
     "Route",
+    "Response",
     # versions
     "python_version_info",
     "version_info",
+    # watchers
+    "Snapshot",
+    "Watcher",
+    "unload_modules",
 )
+
+LAZY = {
+    # solutions
+    "Result": "aoc.solutions",
+    "Benchmark": "aoc.solutions",
+    "Solution": "aoc.solutions",
+    "FinalResult": "aoc.solutions",
+    "FinalBenchmark": "aoc.solutions",
+    "FinalSolution": "aoc.solutions",
+    "LineSolution": "aoc.solutions",
+    "FinalLineSolution": "aoc.solutions",
+    "BytesSolution": "aoc.solutions",
+    "FinalBytesSolution": "aoc.solutions",
+    # benchmarks
+    "Statistics": "aoc.benchmarks",
+    "sample": "aoc.benchmarks",
+    "mann_whitney": "aoc.benchmarks",
+    # histories
+    "Record": "aoc.histories",
+    "Comparison": "aoc.histories",
+    "History": "aoc.histories",
+    "get_commit": "aoc.histories",
+    "get_machine": "aoc.histories",
+    "compare": "aoc.histories",
+    # registries
+    "REGISTRY": "aoc.registries",
+    "Registry": "aoc.registries",
+    "get_registry": "aoc.registries",
+    # runners
+    "Outcome": "aoc.runners",
+    "Item": "aoc.runners",
+    "Results": "aoc.runners",
+    "Benchmarks": "aoc.runners",
+    "Solutions": "aoc.runners",
+    "Fetch": "aoc.runners",
+    "Runner": "aoc.runners",
+    "ParallelRunner": "aoc.runners",
+    "run_path": "aoc.runners",
+    "run_paths": "aoc.runners",
+    # isolation
+    "Failure": "aoc.isolation",
+    "Limits": "aoc.isolation",
+    "Isolated": "aoc.isolation",
+    "can_fork": "aoc.isolation",
+    "get_safe_context": "aoc.isolation",
+    "start_isolated": "aoc.isolation",
+    "run_isolated": "aoc.isolation",
+    # formats
+    "Format": "aoc.formats",
+    "Writer": "aoc.formats",
+    "serialize_elapsed": "aoc.formats",
+    "serialize_memory": "aoc.formats",
+    "serialize_result": "aoc.formats",
+    "serialize_final_result": "aoc.formats",
+    "serialize_failure": "aoc.formats",
+    "serialize_error": "aoc.formats",
+    "serialize_submission": "aoc.formats",
+    # caches
+    "Entry": "aoc.caches",
+    "ResultCache": "aoc.caches",
+    "hash_data": "aoc.caches",
+    # inputs
+    "Codec": "aoc.inputs",
+    "PickleCodec": "aoc.inputs",
+    "PICKLE_CODEC": "aoc.inputs",
+    "InputEntry": "aoc.inputs",
+    "InputCache": "aoc.inputs",
+    # stores
+    "Store": "aoc.stores",
+    "write_atomic": "aoc.stores",
+    # modules
+    "find_imports": "aoc.modules",
+    "find_local_modules": "aoc.modules",
+    "hash_module": "aoc.modules",
+    # discoveries
+    "Index": "aoc.discoveries",
+    "find_keys": "aoc.discoveries",
+    "discover": "aoc.discoveries",
+    # downloads
+    "TokenBucket": "aoc.downloads",
+    "Downloader": "aoc.downloads",
+    "find_missing": "aoc.downloads",
+    # memory
+    "Size": "aoc.memory",
+    "Allocation": "aoc.memory",
+    "Memory": "aoc.memory",
+    "Tracker": "aoc.memory",
+    # profiles
+    "Hotspot": "aoc.profiles",
+    "Profiler": "aoc.profiles",
+    # sources
+    "Metadata": "aoc.sources",
+    "Fetched": "aoc.sources",
+    "DataSource": "aoc.sources",
+    "get_metadata_path_for_key": "aoc.sources",
+    "load_metadata": "aoc.sources",
+    "dump_metadata": "aoc.sources",
+    # time
+    "AOC_TIMEZONE": "aoc.time",
+    "aoc_today": "aoc.time",
+    "get_key_for_date": "aoc.time",
+    # submissions
+    "ProblemPart": "aoc.submissions",
+    "Submission": "aoc.submissions",
+    "SubmissionQueue": "aoc.submissions",
+    "get_wait": "aoc.submissions",
+    "submit_answer": "aoc.submissions",
+    "resubmit_answers": "aoc.submissions",
+    # retries
+    "RETRYABLE_STATUSES": "aoc.retries",
+    "RetryPolicy": "aoc.retries",
+    "parse_retry_after": "aoc.retries",
+    # HTTP
+    "HTTPClient": "aoc.http",
+    "Route": "aoc.http",
+    "Response": "aoc.http",
+    # versions
+    "python_version_info": "aoc.versions",
+    "version_info": "aoc.versions",
+    # watchers
+    "Snapshot": "aoc.watchers",
+    "Watcher": "aoc.watchers",
+    "unload_modules": "aoc.watchers",
+}
+"""The names that are imported lazily, mapped to their modules.
+
+These modules import heavy dependencies, either third-party (`pendulum`, `aiohttp`
+and `versions`) or standard (for instance, `asyncio`, `multiprocessing`, `sqlite3`,
+`cProfile` and `tracemalloc`), so they are only imported when the names are actually accessed.
+"""
+
+NO_ATTRIBUTE = "module `{}` has no attribute `{}`"
+no_attribute = NO_ATTRIBUTE.format
+
+
+def __getattr__(name: str) -> Any:
+    module_name = LAZY.get(name)
+
+    if module_name is None:
+        raise AttributeError(no_attribute(__name__, name))
+
+    return getattr(import_module(module_name), name)
@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+from math import erfc, sqrt
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple, TypeVar, final
+
+from attrs import Attribute, field, frozen
+
+from aoc.constants import (
+    DEFAULT_LIMIT,
+    DEFAULT_ROUNDING,
+    DEFAULT_ROUNDS,
+    DEFAULT_WARMUP,
+    MINIMUM_ROUNDS,
+)
+from aoc.timers import Elapsed, Measure, now
+
+__all__ = ("Statistics", "sample", "mann_whitney")
+
+R = TypeVar("R")
+
+EXPECTED_SAMPLES = "expected at least one sample"
+
+EXPECTED_PERCENT = "expected `0 <= percent <= 100`"
+
+HUNDRED = 100.0
+
+MEDIAN = 50.0
+
+SECOND = 1_000_000_000
+
+
+def sort_samples(samples: Iterable[int]) -> List[int]:
+    return sorted(samples)
+
+
+@final
+@frozen()
+class Statistics:
+    """Represents statistics over the time samples, in nanoseconds."""
+
+    samples: List[int] = field(converter=sort_samples)
+    """The time samples, in nanoseconds (sorted)."""
+
+    rounding: int = field(default=DEFAULT_ROUNDING)
+    """The rounding to use when converting to human-readable format."""
+
+    @samples.validator
+    def check_samples(self, attribute: Attribute[List[int]], samples: List[int]) -> None:
+        if not samples:
+            raise ValueError(EXPECTED_SAMPLES)
+
+    @classmethod
+    def from_elapsed(
+        cls,
+        elapsed: Iterable[Elapsed],
+        rounding: int = DEFAULT_ROUNDING,
+        measure: Measure = Measure.WALL,
+    ) -> Statistics:
+        """Creates statistics from the elapsed times.
+
+        Arguments:
+            elapsed: The elapsed times to use.
+            rounding: The rounding to use when converting to human-readable format.
+            measure: The measure of time to use.
+
+        Returns:
+            The statistics created.
+
+        Raises:
+            ValueError: The times were not measured according to the `measure`.
+        """
+        return cls([item.get_nanoseconds(measure) for item in elapsed], rounding)
+
+    @property
+    def count(self) -> int:
+        """The number of samples."""
+        return len(self.samples)
+
+    @property
+    def minimum(self) -> Elapsed:
+        """The minimum time."""
+        return self.create_elapsed(self.samples[0])
+
+    @property
+    def maximum(self) -> Elapsed:
+        """The maximum time."""
+        return self.create_elapsed(self.samples[-1])
+
+    @property
+    def median(self) -> Elapsed:
+        """The median time."""
+        return self.percentile(MEDIAN)
+
+    @property
+    def mean(self) -> Elapsed:
+        """The mean time."""
+        return self.create_elapsed(self.mean_value)
+
+    @property
+    def deviation(self) -> Elapsed:
+        """The sample standard deviation of the time."""
+        return self.create_elapsed(self.deviation_value)
+
+    @property
+    def mean_value(self) -> float:
+        """The mean time, in nanoseconds."""
+        samples = self.samples
+
+        return sum(samples) / len(samples)
+
+    @property
+    def deviation_value(self) -> float:
+        """The sample standard deviation of the time, in nanoseconds."""
+        samples = self.samples
+
+        count = len(samples)
+
+        if count < MINIMUM_ROUNDS:
+            return 0.0
+
+        mean = self.mean_value
+
+        return sqrt(sum((sample - mean) ** 2 for sample in samples) / (count - 1))
+
+    @property
+    def relative_error(self) -> float:
+        """The relative standard error of the mean time.
+
+        This is `0.0` in case the mean time is zero.
+        """
+        mean = self.mean_value
+
+        if not mean:
+            return 0.0
+
+        return self.deviation_value / sqrt(self.count) / mean
+
+    def percentile(self, percent: float) -> Elapsed:
+        """Computes the `percent` percentile of the time, interpolating linearly.
+
+        Arguments:
+            percent: The percentile to compute, in `[0, 100]` range.
+
+        Returns:
+            The percentile of the time.
+
+        Raises:
+            ValueError: The `percent` is out of range.
+        """
+        if not 0.0 <= percent <= HUNDRED:
+            raise ValueError(EXPECTED_PERCENT)
+
+        samples = self.samples
+
+        position = (len(samples) - 1) * percent / HUNDRED
+
+        lower = int(position)
+        upper = min(lower + 1, len(samples) - 1)
+
+        fraction = position - lower
+
+        return self.create_elapsed(samples[lower] + (samples[upper] - samples[lower]) * fraction)
+
+    def create_elapsed(self, nanoseconds: float) -> Elapsed:
+        """Creates elapsed time from the given `nanoseconds`, using the rounding of `self`."""
+        return Elapsed(round(nanoseconds), self.rounding)
+
+
+def sample(
+    execute: Callable[[], R],
+    phases: Callable[[R], Sequence[Elapsed]],
+    rounds: int = DEFAULT_ROUNDS,
+    warmup: int = DEFAULT_WARMUP,
+    relative_error: Optional[float] = None,
+    budget: Optional[float] = None,
+    limit: int = DEFAULT_LIMIT,
+    measure: Measure = Measure.WALL,
+) -> List[R]:
+    """Repeatedly calls `execute`, collecting its results.
+
+    Firstly, `execute` is called `warmup` times, discarding the results.
+
+    If neither `relative_error` nor `budget` is given, `execute` is then called exactly
+    `rounds` times. Otherwise, sampling is adaptive: at least `rounds` results are collected,
+    and sampling continues until the relative standard error of every phase (as returned by
+    `phases`) reaches `relative_error`, the time `budget` is exhausted or `limit` results
+    are collected, whichever comes first.
+
+    The relative standard error is computed according to the `measure`, while the `budget`
+    is always wall-clock time.
+
+    Arguments:
+        execute: The function to call.
+        phases: The function returning the elapsed times of the phases of the result.
+        rounds: The (minimum) amount of rounds.
+        warmup: The amount of warmup rounds.
+        relative_error: The target relative standard error of the mean.
+        budget: The time budget, in seconds.
+        limit: The maximum amount of rounds, in adaptive mode.
+        measure: The measure of time to use.
+
+    Returns:
+        The results collected.
+    """
+    for _ in range(warmup):
+        execute()
+
+    timer = now()
+
+    results = [execute() for _ in range(rounds)]
+
+    if relative_error is None and budget is None:
+        return results
+
+    budget_nanoseconds = None if budget is None else round(budget * SECOND)
+
+    while len(results) < limit:
+        if budget_nanoseconds is not None and timer.elapsed().nanoseconds >= budget_nanoseconds:
+            break
+
+        if relative_error is not None and len(results) >= MINIMUM_ROUNDS:
+            statistics = (
+                Statistics.from_elapsed(elapsed, measure=measure)
+                for elapsed in zip(*map(phases, results))
+            )
+
+            if all(item.relative_error <= relative_error for item in statistics):
+                break
+
+        results.append(execute())
+
+    return results
+
+
+def rank(values: Sequence[int]) -> Tuple[List[float], int]:
+    order = sorted(range(len(values)), key=values.__getitem__)
+
+    ranks = [0.0] * len(values)
+
+    ties = 0
+
+    start = 0
+
+    while start < len(order):
+        end = start
+
+        while end + 1 < len(order) and values[order[end + 1]] == values[order[start]]:
+            end += 1
+
+        average = (start + end) / 2 + 1  # ranks start from one
+
+        for index in order[start : end + 1]:
+            ranks[index] = average
+
+        size = end - start + 1
+
+        ties += size * size * size - size
+
+        start = end + 1
+
+    return (ranks, ties)
+
+
+def mann_whitney(baseline: Sequence[int], current: Sequence[int]) -> float:
+    """Tests whether the `current` samples tend to be greater than the `baseline` ones,
+    using the one-sided Mann-Whitney U test.
+
+    The normal approximation (with tie and continuity corrections) is used,
+    which is reasonable for `8` or more samples in each group.
+
+    Arguments:
+        baseline: The baseline samples.
+        current: The current samples.
+
+    Returns:
+        The p-value of the test (`1.0` if there is nothing to compare).
+    """
+    baseline_count = len(baseline)
+    current_count = len(current)
+
+    count = baseline_count + current_count
+
+    if not baseline_count or not current_count:
+        return 1.0
+
+    ranks, ties = rank([*baseline, *current])
+
+    current_rank = sum(ranks[baseline_count:])
+
+    statistic = current_rank - current_count * (current_count + 1) / 2
+
+    product = baseline_count * current_count
+
+    variance = product / 12 * ((count + 1) - ties / (count * (count - 1)))
+
+    if variance <= 0.0:  # every sample is the same
+        return 1.0
+
+    z = (statistic - product / 2 - 0.5) / sqrt(variance)
+
+    return erfc(z / sqrt(2)) / 2
@@ -0,0 +1,162 @@
+from hashlib import sha256
+from pathlib import Path
+from pickle import HIGHEST_PROTOCOL, dumps, loads
+from typing import Dict, Optional, final
+
+from attrs import evolve, field, frozen
+
+from aoc import __version__
+from aoc.constants import DATA_PATH, DEFAULT_CACHE_LIMIT, DEFAULT_ENCODING, RESULTS_PATH
+from aoc.data import get_path_for_key
+from aoc.modules import hash_module
+from aoc.primitives import Key
+from aoc.runners import Results
+from aoc.stores import Store
+
+__all__ = ("Entry", "ResultCache", "hash_data")
+
+SUFFIX = ".pickle"
+
+FORMAT = "5"  # bump whenever the pickled results change shape, invalidating old entries
+
+
+def hash_data(key: Key, data_path: Path = DATA_PATH) -> Optional[str]:
+    """Hashes the data for the given `key`.
+
+    Arguments:
+        key: The key to hash the data for.
+        data_path: The path to the data directory.
+
+    Returns:
+        The hex digest of the hash, or [`None`][None] if the data could not be read.
+    """
+    try:
+        return sha256(get_path_for_key(key, data_path).read_bytes()).hexdigest()
+
+    except OSError:
+        return None
+
+
+@final
+@frozen()
+class Entry:
+    """Represents result cache entries."""
+
+    hashes: Dict[Key, Optional[str]]
+    """The hashes of the data the results were computed for."""
+
+    results: Results
+    """The results cached."""
+
+
+@final
+@frozen()
+class ResultCache:
+    """Represents content-addressed caches of results of running modules.
+
+    Results are looked up by the hash of the module source (including its local modules,
+    see [`hash_module`][aoc.modules.hash_module]), the data path and the version of the library,
+    and are only returned if the data for every problem is unchanged.
+
+    The total size of the cache is bounded by [`limit`][aoc.caches.ResultCache.limit];
+    least recently used entries are evicted first.
+    """
+
+    path: Path = field(default=RESULTS_PATH)
+    """The path to the cache directory."""
+
+    limit: int = field(default=DEFAULT_CACHE_LIMIT)
+    """The maximum size of the cache, in bytes."""
+
+    refresh: bool = field(default=False)
+    """Whether to ignore cached results (new results are cached regardless)."""
+
+    @property
+    def store(self) -> Store:
+        """The store of entries."""
+        return Store(self.path, SUFFIX, self.limit)
+
+    def get_digest(self, path: Path, data_path: Path) -> str:
+        """Returns the digest of the entry for the module at `path`.
+
+        Arguments:
+            path: The path to the module.
+            data_path: The path to the data directory.
+
+        Returns:
+            The hex digest of the entry.
+
+        Raises:
+            OSError: The module could not be read.
+        """
+        hasher = sha256(hash_module(path).encode(DEFAULT_ENCODING))
+
+        hasher.update(str(data_path.resolve()).encode(DEFAULT_ENCODING))
+        hasher.update(FORMAT.encode(DEFAULT_ENCODING))
+        hasher.update(__version__.encode(DEFAULT_ENCODING))
+
+        return hasher.hexdigest()
+
+    def load(self, path: Path, data_path: Path = DATA_PATH) -> Optional[Results]:
+        """Loads the cached results of running the module at `path`.
+
+        Arguments:
+            path: The path to the module.
+            data_path: The path to the data directory.
+
+        Returns:
+            The results cached (marked as such), or [`None`][None] if there are none,
+            they are stale or [`refresh`][aoc.caches.ResultCache.refresh] is set.
+        """
+        if self.refresh:
+            return None
+
+        try:
+            content = self.store.read(self.get_digest(path, data_path))
+
+            if content is None:
+                return None
+
+            entry = loads(content)
+
+        except Exception:  # missing or corrupted entries are misses
+            return None
+
+        if not isinstance(entry, Entry):
+            return None
+
+        for key, hash in entry.hashes.items():
+            if hash is None or hash_data(key, data_path) != hash:
+                return None
+
+        return evolve(entry.results, cached=True)
+
+    def dump(self, path: Path, results: Results, data_path: Path = DATA_PATH) -> None:
+        """Dumps the `results` of running the module at `path` to the cache.
+
+        Results containing failures are not cached. Results that can not be pickled are
+        silently skipped.
+
+        Arguments:
+            path: The path to the module.
+            results: The results to dump.
+            data_path: The path to the data directory.
+        """
+        if results.failures:
+            return
+
+        keys = [*results.results, *results.final_results]
+
+        hashes = {key: hash_data(key, data_path) for key in keys}
+
+        try:
+            content = dumps(Entry(hashes, evolve(results, cached=False)), HIGHEST_PROTOCOL)
+
+            self.store.write(self.get_digest(path, data_path), content)
+
+        except Exception:  # results that can not be pickled (or written) are skipped
+            pass
+
+    def evict(self) -> None:
+        """Evicts the least recently used entries until the cache fits the limit."""
+        self.store.evict()
@@ -1,7 +1,8 @@
 from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Any, Literal
 
-from yarl import URL
+if TYPE_CHECKING:
+    from yarl import URL
 
 __all__ = (
     # paths
@@ -9,6 +10,11 @@ __all__ = (
     "HOME",
     "TOKEN_PATH",
     "DATA_PATH",
+    "RESULTS_PATH",
+    "INPUTS_PATH",
+    "HISTORY_PATH",
+    "INDEX_PATH",
+    "SUBMISSIONS_PATH",
     # bounds
     "FIRST_YEAR",
     "FIRST_DAY",
@@ -18,6 +24,22 @@ __all__ = (
     "NEW_LINE",
     # timers
     "DEFAULT_ROUNDING",
+    "DEFAULT_CALIBRATION_ROUNDS",
+    # benchmarks
+    "DEFAULT_ROUNDS",
+    "DEFAULT_WARMUP",
+    "DEFAULT_LIMIT",
+    "MINIMUM_ROUNDS",
+    # histories
+    "DEFAULT_SIGNIFICANCE",
+    "DEFAULT_THRESHOLD",
+    # caches
+    "DEFAULT_CACHE_LIMIT",
+    "DEFAULT_INPUT_CACHE_LIMIT",
+    # watchers
+    "DEFAULT_INTERVAL",
+    # profiles
+    "DEFAULT_TOP",
     # name and python
     "NAME",
     "PYTHON",
@@ -33,6 +55,16 @@ __all__ = (
     "TRACE",
     # HTTP client
     "DEFAULT_RETRIES",
+    "DEFAULT_CONNECTION_LIMIT",
+    "DEFAULT_DOWNLOAD_CONCURRENCY",
+    "DEFAULT_DOWNLOAD_RATE",
+    "DEFAULT_DOWNLOAD_BURST",
+    "DEFAULT_BACKOFF",
+    "DEFAULT_BACKOFF_FACTOR",
+    "DEFAULT_BACKOFF_MAXIMUM",
+    "DEFAULT_JITTER",
+    "DEFAULT_DEADLINE",
+    "DEFAULT_SUBMISSION_WAIT",
     "BASE_URL",
     "TOKEN_COOKIE_NAME",
     # payloads
@@ -71,6 +103,36 @@ DATA_NAME = "data"
 DATA_PATH = HOME / CACHE_NAME / AOC_NAME / DATA_NAME
 """The path to the data directory."""
 
+RESULTS_NAME = "results"
+"""The name of the results directory."""
+
+RESULTS_PATH = HOME / CACHE_NAME / AOC_NAME / RESULTS_NAME
+"""The path to the results directory."""
+
+INPUTS_NAME = "inputs"
+"""The name of the parsed inputs directory."""
+
+INPUTS_PATH = HOME / CACHE_NAME / AOC_NAME / INPUTS_NAME
+"""The path to the parsed inputs directory."""
+
+HISTORY_NAME = "history.sqlite"
+"""The name of the benchmark history database."""
+
+HISTORY_PATH = HOME / CACHE_NAME / AOC_NAME / HISTORY_NAME
+"""The path to the benchmark history database."""
+
+INDEX_NAME = "index.json"
+"""The name of the solution index file."""
+
+INDEX_PATH = HOME / CACHE_NAME / AOC_NAME / INDEX_NAME
+"""The path to the solution index file."""
+
+SUBMISSIONS_NAME = "submissions.json"
+"""The name of the pending submission queue file."""
+
+SUBMISSIONS_PATH = HOME / CACHE_NAME / AOC_NAME / SUBMISSIONS_NAME
+"""The path to the pending submission queue file."""
+
 # bounds
 
 FIRST_YEAR: Literal[2015] = 2015
@@ -94,6 +156,51 @@ NEW_LINE = "\n"
 DEFAULT_ROUNDING = 5
 """The default rounding for timers."""
 
+# timers
+
+DEFAULT_CALIBRATION_ROUNDS = 1000
+"""The default amount of rounds to calibrate timing overhead for."""
+
+# benchmarks
+
+DEFAULT_ROUNDS = 10
+"""The default amount of rounds to benchmark for."""
+
+DEFAULT_WARMUP = 1
+"""The default amount of warmup rounds to run before benchmarking."""
+
+DEFAULT_LIMIT = 1000
+"""The default maximum amount of rounds to benchmark for in adaptive mode."""
+
+MINIMUM_ROUNDS = 2
+"""The minimum amount of rounds needed to estimate the deviation."""
+
+# histories
+
+DEFAULT_SIGNIFICANCE = 0.01
+"""The default significance level for detecting regressions."""
+
+DEFAULT_THRESHOLD = 0.05
+"""The default minimum relative slowdown of the median considered a regression."""
+
+# caches
+
+DEFAULT_CACHE_LIMIT = 64 * 1024 * 1024
+"""The default maximum size of result caches, in bytes (64 MiB)."""
+
+DEFAULT_INPUT_CACHE_LIMIT = 1024 * 1024 * 1024
+"""The default maximum size of input caches, in bytes (1 GiB)."""
+
+# watchers
+
+DEFAULT_INTERVAL = 0.25
+"""The default polling interval of watchers, in seconds."""
+
+# profiles
+
+DEFAULT_TOP = 10
+"""The default amount of hot functions to show from profiles."""
+
 # names
 
 NAME = "aoc-core"
@@ -136,12 +243,51 @@ TRACE = "TRACE"
 TOKEN_COOKIE_NAME = "session"
 """The cookie name to send the token in."""
 
-BASE_URL = URL("https://adventofcode.com/")
-"""The Advent of Code base URL."""
+BASE_URL_STRING = "https://adventofcode.com/"
+"""The Advent of Code base URL, as the string."""
+
+if TYPE_CHECKING:
+    BASE_URL: URL
+    """The Advent of Code base URL.
+
+    This is created lazily, so that `yarl` is only imported when needed.
+    """
 
 DEFAULT_RETRIES = 3
 """The default amount of retries to use."""
 
+DEFAULT_CONNECTION_LIMIT = 10
+"""The default maximum amount of simultaneous connections of HTTP clients."""
+
+DEFAULT_DOWNLOAD_CONCURRENCY = 4
+"""The default maximum amount of simultaneous downloads."""
+
+DEFAULT_DOWNLOAD_RATE = 2.0
+"""The default maximum average rate of downloads, per second."""
+
+DEFAULT_DOWNLOAD_BURST = 4
+"""The default maximum amount of downloads started at once, before rate limiting kicks in."""
+
+DEFAULT_BACKOFF = 0.5
+"""The default delay before the first retry, in seconds."""
+
+DEFAULT_BACKOFF_FACTOR = 2.0
+"""The default factor to multiply the delay by on each retry."""
+
+DEFAULT_BACKOFF_MAXIMUM = 30.0
+"""The default maximum delay between retries, in seconds."""
+
+DEFAULT_JITTER = 0.5
+"""The default fraction of delays between retries that is randomized."""
+
+DEFAULT_DEADLINE = 60.0
+"""The default maximum total time spent on the request (including retries), in seconds."""
+
+DEFAULT_SUBMISSION_WAIT = 60.0
+"""The default time to wait before resubmitting answers, in seconds
+(used when the server does not say how long to wait).
+"""
+
 # payloads
 
 PART = "level"
@@ -157,3 +303,17 @@ DEFAULT_ENCODING = "utf-8"
 
 DEFAULT_ERRORS = "strict"
 """The default error handling of the encoding to use."""
+
+BASE_URL_NAME = "BASE_URL"
+
+NO_ATTRIBUTE = "module `{}` has no attribute `{}`"
+no_attribute = NO_ATTRIBUTE.format
+
+
+def __getattr__(name: str) -> Any:
+    if name == BASE_URL_NAME:
+        from yarl import URL
+
+        return URL(BASE_URL_STRING)
+
+    raise AttributeError(no_attribute(__name__, name))
@@ -1,10 +1,27 @@
+from io import SEEK_END
+from mmap import ACCESS_READ, mmap
 from pathlib import Path
+from typing import Iterable, Iterator, TextIO, Union
 
-from aoc.constants import DATA_PATH, DEFAULT_ENCODING, DEFAULT_ERRORS
+from aoc.constants import DATA_PATH, DEFAULT_ENCODING, DEFAULT_ERRORS, NEW_LINE
 from aoc.errors import DataNotFound
 from aoc.primitives import Key
 
-__all__ = ("get_path_for_key", "load_data", "dump_data")
+__all__ = (
+    "Buffer",
+    "get_path_for_key",
+    "load_data",
+    "load_data_bytes",
+    "map_data",
+    "open_data",
+    "iter_lines",
+    "dump_data",
+)
+
+Buffer = Union[bytes, mmap]
+"""Represents raw data, either read or mapped into memory."""
+
+READ_BINARY = "rb"
 
 
 def get_path_for_key(key: Key, data_path: Path = DATA_PATH) -> Path:
@@ -47,6 +64,95 @@ def load_data(
         raise DataNotFound(key, data_path) from origin
 
 
+def load_data_bytes(key: Key, data_path: Path = DATA_PATH) -> bytes:
+    """Loads the raw data for the given `key`, without decoding it.
+
+    Arguments:
+        key: The key to load the data for.
+        data_path: The path to the data directory.
+
+    Returns:
+        The raw data for the given `key`.
+
+    Raises:
+        DataNotFound: [`OSError`][OSError] occured.
+    """
+    try:
+        return get_path_for_key(key, data_path).read_bytes()
+
+    except OSError as origin:
+        raise DataNotFound(key, data_path) from origin
+
+
+def map_data(key: Key, data_path: Path = DATA_PATH) -> Buffer:
+    """Maps the raw data for the given `key` into memory, read-only, without copying it.
+
+    The mapping is closed once it is no longer referenced (or explicitly, via `close`).
+    Empty data can not be mapped, so empty [`bytes`][bytes] are returned instead.
+
+    Arguments:
+        key: The key to map the data for.
+        data_path: The path to the data directory.
+
+    Returns:
+        The read-only memory map of the data (or empty bytes).
+
+    Raises:
+        DataNotFound: [`OSError`][OSError] occured.
+    """
+    try:
+        with get_path_for_key(key, data_path).open(READ_BINARY) as file:
+            if not file.seek(0, SEEK_END):
+                return bytes()
+
+            return mmap(file.fileno(), 0, access=ACCESS_READ)  # the map outlives the file
+
+    except OSError as origin:
+        raise DataNotFound(key, data_path) from origin
+
+
+def open_data(
+    key: Key,
+    data_path: Path = DATA_PATH,
+    encoding: str = DEFAULT_ENCODING,
+    errors: str = DEFAULT_ERRORS,
+) -> TextIO:
+    """Opens the data for the given `key` for reading incrementally.
+
+    The file returned should be closed, preferably using the `with` statement.
+
+    Arguments:
+        key: The key to open the data for.
+        data_path: The path to the data directory.
+        encoding: The encoding to use.
+        errors: The error handling of the encoding to use.
+
+    Returns:
+        The file opened.
+
+    Raises:
+        DataNotFound: [`OSError`][OSError] occured.
+    """
+    try:
+        return get_path_for_key(key, data_path).open(encoding=encoding, errors=errors)
+
+    except OSError as origin:
+        raise DataNotFound(key, data_path) from origin
+
+
+def iter_lines(file: Iterable[str]) -> Iterator[str]:
+    """Iterates over the lines of the `file`, without the trailing new lines.
+
+    Arguments:
+        file: The file to iterate over.
+
+    Returns:
+        The iterator over the lines.
+    """
+    for line in file:
+        yield line[:-1] if line.endswith(NEW_LINE) else line
+
+
 def dump_data(
     data: str,
     key: Key,
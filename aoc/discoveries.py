@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+from ast import ClassDef, parse
+from json import dumps, loads
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, final
+
+from attrs import define, field
+
+from aoc.constants import DEFAULT_ENCODING, INDEX_PATH
+from aoc.names import get_key_by_name
+from aoc.primitives import Day, Key, Year
+from aoc.stores import write_atomic
+
+__all__ = ("Index", "find_keys", "discover")
+
+PYTHON_GLOB = "*.py"
+
+DOT = "."
+PYCACHE = "__pycache__"
+
+
+Stamp = Tuple[int, int]
+"""Represents modification times (in nanoseconds) and sizes of files."""
+
+
+def find_keys(source: str) -> List[Key]:
+    """Finds the keys of solutions defined in the `source`.
+
+    Solutions are recognized by the names of the top-level classes (`YearYYYYDayDD`),
+    so that the `source` does not need to be executed.
+
+    Arguments:
+        source: The source code to search.
+
+    Returns:
+        The keys found, in order of definition (without duplicates).
+
+    Raises:
+        SyntaxError: The `source` is not valid Python code.
+    """
+    keys: List[Key] = []
+
+    for node in parse(source).body:
+        if not isinstance(node, ClassDef):
+            continue
+
+        try:
+            key = get_key_by_name(node.name)
+
+        except TypeError:
+            continue
+
+        if key not in keys:
+            keys.append(key)
+
+    return keys
+
+
+def get_stamp(path: Path) -> Optional[Stamp]:
+    try:
+        status = path.stat()
+
+    except OSError:
+        return None
+
+    return (status.st_mtime_ns, status.st_size)
+
+
+def dump_key(key: Key) -> List[int]:
+    return [key.year.value, key.day.value]
+
+
+def load_key(values: List[int]) -> Key:
+    year, day = values
+
+    return Key(Year(year), Day(day))
+
+
+def get_sort_key(key: Key) -> Tuple[int, int]:
+    return (key.year.value, key.day.value)
+
+
+@final
+@define()
+class Index:
+    """Represents indexes of solutions defined in modules, stored in JSON files.
+
+    Modules are parsed (see [`find_keys`][aoc.discoveries.find_keys]) only when their
+    modification times or sizes change, so that rediscovering solutions is cheap.
+    """
+
+    path: Optional[Path] = field(default=INDEX_PATH)
+    """The path to the index file ([`None`][None] to keep the index in memory only)."""
+
+    entries: Dict[str, Tuple[Stamp, List[Key]]] = field(factory=dict, init=False)
+    """The stamps of modules indexed and the keys of solutions defined in them, by paths."""
+
+    changed: bool = field(default=False, init=False)
+    """Whether the index changed since it was loaded."""
+
+    def __attrs_post_init__(self) -> None:
+        self.load()
+
+    def load(self) -> None:
+        """Loads the index from the [`path`][aoc.discoveries.Index.path], if possible.
+
+        Missing or corrupted index files are treated as empty.
+        """
+        path = self.path
+
+        if path is None:
+            return
+
+        try:
+            content = loads(path.read_text(DEFAULT_ENCODING))
+
+            entries = {
+                name: ((modified, size), [load_key(values) for values in keys])
+                for name, ((modified, size), keys) in content.items()
+            }
+
+        except Exception:  # missing or corrupted index files are empty
+            return
+
+        self.entries = entries
+
+    def dump(self) -> None:
+        """Dumps the index to the [`path`][aoc.discoveries.Index.path] if it changed.
+
+        The index is written atomically; errors are ignored, as the index can always be rebuilt.
+        """
+        path = self.path
+
+        if path is None or not self.changed:
+            return
+
+        content = {
+            name: (stamp, [dump_key(key) for key in keys])
+            for name, (stamp, keys) in self.entries.items()
+        }
+
+        try:
+            write_atomic(path, dumps(content).encode(DEFAULT_ENCODING))
+
+        except OSError:
+            return
+
+        self.changed = False
+
+    def get_keys(self, path: Path) -> List[Key]:
+        """Returns the keys of solutions defined in the module at `path`.
+
+        Arguments:
+            path: The path to the module.
+
+        Returns:
+            The keys found (empty if the module can not be read or parsed).
+        """
+        stamp = get_stamp(path)
+
+        if stamp is None:
+            return []
+
+        name = str(path.resolve())
+
+        entry = self.entries.get(name)
+
+        if entry is not None:
+            entry_stamp, keys = entry
+
+            if tuple(entry_stamp) == stamp:
+                return keys
+
+        try:
+            keys = find_keys(path.read_text(DEFAULT_ENCODING))
+
+        except (OSError, SyntaxError, ValueError):
+            keys = []
+
+        self.entries[name] = (stamp, keys)
+        self.changed = True
+
+        return keys
+
+
+def iter_modules(directory: Path) -> Iterator[Path]:
+    for path in sorted(directory.rglob(PYTHON_GLOB)):
+        parts = path.relative_to(directory).parts
+
+        if any(part.startswith(DOT) or part == PYCACHE for part in parts):
+            continue
+
+        if path.is_file():
+            yield path
+
+
+def discover(
+    roots: Iterable[Path], year: Optional[Year] = None, index: Optional[Index] = None
+) -> List[Path]:
+    """Discovers modules defining solutions in the `roots`.
+
+    Directories are searched recursively (skipping hidden ones and `__pycache__`),
+    while files are always included as-is.
+
+    The `year` only filters modules found in directories, keeping the ones defining
+    at least one solution for it; files are included regardless of it, and modules
+    are not split, so running them runs the solutions for other years as well.
+
+    Discovered modules are ordered by the first key of solutions defined in them,
+    and then by paths.
+
+    Arguments:
+        roots: The paths to the directories (or modules) to search.
+        year: The year to discover solutions for in directories, if any.
+        index: The index to use (defaults to the in-memory one). It is dumped afterwards.
+
+    Returns:
+        The paths to the modules discovered, without duplicates.
+    """
+    if index is None:
+        index = Index(None)
+
+    paths: List[Path] = []
+    found: List[Tuple[Tuple[int, int], Path]] = []
+
+    seen = set()
+
+    for root in roots:
+        if not root.is_dir():
+            if root not in seen:
+                seen.add(root)
+                paths.append(root)
+
+            continue
+
+        for path in iter_modules(root):
+            if path in seen:
+                continue
+
+            keys = index.get_keys(path)
+
+            if year is not None:
+                keys = [key for key in keys if key.year == year]
+
+            if not keys:
+                continue
+
+            seen.add(path)
+
+            found.append((min(map(get_sort_key, keys)), path))
+
+    index.dump()
+
+    found.sort()
+
+    paths.extend(path for _, path in found)
+
+    return paths
@@ -0,0 +1,339 @@
+from __future__ import annotations
+
+from pathlib import Path
+from queue import Queue
+from threading import Thread
+from time import monotonic
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    final,
+)
+
+from attrs import Attribute, define, field, frozen
+
+from aoc.constants import (
+    DATA_PATH,
+    DEFAULT_DOWNLOAD_BURST,
+    DEFAULT_DOWNLOAD_CONCURRENCY,
+    DEFAULT_DOWNLOAD_RATE,
+)
+from aoc.data import get_path_for_key
+from aoc.discoveries import Index
+from aoc.primitives import Key
+from aoc.sources import DataSource
+
+if TYPE_CHECKING:
+    from aoc.http import HTTPClient
+
+__all__ = ("TokenBucket", "Downloader", "find_missing")
+
+Done = Tuple[Key, Optional[Exception]]
+
+
+@final
+@frozen()
+class Finished:
+    error: Optional[BaseException] = None
+
+
+Message = Union[Done, Finished]
+
+EXPECTED_RATE = "expected `rate > 0`"
+EXPECTED_CAPACITY = "expected `capacity >= 1`"
+EXPECTED_CONCURRENCY = "expected `concurrency >= 1`"
+
+
+def find_missing(keys: Iterable[Key], data_path: Path = DATA_PATH) -> List[Key]:
+    """Finds the keys for which the data is missing.
+
+    Arguments:
+        keys: The keys to check.
+        data_path: The path to the data directory.
+
+    Returns:
+        The keys for which the data is missing, in order.
+    """
+    return [key for key in keys if not get_path_for_key(key, data_path).is_file()]
+
+
+@final
+@define()
+class TokenBucket:
+    """Represents token buckets, limiting rates of events.
+
+    The bucket holds up to [`capacity`][aoc.downloads.TokenBucket.capacity] tokens,
+    refilled at [`rate`][aoc.downloads.TokenBucket.rate] tokens per second.
+    Each event takes one token, waiting for it to be refilled if the bucket is empty,
+    so that bursts of up to `capacity` events are allowed, while the average rate is bounded.
+    """
+
+    rate: float = field(default=DEFAULT_DOWNLOAD_RATE)
+    """The rate of refilling, in tokens per second."""
+
+    capacity: int = field(default=DEFAULT_DOWNLOAD_BURST)
+    """The maximum amount of tokens."""
+
+    tokens: float = field(default=0.0, init=False)
+    """The amount of tokens (negative if tokens are owed to waiting events)."""
+
+    updated: float = field(factory=monotonic, init=False)
+    """The time of the last update, in seconds (see [`monotonic`][time.monotonic])."""
+
+    @rate.validator
+    def check_rate(self, attribute: Attribute[float], rate: float) -> None:
+        if rate <= 0.0:
+            raise ValueError(EXPECTED_RATE)
+
+    @capacity.validator
+    def check_capacity(self, attribute: Attribute[int], capacity: int) -> None:
+        if capacity < 1:
+            raise ValueError(EXPECTED_CAPACITY)
+
+    def __attrs_post_init__(self) -> None:
+        self.tokens = float(self.capacity)
+
+    def reserve(self) -> float:
+        """Takes the token, without waiting for it.
+
+        Returns:
+            The delay until the token is available, in seconds (`0` if it is available now).
+        """
+        now = monotonic()
+
+        tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate) - 1.0
+
+        self.tokens = tokens
+        self.updated = now
+
+        return 0.0 if tokens >= 0.0 else -tokens / self.rate
+
+    async def acquire(self) -> None:
+        """Takes the token, waiting until it is available."""
+        delay = self.reserve()
+
+        if delay:
+            from asyncio import sleep
+
+            await sleep(delay)
+
+
+def create_index() -> Index:
+    return Index(None)
+
+
+@final
+@define()
+class Downloader:
+    """Represents downloaders of missing data, pipelined with running solutions.
+
+    The keys of solutions defined in modules are found using the
+    [`index`][aoc.downloads.Downloader.index]. Missing data is downloaded concurrently,
+    in the single event loop running in the background thread, while modules for which
+    the data is present are handed out right away.
+    """
+
+    client: HTTPClient = field()
+    """The client to download the data with."""
+
+    data_path: Path = field(default=DATA_PATH)
+    """The path to the data directory."""
+
+    index: Index = field(factory=create_index)
+    """The index to find keys of solutions with."""
+
+    concurrency: int = field(default=DEFAULT_DOWNLOAD_CONCURRENCY, kw_only=True)
+    """The maximum amount of simultaneous downloads."""
+
+    bucket: Optional[TokenBucket] = field(default=None, kw_only=True)
+    """The token bucket to limit the rate of downloads with, if any."""
+
+    failures: Dict[Key, Exception] = field(factory=dict, init=False)
+    """The errors that occured while downloading, by keys."""
+
+    unchanged: Set[Key] = field(factory=set, init=False)
+    """The keys for which the data was revalidated and found to be up to date."""
+
+    @concurrency.validator
+    def check_concurrency(self, attribute: Attribute[int], concurrency: int) -> None:
+        if concurrency < 1:
+            raise ValueError(EXPECTED_CONCURRENCY)
+
+    async def download(self, key: Key) -> None:
+        """Downloads and dumps the data for the given `key`.
+
+        If the data is present, it is only downloaded again if it changed
+        (see [`DataSource.refresh`][aoc.sources.DataSource.refresh]).
+
+        Arguments:
+            key: The key to download the data for.
+
+        Raises:
+            ClientError: All request attempts failed.
+            OSError: The data could not be dumped.
+        """
+        fetched = await DataSource(self.client, self.data_path).refresh(key)
+
+        if not fetched.modified:
+            self.unchanged.add(key)
+
+    async def download_each(self, keys: Iterable[Key], done: Callable[[Done], None]) -> None:
+        """Downloads and dumps the data for each of the `keys` concurrently.
+
+        At most [`concurrency`][aoc.downloads.Downloader.concurrency] downloads are run
+        at once, and they are started no faster than the
+        [`bucket`][aoc.downloads.Downloader.bucket] allows.
+
+        Arguments:
+            keys: The keys to download the data for.
+            done: The function to call with the key and the error (if any) as each download
+                completes, in order of completion.
+        """
+        from asyncio import Semaphore, gather
+
+        semaphore = Semaphore(self.concurrency)  # created here to be bound to the running loop
+
+        bucket = self.bucket
+
+        async def download_into(key: Key) -> None:
+            async with semaphore:
+                if bucket is not None:
+                    await bucket.acquire()
+
+                try:
+                    await self.download(key)
+
+                except Exception as error:
+                    done((key, error))
+
+                else:
+                    done((key, None))
+
+        async with self.client:  # connections are reused across downloads
+            await gather(*map(download_into, keys))
+
+    def download_in_background(self, keys: Iterable[Key], queue: Queue[Message]) -> None:
+        from asyncio import run
+
+        try:
+            run(self.download_each(keys, queue.put))
+
+        except BaseException as error:  # reported through the queue so the consumer never hangs
+            queue.put(Finished(error))
+
+        else:
+            queue.put(Finished())
+
+    async def download_missing(self, keys: Iterable[Key], force: bool = False) -> List[Key]:
+        """Downloads and dumps the data for the `keys` for which it is missing.
+
+        The errors are recorded in [`failures`][aoc.downloads.Downloader.failures].
+
+        Arguments:
+            keys: The keys to download the data for.
+            force: Whether to revalidate the data present as well, using conditional requests.
+
+        Returns:
+            The keys for which the data was downloaded, in order of completion.
+        """
+        missing = list(keys) if force else find_missing(keys, self.data_path)
+
+        downloaded: List[Key] = []
+
+        if not missing:
+            return downloaded
+
+        def done(item: Done) -> None:
+            key, error = item
+
+            if error is None:
+                if key not in self.unchanged:
+                    downloaded.append(key)
+
+            else:
+                self.failures[key] = error
+
+        await self.download_each(missing, done)
+
+        return downloaded
+
+    def iter_ready(self, paths: Iterable[Path]) -> Iterator[Path]:
+        """Yields the `paths` to modules as the data they need becomes available.
+
+        Modules for which the data is present (or the keys can not be found statically)
+        are yielded first, in order; the rest are yielded as their downloads complete.
+
+        Modules are yielded even if downloading fails, so that running them reports
+        the missing data; the errors are recorded in
+        [`failures`][aoc.downloads.Downloader.failures].
+
+        Errors that stop the downloads altogether (for instance, failing to set up the client)
+        are raised once they are reported by the background thread.
+
+        Arguments:
+            paths: The paths to the modules.
+
+        Returns:
+            The iterator over paths to the modules ready to run.
+
+        Raises:
+            BaseException: Any error that stopped the downloads.
+        """
+        index = self.index
+        data_path = self.data_path
+
+        ready: List[Path] = []
+        pending: Dict[Path, Set[Key]] = {}
+        missing: Dict[Key, None] = {}  # ordered set
+
+        for path in paths:
+            missing_keys = find_missing(index.get_keys(path), data_path)
+
+            if missing_keys:
+                pending[path] = set(missing_keys)
+                missing.update(dict.fromkeys(missing_keys))
+
+            else:
+                ready.append(path)
+
+        queue: Queue[Message] = Queue()
+
+        if missing:
+            thread = Thread(target=self.download_in_background, args=(missing, queue), daemon=True)
+            thread.start()
+
+        yield from ready
+
+        while pending:
+            message = queue.get()
+
+            if isinstance(message, Finished):
+                stopped = message.error
+
+                if stopped is not None:
+                    raise stopped
+
+                break  # the modules still pending (if any) are yielded below
+
+            key, error = message
+
+            if error is not None:
+                self.failures[key] = error
+
+            for path, keys in list(pending.items()):
+                keys.discard(key)
+
+                if not keys:
+                    del pending[path]
+
+                    yield path
+
+        yield from pending
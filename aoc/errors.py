@@ -1,4 +1,7 @@
 from pathlib import Path
+from typing import Tuple, Type
+
+from typing_extensions import Self
 
 from aoc.primitives import Key
 
@@ -22,6 +25,9 @@ class TokenNotFound(RuntimeError):
 
         self._path = path
 
+    def __reduce__(self) -> Tuple[Type[Self], Tuple[Path]]:
+        return (type(self), (self.path,))
+
     @property
     def path(self) -> Path:
         """The token path."""
@@ -41,6 +47,9 @@ class DataNotFound(RuntimeError):
         self._key = key
         self._path = path
 
+    def __reduce__(self) -> Tuple[Type[Self], Tuple[Key, Path]]:
+        return (type(self), (self.key, self.path))
+
     @property
     def key(self) -> Key:
         """The key of the problem."""
@@ -1,4 +1,6 @@
-from typing import List
+from operator import methodcaller
+from re import compile
+from typing import Iterator, List
 
 from typing_aliases import Parse
 
@@ -10,11 +12,25 @@ __all__ = (
     "split_lines",
     "split_double_lines",
     "split_whitespace",
+    "IterSplit",
+    "iter_split_at",
+    "iter_split_lines",
+    "iter_blocks",
+    "iter_fields",
 )
 
 Split = Parse[List[str]]
 """Represents split functions."""
 
+IterSplit = Parse[Iterator[str]]
+"""Represents lazy split functions."""
+
+EMPTY_SEPARATOR = "empty separator"
+
+FIELD = compile(r"\S+")
+
+get_group = methodcaller("group")
+
 
 def split_at(separator: str) -> Split:
     """Creates `split` functions that split the `string` by `separator`.
@@ -55,3 +71,63 @@ def split_whitespace(string: str) -> List[str]:
         The split result.
     """
     return string.split()
+
+
+def iter_split_at(separator: str) -> IterSplit:
+    """Creates lazy `split` functions that split the `string` by `separator`,
+    yielding the parts on demand.
+
+    The parts yielded are the same as the ones returned by
+    [`split_at`][aoc.ext.splits.split_at], but the list of them is never materialized.
+
+    Arguments:
+        separator: The separator to split the string by.
+
+    Returns:
+        The lazy `split` function created.
+
+    Raises:
+        ValueError: The `separator` is empty.
+    """
+    if not separator:
+        raise ValueError(EMPTY_SEPARATOR)
+
+    length = len(separator)
+
+    def split(string: str) -> Iterator[str]:
+        start = 0
+
+        while True:
+            end = string.find(separator, start)
+
+            if end < 0:
+                break
+
+            yield string[start:end]
+
+            start = end + length
+
+        yield string[start:]
+
+    return split
+
+
+iter_split_lines = iter_split_at(NEW_LINE)
+"""Lazily splits the `string` by [`NEW_LINE`][aoc.ext.constants.NEW_LINE]."""
+
+iter_blocks = iter_split_at(DOUBLE_NEW_LINE)
+"""Lazily splits the `string` by [`DOUBLE_NEW_LINE`][aoc.ext.constants.DOUBLE_NEW_LINE]."""
+
+
+def iter_fields(string: str) -> Iterator[str]:
+    """Lazily splits the `string` by whitespace.
+
+    This is the lazy equivalent of [`split_whitespace`][aoc.ext.splits.split_whitespace].
+
+    Arguments:
+        string: The string to split.
+
+    Returns:
+        The iterator over the fields.
+    """
+    return map(get_group, FIELD.finditer(string))
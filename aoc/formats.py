@@ -0,0 +1,286 @@
+from __future__ import annotations
+
+from enum import Enum
+from json import dumps
+from pathlib import Path
+from typing import Any, Dict, Optional, TextIO, final
+
+from attrs import define, field
+
+from aoc.constants import NEW_LINE
+from aoc.isolation import Failure
+from aoc.memory import Memory
+from aoc.primitives import Key, Part
+from aoc.solutions import AnyFinalResult, AnyResult
+from aoc.timers import Elapsed
+
+__all__ = (
+    "Format",
+    "Writer",
+    "serialize_elapsed",
+    "serialize_memory",
+    "serialize_result",
+    "serialize_final_result",
+    "serialize_failure",
+    "serialize_error",
+    "serialize_submission",
+)
+
+Record = Dict[str, Any]
+
+TYPE = "type"
+PATH = "path"
+KEY = "key"
+PART = "part"
+
+RESULT = "result"
+FINAL_RESULT = "final_result"
+FAILURE = "failure"
+ERROR = "error"
+SUBMISSION = "submission"
+
+ANSWER = "answer"
+ANSWER_ONE = "answer_one"
+ANSWER_TWO = "answer_two"
+
+PARSE_TIME = "parse_time"
+SOLVE_TIME = "solve_time"
+SOLVE_ONE_TIME = "solve_one_time"
+SOLVE_TWO_TIME = "solve_two_time"
+
+PARSE_CACHED = "parse_cached"
+
+PARSE_MEMORY = "parse_memory"
+SOLVE_MEMORY = "solve_memory"
+SOLVE_ONE_MEMORY = "solve_one_memory"
+SOLVE_TWO_MEMORY = "solve_two_memory"
+
+WALL = "wall"
+PROCESS = "process"
+THREAD = "thread"
+
+PEAK = "peak"
+RSS = "rss"
+ALLOCATIONS = "allocations"
+LOCATION = "location"
+SIZE = "size"
+COUNT = "count"
+
+NAME = "name"
+MESSAGE = "message"
+CACHED = "cached"
+PROFILED = "profiled"
+
+SEPARATORS = (",", ":")
+
+OPEN = "["
+CLOSE = "]"
+SEPARATOR = ","
+
+
+class Format(Enum):
+    """Represents output formats."""
+
+    TEXT = "text"
+    """The human-readable text."""
+
+    JSON = "json"
+    """The JSON array of records, streamed as the records come."""
+
+    NDJSON = "ndjson"
+    """The newline-delimited JSON records."""
+
+
+def serialize_elapsed(elapsed: Elapsed) -> Record:
+    """Serializes the `elapsed` time, in nanoseconds.
+
+    Arguments:
+        elapsed: The elapsed time to serialize.
+
+    Returns:
+        The record with `wall`, `process` and `thread` times (the latter two can be `null`).
+    """
+    return {
+        WALL: elapsed.nanoseconds,
+        PROCESS: elapsed.process_nanoseconds,
+        THREAD: elapsed.thread_nanoseconds,
+    }
+
+
+def serialize_memory(memory: Optional[Memory]) -> Optional[Record]:
+    """Serializes the `memory` usage, in bytes.
+
+    Arguments:
+        memory: The memory usage to serialize, if any.
+
+    Returns:
+        The record with `peak`, `rss` and `allocations`, or [`None`][None] if not tracked.
+    """
+    if memory is None:
+        return None
+
+    rss = memory.rss
+
+    return {
+        PEAK: memory.peak.bytes,
+        RSS: None if rss is None else rss.bytes,
+        ALLOCATIONS: [
+            {LOCATION: allocation.location, SIZE: allocation.size.bytes, COUNT: allocation.count}
+            for allocation in memory.allocations
+        ],
+    }
+
+
+def serialize_result(path: Path, key: Key, result: AnyResult) -> Record:
+    """Serializes the `result` of the solution for the `key`.
+
+    Arguments:
+        path: The path to the module of the solution.
+        key: The key of the solution.
+        result: The result to serialize.
+
+    Returns:
+        The record of the result.
+    """
+    return {
+        TYPE: RESULT,
+        PATH: str(path),
+        KEY: str(key),
+        CACHED: result.cached,
+        PROFILED: result.profiled,
+        ANSWER_ONE: result.answer_one,
+        ANSWER_TWO: result.answer_two,
+        PARSE_TIME: serialize_elapsed(result.parse_time),
+        PARSE_CACHED: result.parse_cached,
+        SOLVE_ONE_TIME: serialize_elapsed(result.solve_one_time),
+        SOLVE_TWO_TIME: serialize_elapsed(result.solve_two_time),
+        PARSE_MEMORY: serialize_memory(result.parse_memory),
+        SOLVE_ONE_MEMORY: serialize_memory(result.solve_one_memory),
+        SOLVE_TWO_MEMORY: serialize_memory(result.solve_two_memory),
+    }
+
+
+def serialize_final_result(path: Path, key: Key, final_result: AnyFinalResult) -> Record:
+    """Serializes the `final_result` of the final solution for the `key`.
+
+    Arguments:
+        path: The path to the module of the final solution.
+        key: The key of the final solution.
+        final_result: The final result to serialize.
+
+    Returns:
+        The record of the final result.
+    """
+    return {
+        TYPE: FINAL_RESULT,
+        PATH: str(path),
+        KEY: str(key),
+        CACHED: final_result.cached,
+        PROFILED: final_result.profiled,
+        ANSWER: final_result.answer,
+        PARSE_TIME: serialize_elapsed(final_result.parse_time),
+        PARSE_CACHED: final_result.parse_cached,
+        SOLVE_TIME: serialize_elapsed(final_result.solve_time),
+        PARSE_MEMORY: serialize_memory(final_result.parse_memory),
+        SOLVE_MEMORY: serialize_memory(final_result.solve_memory),
+    }
+
+
+def serialize_failure(path: Path, key: Key, failure: Failure) -> Record:
+    """Serializes the `failure` of the solution for the `key`.
+
+    Arguments:
+        path: The path to the module of the solution.
+        key: The key of the solution.
+        failure: The failure to serialize.
+
+    Returns:
+        The record of the failure.
+    """
+    return {
+        TYPE: FAILURE,
+        PATH: str(path),
+        KEY: str(key),
+        NAME: failure.name.lower(),
+        MESSAGE: failure.message,
+    }
+
+
+def serialize_error(path: Path, name: str, error: BaseException) -> Record:
+    """Serializes the `error` that occured while running the module at `path`.
+
+    Arguments:
+        path: The path to the module.
+        name: The name of the kind of the error.
+        error: The error to serialize.
+
+    Returns:
+        The record of the error.
+    """
+    return {TYPE: ERROR, PATH: str(path), NAME: name, MESSAGE: str(error)}
+
+
+def serialize_submission(key: Key, part: Part, message: Optional[str]) -> Record:
+    """Serializes the submission of the answer to the `part` of the problem for the `key`.
+
+    Arguments:
+        key: The key of the problem.
+        part: The part of the problem.
+        message: The message received, or [`None`][None] if the submission failed.
+
+    Returns:
+        The record of the submission.
+    """
+    return {TYPE: SUBMISSION, KEY: str(key), PART: part.value, MESSAGE: message}
+
+
+@final
+@define()
+class Writer:
+    """Represents writers of records in machine-readable formats.
+
+    Records are written (and flushed) one by one, so that they can be consumed incrementally.
+    Values that can not be represented in JSON (for instance, answers of custom types)
+    are converted to strings.
+    """
+
+    file: TextIO = field()
+    """The file to write to."""
+
+    format: Format = field(default=Format.NDJSON)
+    """The format to write in (either JSON or NDJSON)."""
+
+    count: int = field(default=0, init=False)
+    """The amount of records written."""
+
+    def write(self, record: Record) -> None:
+        """Writes the `record`.
+
+        Arguments:
+            record: The record to write.
+        """
+        string = dumps(record, default=str, separators=SEPARATORS)
+
+        file = self.file
+
+        if self.format is Format.JSON:
+            file.write(SEPARATOR if self.count else OPEN)
+
+        file.write(string)
+
+        if self.format is Format.NDJSON:
+            file.write(NEW_LINE)
+
+        file.flush()
+
+        self.count += 1
+
+    def close(self) -> None:
+        """Finishes writing; for JSON, this closes the array (writing the empty one if needed)."""
+        if self.format is Format.JSON:
+            file = self.file
+
+            file.write(CLOSE if self.count else OPEN + CLOSE)
+            file.write(NEW_LINE)
+
+            file.flush()
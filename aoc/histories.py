@@ -0,0 +1,365 @@
+from __future__ import annotations
+
+from contextlib import closing, contextmanager
+from hashlib import sha256
+from json import dumps, loads
+from os import cpu_count
+from pathlib import Path
+from platform import machine as get_architecture
+from platform import node, processor, python_implementation, python_version
+from subprocess import DEVNULL, CalledProcessError, check_output
+from time import time
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple, final
+
+from attrs import frozen
+
+from aoc.benchmarks import Statistics, mann_whitney
+from aoc.constants import (
+    DEFAULT_ENCODING,
+    DEFAULT_SIGNIFICANCE,
+    DEFAULT_THRESHOLD,
+    HISTORY_PATH,
+)
+from aoc.primitives import Day, Key, Phase, Year
+from aoc.runners import Benchmarks
+from aoc.timers import Measure
+
+if TYPE_CHECKING:
+    import sqlite3
+
+__all__ = ("Record", "Comparison", "History", "get_commit", "get_machine", "compare")
+
+SCHEMA = """
+create table if not exists runs (
+    id integer primary key,
+    created real not null,
+    commit_hash text,
+    machine text not null,
+    measure text not null
+);
+
+create table if not exists samples (
+    run integer not null references runs (id),
+    year integer not null,
+    day integer not null,
+    phase text not null,
+    samples text not null,
+    primary key (run, year, day, phase)
+);
+
+create index if not exists samples_by_key on samples (year, day, phase);
+"""
+
+INSERT_RUN = "insert into runs (created, commit_hash, machine, measure) values (?, ?, ?, ?)"
+
+INSERT_SAMPLES = "insert into samples (run, year, day, phase, samples) values (?, ?, ?, ?, ?)"
+
+SELECT = """
+select runs.id, runs.created, runs.commit_hash, samples.samples
+from samples join runs on runs.id = samples.run
+where samples.year = ? and samples.day = ? and samples.phase = ?
+and runs.machine = ? and runs.measure = ?
+"""
+
+BEFORE = "and runs.id < ?"
+COMMIT = "and runs.commit_hash like ? || '%'"
+
+LATEST = "order by runs.id desc limit 1"
+
+SELECT_PHASES = """
+select distinct samples.year, samples.day, samples.phase
+from samples join runs on runs.id = samples.run
+where runs.machine = ? and runs.measure = ?
+order by samples.year, samples.day, samples.phase
+"""
+
+GIT_COMMIT = ("git", "rev-parse", "HEAD")
+
+FINGERPRINT_LENGTH = 16
+
+
+def get_commit(path: Path) -> Optional[str]:
+    """Returns the git commit checked out in the repository containing `path`.
+
+    Arguments:
+        path: The path to the directory within the repository.
+
+    Returns:
+        The commit hash, or [`None`][None] if `path` is not within a git repository
+        (or `git` is not available).
+    """
+    try:
+        output = check_output(GIT_COMMIT, cwd=path, stderr=DEVNULL)
+
+    except (OSError, CalledProcessError):
+        return None
+
+    return output.decode(DEFAULT_ENCODING).strip() or None
+
+
+def get_machine() -> str:
+    """Returns the fingerprint of the current machine.
+
+    The fingerprint covers the host name, the architecture, the processor, the number
+    of processors and the Python implementation and version, so that timings
+    are only ever compared to the ones taken in the same environment.
+
+    Returns:
+        The fingerprint of the machine.
+    """
+    parts = (
+        node(),
+        get_architecture(),
+        processor(),
+        str(cpu_count()),
+        python_implementation(),
+        python_version(),
+    )
+
+    hasher = sha256()
+
+    for part in parts:
+        hasher.update(part.encode(DEFAULT_ENCODING))
+        hasher.update(bytes(1))
+
+    return hasher.hexdigest()[:FINGERPRINT_LENGTH]
+
+
+@final
+@frozen()
+class Record:
+    """Represents records of benchmark samples of phases of solutions."""
+
+    run: int
+    """The ID of the run the samples were recorded in."""
+
+    created: float
+    """The time the run was recorded at, as the UNIX timestamp."""
+
+    commit: Optional[str]
+    """The git commit the run was recorded at, if known."""
+
+    samples: List[int]
+    """The samples recorded, in nanoseconds."""
+
+    @property
+    def statistics(self) -> Statistics:
+        """The statistics over the samples."""
+        return Statistics(self.samples)
+
+
+def iter_phases(benchmarks: Benchmarks) -> Iterator[Tuple[Key, Phase, Statistics]]:
+    for key, benchmark in benchmarks.benchmarks.items():
+        yield (key, Phase.PARSE, benchmark.parse)
+        yield (key, Phase.SOLVE_ONE, benchmark.solve_one)
+        yield (key, Phase.SOLVE_TWO, benchmark.solve_two)
+
+    for key, final_benchmark in benchmarks.final_benchmarks.items():
+        yield (key, Phase.PARSE, final_benchmark.parse)
+        yield (key, Phase.SOLVE, final_benchmark.solve)
+
+
+@final
+@frozen()
+class History:
+    """Represents benchmark histories, stored in SQLite databases.
+
+    Each run of benchmarks is recorded along with the git commit and the fingerprint
+    of the machine (see [`get_machine`][aoc.histories.get_machine]), and the samples
+    of every phase of every solution benchmarked are stored by keys.
+    """
+
+    path: Path = HISTORY_PATH
+    """The path to the database."""
+
+    @contextmanager
+    def connect(self) -> Iterator[sqlite3.Connection]:
+        """Connects to the database, creating it if needed.
+
+        The changes are committed on successful exit from the `with` block.
+
+        Returns:
+            The context manager yielding the connection.
+        """
+        import sqlite3
+
+        path = self.path
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        with closing(sqlite3.connect(path)) as connection:
+            connection.executescript(SCHEMA)
+
+            with connection:  # commits or rolls back
+                yield connection
+
+    def append(
+        self,
+        benchmarks: Benchmarks,
+        commit: Optional[str] = None,
+        machine: Optional[str] = None,
+        measure: Measure = Measure.WALL,
+    ) -> int:
+        """Appends the `benchmarks` to the history as the new run.
+
+        Arguments:
+            benchmarks: The benchmarks to append.
+            commit: The git commit the benchmarks were taken at, if known.
+            machine: The fingerprint of the machine (defaults to the current one).
+            measure: The measure of time the benchmarks were taken in.
+
+        Returns:
+            The ID of the run.
+        """
+        if machine is None:
+            machine = get_machine()
+
+        with self.connect() as connection:
+            cursor = connection.execute(INSERT_RUN, (time(), commit, machine, measure.value))
+
+            run = cursor.lastrowid
+
+            connection.executemany(
+                INSERT_SAMPLES,
+                (
+                    (run, key.year.value, key.day.value, phase.value, dumps(statistics.samples))
+                    for key, phase, statistics in iter_phases(benchmarks)
+                ),
+            )
+
+        return run  # type: ignore[return-value]
+
+    def latest(
+        self,
+        key: Key,
+        phase: Phase,
+        machine: Optional[str] = None,
+        measure: Measure = Measure.WALL,
+        commit: Optional[str] = None,
+        before: Optional[int] = None,
+    ) -> Optional[Record]:
+        """Finds the latest record of the `phase` of the solution for the `key`.
+
+        Arguments:
+            key: The key of the solution.
+            phase: The phase of the solution.
+            machine: The fingerprint of the machine (defaults to the current one).
+            measure: The measure of time.
+            commit: The (prefix of the) git commit to look for, if any.
+            before: The ID of the run to look strictly before, if any.
+
+        Returns:
+            The record found, or [`None`][None] if there is none.
+        """
+        if machine is None:
+            machine = get_machine()
+
+        query = [SELECT]
+        parameters: List[object] = [
+            key.year.value,
+            key.day.value,
+            phase.value,
+            machine,
+            measure.value,
+        ]
+
+        if commit is not None:
+            query.append(COMMIT)
+            parameters.append(commit)
+
+        if before is not None:
+            query.append(BEFORE)
+            parameters.append(before)
+
+        query.append(LATEST)
+
+        with self.connect() as connection:
+            row = connection.execute(" ".join(query), parameters).fetchone()
+
+        if row is None:
+            return None
+
+        run, created, commit_hash, samples = row
+
+        return Record(run, created, commit_hash, loads(samples))
+
+    def phases(
+        self, machine: Optional[str] = None, measure: Measure = Measure.WALL
+    ) -> List[Tuple[Key, Phase]]:
+        """Returns the phases of solutions recorded.
+
+        Arguments:
+            machine: The fingerprint of the machine (defaults to the current one).
+            measure: The measure of time.
+
+        Returns:
+            The keys and phases recorded, in order.
+        """
+        if machine is None:
+            machine = get_machine()
+
+        with self.connect() as connection:
+            rows = connection.execute(SELECT_PHASES, (machine, measure.value)).fetchall()
+
+        return [(Key(Year(year), Day(day)), Phase(phase)) for year, day, phase in rows]
+
+
+@final
+@frozen()
+class Comparison:
+    """Represents comparisons of benchmark records."""
+
+    baseline: Record
+    """The baseline record."""
+
+    current: Record
+    """The current record."""
+
+    p_value: float
+    """The p-value of the current samples being greater than the baseline ones
+    (see [`mann_whitney`][aoc.benchmarks.mann_whitney]).
+    """
+
+    regressed: bool
+    """Whether the comparison is considered a regression."""
+
+    @property
+    def ratio(self) -> float:
+        """The ratio of the current median to the baseline one."""
+        baseline = self.baseline.statistics.median.nanoseconds
+
+        if not baseline:
+            return 1.0
+
+        return self.current.statistics.median.nanoseconds / baseline
+
+
+def compare(
+    baseline: Record,
+    current: Record,
+    significance: float = DEFAULT_SIGNIFICANCE,
+    threshold: float = DEFAULT_THRESHOLD,
+) -> Comparison:
+    """Compares the `current` record to the `baseline` one.
+
+    The comparison is considered a regression if the current samples are significantly
+    greater than the baseline ones (at the `significance` level), and the current median
+    is greater than the baseline one by more than `threshold` (relatively).
+
+    Arguments:
+        baseline: The baseline record.
+        current: The current record.
+        significance: The significance level.
+        threshold: The minimum relative slowdown of the median.
+
+    Returns:
+        The comparison.
+    """
+    p_value = mann_whitney(baseline.samples, current.samples)
+
+    baseline_median = baseline.statistics.median.nanoseconds
+    current_median = current.statistics.median.nanoseconds
+
+    regressed = p_value < significance and current_median > baseline_median * (1.0 + threshold)
+
+    return Comparison(baseline, current, p_value, regressed)
@@ -1,17 +1,30 @@
 from __future__ import annotations
 
-from typing import Any, Optional
-
-from aiohttp import ClientError, ClientSession
+from asyncio import AbstractEventLoop, get_running_loop, sleep
+from asyncio import TimeoutError as AsyncTimeoutError
+from threading import Lock
+from time import monotonic
+from types import TracebackType
+from typing import Any, Dict, Mapping, Optional, Tuple, Type, final
+
+from aiohttp import (
+    ClientConnectionError,
+    ClientConnectorError,
+    ClientPayloadError,
+    ClientResponseError,
+    ClientSession,
+    ClientTimeout,
+    TCPConnector,
+)
 from attrs import define, field, frozen
 from typing_aliases import Headers, Parameters, Payload
 from typing_extensions import Self
 
 from aoc.constants import (
     ANSWER,
-    BASE_URL,
+    BASE_URL_STRING,
+    DEFAULT_CONNECTION_LIMIT,
     DEFAULT_RETRIES,
-    EMPTY,
     GET,
     NAME,
     PART,
@@ -20,10 +33,11 @@ from aoc.constants import (
     TOKEN_COOKIE_NAME,
 )
 from aoc.primitives import Key, Part
-from aoc.states import State
+from aoc.retries import RetryPolicy, parse_retry_after
+from aoc.states import Reply, State
 from aoc.versions import python_version_info, version_info
 
-__all__ = ("HTTPClient", "Route")
+__all__ = ("HTTPClient", "Route", "Response")
 
 KEY = "{route.method} {route.path}"
 key = KEY.format
@@ -59,6 +73,21 @@ class Route:
         return key(route=self)
 
 
+@final
+@frozen()
+class Response:
+    """Represents responses received."""
+
+    status: int
+    """The HTTP status of the response."""
+
+    text: str
+    """The response string."""
+
+    headers: Mapping[str, str]
+    """The headers of the response (case-insensitive)."""
+
+
 USER_AGENT_LITERAL = "User-Agent"
 """The user agent literal."""
 
@@ -76,16 +105,188 @@ This is formatted using:
 HEADERS = {USER_AGENT_LITERAL: USER_AGENT}
 """The default headers to use."""
 
+RETRY_AFTER_LITERAL = "Retry-After"
+"""The retry after literal."""
+
+TRANSIENT_ERRORS = (ClientConnectionError, ClientPayloadError, AsyncTimeoutError)
+"""The errors that are retried for idempotent methods
+(connection resets, timeouts and broken payloads)."""
+
+UNSENT_ERRORS = (ClientConnectorError,)
+"""The errors that are retried for any method, since the request was never sent."""
+
+IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"))
+"""The HTTP methods that can be safely repeated."""
+
+DEADLINE_EXCEEDED = "the deadline of the request was exceeded"
+
 
 @define()
 class HTTPClient:
-    """Represents HTTP clients interacting with the Advent of Code servers."""
+    """Represents HTTP clients interacting with the Advent of Code servers.
+
+    Clients can be used as asynchronous context managers, in which case they own
+    the long-lived session with the pool of connections, which are kept alive and reused
+    across requests:
+
+    ```python
+    async with HTTPClient(token) as client:
+        for key in keys:
+            data = await client.download_data(key)
+    ```
+
+    Otherwise, each request is sent within its own short-lived session.
+
+    Sessions are bound to event loops, so clients entered within different event loops
+    (for instance, in different threads) own separate sessions.
+
+    Failed requests are retried according to the [`policy`][aoc.http.HTTPClient.policy].
+    """
 
     token: str = field()
     """The token to use."""
 
     retries: int = field(default=DEFAULT_RETRIES)
-    """The amount of retries to use."""
+    """The maximum amount of retries to use."""
+
+    limit: int = field(default=DEFAULT_CONNECTION_LIMIT)
+    """The maximum amount of simultaneous connections in the pool (`0` means no limit)."""
+
+    base_url: str = field(default=BASE_URL_STRING)
+    """The base URL to send requests to."""
+
+    policy: RetryPolicy = field(factory=RetryPolicy, kw_only=True)
+    """The policy of retrying failed requests."""
+
+    sessions: Dict[AbstractEventLoop, ClientSession] = field(factory=dict, init=False)
+    """The long-lived sessions of the client, by the event loops it is entered within."""
+
+    entered: Dict[AbstractEventLoop, int] = field(factory=dict, init=False)
+    """The amount of times the client is entered (and not exited yet), by event loops."""
+
+    lock: Lock = field(factory=Lock, init=False, repr=False, eq=False)
+    """The lock guarding sessions across threads."""
+
+    @property
+    def session(self) -> Optional[ClientSession]:
+        """The long-lived session for the running event loop, if the client is entered."""
+        try:
+            loop = get_running_loop()
+
+        except RuntimeError:
+            return None
+
+        return self.sessions.get(loop)
+
+    def create_session(self) -> ClientSession:
+        """Creates the session to send requests with.
+
+        This method sets up the session with:
+
+        - `base_url`: The [`base_url`][aoc.http.HTTPClient.base_url].
+
+        - `cookies`: The [`token`][aoc.http.HTTPClient.token] in the
+          [`TOKEN_COOKIE_NAME`][aoc.constants.TOKEN_COOKIE_NAME] cookie.
+
+        - `headers`: The [`HEADERS`][aoc.http.HEADERS].
+
+        - `connector`: The connector with the pool of at most
+          [`limit`][aoc.http.HTTPClient.limit] connections.
+
+        Returns:
+            The session created.
+        """
+        return ClientSession(
+            base_url=self.base_url,
+            cookies={TOKEN_COOKIE_NAME: self.token},
+            headers=HEADERS,
+            connector=TCPConnector(limit=self.limit),
+        )
+
+    async def __aenter__(self) -> Self:
+        loop = get_running_loop()
+
+        with self.lock:
+            if loop not in self.sessions:
+                self.sessions[loop] = self.create_session()
+
+            self.entered[loop] = self.entered.get(loop, 0) + 1
+
+        return self
+
+    async def __aexit__(
+        self,
+        error_type: Optional[Type[BaseException]],
+        error: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        loop = get_running_loop()
+
+        with self.lock:
+            entered = self.entered[loop] - 1
+
+            if entered:
+                self.entered[loop] = entered
+
+                return
+
+            del self.entered[loop]
+
+            session = self.sessions.pop(loop)
+
+        await session.close()
+
+    async def fetch(
+        self,
+        method: str,
+        path: str,
+        payload: Optional[Payload] = None,
+        data: Optional[Parameters] = None,
+        parameters: Optional[Parameters] = None,
+        headers: Optional[Headers] = None,
+    ) -> Response:
+        """Sends requests to the Advent of Code servers, returning the full responses.
+
+        The requests are sent within the [`session`][aoc.http.HTTPClient.session] if the client
+        is entered within the running event loop, and within the new session otherwise
+        (see [`create_session`][aoc.http.HTTPClient.create_session]).
+
+        Transient failures (server errors, rate limiting, connection resets and timeouts)
+        are retried up to [`retries`][aoc.http.HTTPClient.retries] times, waiting according
+        to the [`policy`][aoc.http.HTTPClient.policy]; other failures are raised right away.
+
+        Requests with methods that are not idempotent (for instance, `POST`) are not retried
+        on timeouts and broken connections or payloads, since the server might have processed
+        them already; they are only retried if they could not be sent at all.
+
+        Each attempt is limited to the time left until the
+        [`deadline`][aoc.retries.RetryPolicy.deadline] of the policy.
+
+        Arguments:
+            method: The HTTP method to use.
+            path: The path to send the request to, relative to
+                [`base_url`][aoc.http.HTTPClient.base_url].
+            payload: The payload to send (JSON).
+            data: The data to send.
+            parameters: The parameters to use.
+            headers: The headers to use.
+
+        Returns:
+            The response received (redirects and `304 Not Modified` are not errors).
+
+        Raises:
+            ClientError: The request failed fatally, or all request attempts failed.
+            TimeoutError: All request attempts timed out.
+        """
+        session = self.session
+
+        if session is None:
+            async with self.create_session() as session:
+                return await self.request_with(
+                    session, method, path, payload, data, parameters, headers
+                )
+
+        return await self.request_with(session, method, path, payload, data, parameters, headers)
 
     async def request(
         self,
@@ -98,16 +299,12 @@ class HTTPClient:
     ) -> str:
         """Sends requests to the Advent of Code servers.
 
-        This method sends additional data in the request:
-
-        - `cookies`: The [`token`][aoc.http.HTTPClient.token] in the
-          [`TOKEN_COOKIE_NAME`][aoc.constants.TOKEN_COOKIE_NAME] cookie.
-
-        - `headers`: The [`HEADERS`][aoc.http.HEADERS].
+        See [`fetch`][aoc.http.HTTPClient.fetch] for more information.
 
         Arguments:
             method: The HTTP method to use.
-            path: The path to send the request to, relative to [`BASE_URL`][aoc.constants.BASE_URL].
+            path: The path to send the request to, relative to
+                [`base_url`][aoc.http.HTTPClient.base_url].
             payload: The payload to send (JSON).
             data: The data to send.
             parameters: The parameters to use.
@@ -117,44 +314,85 @@ class HTTPClient:
             The response string.
 
         Raises:
-            ClientError: All request attempts failed.
+            ClientError: The request failed fatally, or all request attempts failed.
+            TimeoutError: All request attempts timed out.
         """
-        attempts = self.retries + 1
+        response = await self.fetch(method, path, payload, data, parameters, headers)
+
+        return response.text
+
+    async def request_with(
+        self,
+        session: ClientSession,
+        method: str,
+        path: str,
+        payload: Optional[Payload] = None,
+        data: Optional[Parameters] = None,
+        parameters: Optional[Parameters] = None,
+        headers: Optional[Headers] = None,
+    ) -> Response:
+        policy = self.policy
+        retries = self.retries
+
+        retried: Tuple[Type[Exception], ...] = (
+            TRANSIENT_ERRORS if method.upper() in IDEMPOTENT_METHODS else UNSENT_ERRORS
+        )
+
+        start = monotonic()
+
+        attempt = 0
+
+        while True:
+            retry_after: Optional[float] = None
 
-        error: Optional[ClientError] = None
+            remaining = policy.get_remaining(monotonic() - start)
 
-        session_cookies = {TOKEN_COOKIE_NAME: self.token}
-        session_headers = HEADERS
-        base_url = BASE_URL
+            if remaining is None:
+                timeout = session.timeout
+
+            elif remaining > 0.0:
+                timeout = ClientTimeout(total=remaining)
+
+            else:
+                raise AsyncTimeoutError(DEADLINE_EXCEEDED)
 
-        while attempts:
             try:
-                async with ClientSession(
-                    base_url=base_url, cookies=session_cookies, headers=session_headers
-                ) as session:
-                    response = await session.request(
-                        method,
-                        path,
-                        params=parameters,
-                        data=data,
-                        json=payload,
-                        headers=headers,
-                    )
+                async with session.request(
+                    method,
+                    path,
+                    params=parameters,
+                    data=data,
+                    json=payload,
+                    headers=headers,
+                    timeout=timeout,
+                ) as response:
+                    if not response.ok:
+                        retry_after = parse_retry_after(response.headers.get(RETRY_AFTER_LITERAL))
 
                     response.raise_for_status()
 
-            except ClientError as origin:
-                error = origin
+                    return Response(response.status, await response.text(), response.headers)
 
-            else:
-                return await response.text()
+            except ClientResponseError as response_error:
+                if not policy.is_retryable(response_error.status):
+                    raise
+
+                error: Exception = response_error
 
-            attempts -= 1
+            except retried as transient_error:
+                error = transient_error
 
-        if error:
-            raise error
+            if attempt >= retries:
+                raise error
 
-        return EMPTY  # pragma: never
+            delay = policy.get_delay(attempt, retry_after)
+
+            if not policy.allows(monotonic() - start, delay):
+                raise error
+
+            await sleep(delay)
+
+            attempt += 1
 
     async def request_route(
         self,
@@ -213,6 +451,27 @@ class HTTPClient:
             headers=headers,
         )
 
+    async def fetch_data(self, key: Key, headers: Optional[Headers] = None) -> Response:
+        """Fetches the data for the problem for the given `key`, returning the full response.
+
+        This is useful for conditional requests (see [`aoc.sources`][aoc.sources]).
+
+        Arguments:
+            key: The key to fetch the data for.
+            headers: The headers to use.
+
+        Returns:
+            The response received.
+
+        Raises:
+            ClientError: All request attempts failed.
+        """
+        route = Route.with_parameters(
+            GET, "/{year}/day/{day}/input", year=key.year.value, day=key.day.value
+        )
+
+        return await self.fetch(route.method, route.path, headers=headers)
+
     async def download_data(self, key: Key) -> str:
         """Downloads the data for the problem for the given `key`.
 
@@ -225,22 +484,23 @@ class HTTPClient:
         Raises:
             ClientError: All request attempts failed.
         """
-        route = Route.with_parameters(
-            GET, "/{year}/day/{day}/input", year=key.year.value, day=key.day.value
-        )
+        response = await self.fetch_data(key)
 
-        return await self.request_route(route)
+        return response.text
 
-    async def submit_answer(self, key: Key, part: Part, answer: Any) -> State:
+    async def submit_answer_reply(self, key: Key, part: Part, answer: Any) -> Reply:
         """Submits the `answer` for the problem `part` and the given `key`.
 
+        Unlike [`submit_answer`][aoc.http.HTTPClient.submit_answer], this also returns
+        the time left to wait before submitting again, if the server says so.
+
         Arguments:
             key: The key of the problem to submit the answer for.
             part: The part of the problem to submit the answer for.
             answer: The answer to submit.
 
         Returns:
-            The state fetched from the response.
+            The reply fetched from the response.
 
         Raises:
             ClientError: All request attempts failed.
@@ -253,4 +513,22 @@ class HTTPClient:
 
         response = await self.request_route(route, data=data)
 
-        return State.match(response)
+        return Reply.match(response)
+
+    async def submit_answer(self, key: Key, part: Part, answer: Any) -> State:
+        """Submits the `answer` for the problem `part` and the given `key`.
+
+        Arguments:
+            key: The key of the problem to submit the answer for.
+            part: The part of the problem to submit the answer for.
+            answer: The answer to submit.
+
+        Returns:
+            The state fetched from the response.
+
+        Raises:
+            ClientError: All request attempts failed.
+        """
+        reply = await self.submit_answer_reply(key, part, answer)
+
+        return reply.state
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+from hashlib import sha256
+from inspect import getsourcefile
+from pathlib import Path
+from pickle import HIGHEST_PROTOCOL, dumps, loads
+from typing import Any, Optional, Protocol, final
+
+from attrs import field, frozen
+from named import get_name
+
+from aoc.constants import DEFAULT_ENCODING, DEFAULT_INPUT_CACHE_LIMIT, INPUTS_PATH
+from aoc.modules import hash_module
+from aoc.stores import Store
+
+__all__ = ("Codec", "PickleCodec", "PICKLE_CODEC", "InputEntry", "InputCache")
+
+SUFFIX = ".input"
+
+CODE = "__code__"
+
+
+class Codec(Protocol):
+    """Represents codecs used to serialize parsed inputs."""
+
+    def dumps(self, value: Any) -> bytes:
+        """Serializes the `value`.
+
+        Arguments:
+            value: The value to serialize.
+
+        Returns:
+            The serialized value.
+        """
+        ...
+
+    def loads(self, content: bytes) -> Any:
+        """Deserializes the `content`.
+
+        Arguments:
+            content: The content to deserialize.
+
+        Returns:
+            The deserialized value.
+        """
+        ...
+
+
+@final
+@frozen()
+class PickleCodec:
+    """Represents codecs using [`pickle`][pickle]."""
+
+    protocol: int = HIGHEST_PROTOCOL
+    """The protocol to use."""
+
+    def dumps(self, value: Any) -> bytes:
+        return dumps(value, self.protocol)
+
+    def loads(self, content: bytes) -> Any:
+        return loads(content)
+
+
+PICKLE_CODEC = PickleCodec()
+"""The default codec."""
+
+
+@final
+@frozen()
+class InputEntry:
+    """Represents input cache entries loaded."""
+
+    input: Any
+    """The parsed input."""
+
+
+def get_source_path(solution_type: type) -> Optional[Path]:
+    # modules run from paths are not in `sys.modules`, so the code of methods is checked first
+    for value in vars(solution_type).values():
+        code = getattr(value, CODE, None)
+
+        if code is not None:
+            return Path(code.co_filename)
+
+    try:
+        source_file = getsourcefile(solution_type)
+
+    except TypeError:  # built-in
+        return None
+
+    return None if source_file is None else Path(source_file)
+
+
+@final
+@frozen()
+class InputCache:
+    """Represents content-addressed caches of parsed inputs.
+
+    Inputs are looked up by the hash of the data, the name of the solution type and the hash
+    of its module source (including its local modules, see
+    [`hash_module`][aoc.modules.hash_module]), so that changing either invalidates them.
+
+    The total size of the cache is bounded by [`limit`][aoc.inputs.InputCache.limit];
+    least recently used entries are evicted first.
+    """
+
+    path: Path = field(default=INPUTS_PATH)
+    """The path to the cache directory."""
+
+    limit: int = field(default=DEFAULT_INPUT_CACHE_LIMIT)
+    """The maximum size of the cache, in bytes."""
+
+    codec: Codec = field(default=PICKLE_CODEC)
+    """The codec to serialize inputs with."""
+
+    @property
+    def store(self) -> Store:
+        """The store of entries."""
+        return Store(self.path, SUFFIX, self.limit)
+
+    def get_digest(self, solution_type: type, data: str) -> Optional[str]:
+        """Returns the digest of the entry for the `solution_type` and the `data`.
+
+        Arguments:
+            solution_type: The type of the solution.
+            data: The data to parse.
+
+        Returns:
+            The hex digest of the entry, or [`None`][None] if the source of the solution
+            can not be found.
+        """
+        source_path = get_source_path(solution_type)
+
+        if source_path is None:
+            return None
+
+        try:
+            hasher = sha256(hash_module(source_path).encode(DEFAULT_ENCODING))
+
+        except OSError:
+            return None
+
+        hasher.update(get_name(solution_type).encode(DEFAULT_ENCODING))
+        hasher.update(get_name(type(self.codec)).encode(DEFAULT_ENCODING))
+        hasher.update(data.encode(DEFAULT_ENCODING))
+
+        return hasher.hexdigest()
+
+    def load(self, solution_type: type, data: str) -> Optional[InputEntry]:
+        """Loads the cached input parsed by the `solution_type` from the `data`.
+
+        Arguments:
+            solution_type: The type of the solution.
+            data: The data parsed.
+
+        Returns:
+            The entry with the input cached, or [`None`][None] if there is none.
+        """
+        digest = self.get_digest(solution_type, data)
+
+        if digest is None:
+            return None
+
+        content = self.store.read(digest)
+
+        if content is None:
+            return None
+
+        try:
+            input = self.codec.loads(content)
+
+        except Exception:  # corrupted entries are misses
+            return None
+
+        return InputEntry(input)
+
+    def dump(self, solution_type: type, data: str, input: Any) -> None:
+        """Dumps the `input` parsed by the `solution_type` from the `data` to the cache.
+
+        Inputs that can not be serialized are silently skipped.
+
+        Arguments:
+            solution_type: The type of the solution.
+            data: The data parsed.
+            input: The parsed input to dump.
+        """
+        digest = self.get_digest(solution_type, data)
+
+        if digest is None:
+            return
+
+        try:
+            self.store.write(digest, self.codec.dumps(input))
+
+        except Exception:  # inputs that can not be serialized (or written) are skipped
+            pass
+
+    def evict(self) -> None:
+        """Evicts the least recently used entries until the cache fits the limit."""
+        self.store.evict()
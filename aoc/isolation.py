@@ -0,0 +1,287 @@
+from __future__ import annotations
+
+from enum import Enum, auto
+from threading import active_count
+from typing import TYPE_CHECKING, Any, Generic, Literal, Optional, TypeVar, Union, final
+
+from attrs import define, field, frozen
+from typing_aliases import Nullary
+from typing_extensions import assert_never
+
+from aoc.timers import Timer, now
+
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+    from multiprocessing.context import ForkContext, ForkServerContext, SpawnContext
+    from multiprocessing.process import BaseProcess
+
+    SafeContext = Union[ForkServerContext, SpawnContext]
+    Context = Union[ForkContext, SafeContext]
+
+__all__ = (
+    "Failure",
+    "Limits",
+    "Isolated",
+    "can_fork",
+    "get_safe_context",
+    "start_isolated",
+    "run_isolated",
+)
+
+R = TypeVar("R")
+
+TIMEOUT_MESSAGE = "timed out"
+MEMORY_MESSAGE = "ran out of memory"
+CRASH_MESSAGE = "crashed"
+
+
+class Failure(Enum):
+    """Represents failures of isolated execution."""
+
+    TIMEOUT = auto()
+    """The execution exceeded the time limit."""
+
+    MEMORY = auto()
+    """The execution exceeded the memory limit."""
+
+    CRASH = auto()
+    """The process exited without reporting back."""
+
+    @property
+    def message(self) -> str:
+        """Returns the message for this failure.
+
+        Returns:
+            The message for this failure.
+        """
+        cls = type(self)
+
+        if self is cls.TIMEOUT:
+            return TIMEOUT_MESSAGE
+
+        if self is cls.MEMORY:
+            return MEMORY_MESSAGE
+
+        if self is cls.CRASH:
+            return CRASH_MESSAGE
+
+        assert_never(self)  # pragma: never
+
+
+@final
+@frozen()
+class Limits:
+    """Represents limits of isolated execution."""
+
+    time: Optional[float] = None
+    """The wall-clock time limit, in seconds."""
+
+    memory: Optional[int] = None
+    """The address space limit, in bytes (only supported on Unix)."""
+
+
+class Status(Enum):
+    VALUE = auto()
+    ERROR = auto()
+    FAILURE = auto()
+
+
+def limit_memory(memory: int) -> None:
+    from resource import RLIMIT_AS, setrlimit
+
+    setrlimit(RLIMIT_AS, (memory, memory))
+
+
+def send_error(connection: Connection, error: BaseException) -> None:
+    try:
+        connection.send((Status.ERROR, error))
+
+    except Exception:  # the error can not be pickled
+        connection.send((Status.ERROR, RuntimeError(repr(error))))
+
+
+def isolated(connection: Connection, function: Nullary[Any], memory: Optional[int]) -> None:
+    try:
+        if memory is not None:
+            limit_memory(memory)
+
+        value = function()
+
+    except MemoryError:
+        connection.send((Status.FAILURE, Failure.MEMORY))
+
+    except BaseException as error:
+        send_error(connection, error)
+
+    else:
+        try:
+            connection.send((Status.VALUE, value))
+
+        except MemoryError:
+            connection.send((Status.FAILURE, Failure.MEMORY))
+
+        except Exception as error:
+            send_error(connection, error)
+
+    finally:
+        connection.close()
+
+
+SECOND = 1_000_000_000
+
+FORK: Literal["fork"] = "fork"
+FORKSERVER: Literal["forkserver"] = "forkserver"
+SPAWN: Literal["spawn"] = "spawn"
+
+
+@final
+@define()
+class Isolated(Generic[R]):
+    """Represents functions called in child processes."""
+
+    process: BaseProcess = field()
+    """The child process."""
+
+    receiver: Connection = field()
+    """The connection to receive the outcome through."""
+
+    limits: Limits = field()
+    """The limits to respect."""
+
+    timer: Timer = field(factory=now)
+    """The timer started along with the child process."""
+
+    def wait(self) -> Union[R, Failure]:
+        """Waits for the child process to finish, respecting the time limit.
+
+        The time limit is counted from the start of the child process.
+
+        Returns:
+            The result of the function or the [`Failure`][aoc.isolation.Failure] that occured.
+
+        Raises:
+            AnyError: Any error raised by the function.
+        """
+        process = self.process
+        receiver = self.receiver
+
+        time = self.limits.time
+
+        if time is not None:
+            time = max(time - self.timer.elapsed().nanoseconds / SECOND, 0.0)
+
+        try:
+            if not receiver.poll(time):
+                process.kill()
+
+                return Failure.TIMEOUT
+
+            try:
+                status, payload = receiver.recv()
+
+            except EOFError:
+                return Failure.CRASH
+
+        finally:
+            receiver.close()
+
+            process.join()
+
+        if status is Status.VALUE:
+            return payload  # type: ignore[no-any-return]
+
+        if status is Status.ERROR:
+            raise payload
+
+        if status is Status.FAILURE:
+            return payload  # type: ignore[no-any-return]
+
+        return Failure.CRASH  # pragma: never
+
+
+def can_fork() -> bool:
+    """Checks whether child processes can be forked safely.
+
+    The `fork` start method needs to be available, and no other threads may be running,
+    since locks held by them would be copied into child processes mid-hold.
+
+    Returns:
+        Whether child processes can be forked.
+    """
+    from multiprocessing import get_all_start_methods
+
+    return FORK in get_all_start_methods() and active_count() == 1
+
+
+def get_safe_context() -> SafeContext:
+    """Returns the context starting child processes without forking this one.
+
+    The `forkserver` start method is used where available, and `spawn` otherwise.
+    Either way, functions called in child processes and their results need to be picklable.
+
+    Returns:
+        The context to start child processes with.
+    """
+    from multiprocessing import get_all_start_methods, get_context
+
+    if FORKSERVER in get_all_start_methods():
+        return get_context(FORKSERVER)
+
+    return get_context(SPAWN)
+
+
+def start_isolated(function: Nullary[R], limits: Limits, fork: bool = False) -> Isolated[R]:
+    """Starts calling the `function` in the child process, respecting the `limits`.
+
+    The `function` and its result need to be picklable, unless the `fork` start method is used.
+
+    If `fork` is true and child processes can be forked safely (see
+    [`can_fork`][aoc.isolation.can_fork]), the `fork` start method is used.
+    Child processes created this way share the memory of the parent (copy-on-write),
+    so the `function` is not pickled. Otherwise, the context returned by
+    [`get_safe_context`][aoc.isolation.get_safe_context] is used, regardless of the default one.
+
+    Arguments:
+        function: The function to call.
+        limits: The limits to respect.
+        fork: Whether to prefer the `fork` start method.
+
+    Returns:
+        The [`Isolated`][aoc.isolation.Isolated] handle to wait on.
+    """
+    from multiprocessing import get_context
+
+    context: Context = get_context(FORK) if fork and can_fork() else get_safe_context()
+
+    receiver, sender = context.Pipe(duplex=False)
+
+    process = context.Process(target=isolated, args=(sender, function, limits.memory))
+    process.start()
+
+    sender.close()
+
+    return Isolated(process, receiver, limits)
+
+
+def run_isolated(function: Nullary[R], limits: Limits) -> Union[R, Failure]:
+    """Calls the `function` in the child process, respecting the `limits`.
+
+    This is equivalent to:
+
+    ```python
+    start_isolated(function, limits).wait()
+    ```
+
+    Any error raised in the child process is propagated to the caller.
+
+    Arguments:
+        function: The function to call.
+        limits: The limits to respect.
+
+    Returns:
+        The result of the `function` or the [`Failure`][aoc.isolation.Failure] that occured.
+
+    Raises:
+        AnyError: Any error raised by the `function`.
+    """
+    return start_isolated(function, limits).wait()
@@ -1,41 +1,126 @@
-from asyncio import run as run_coroutine
+from __future__ import annotations
+
 from pathlib import Path
-from sys import exit
-from typing import TYPE_CHECKING, Tuple
+from sys import exit, stdout
+from sys import modules as loaded_modules
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Any,
+    Callable,
+    Coroutine,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
 import click
-from aiohttp import ClientError
-from trogon import tui  # type: ignore
 from typing_aliases import DynamicTuple, NormalError
-from wraps.panics import Panic
 
-from aoc.constants import DATA_PATH, TOKEN_PATH
-from aoc.data import dump_data
+from aoc import __version__
+from aoc.benchmarks import Statistics
+from aoc.caches import ResultCache
+from aoc.constants import (
+    DATA_PATH,
+    DEFAULT_DOWNLOAD_BURST,
+    DEFAULT_DOWNLOAD_CONCURRENCY,
+    DEFAULT_DOWNLOAD_RATE,
+    DEFAULT_INTERVAL,
+    DEFAULT_LIMIT,
+    DEFAULT_ROUNDS,
+    DEFAULT_SIGNIFICANCE,
+    DEFAULT_THRESHOLD,
+    DEFAULT_TOP,
+    DEFAULT_WARMUP,
+    FIRST_DAY,
+    FIRST_YEAR,
+    HISTORY_PATH,
+    INDEX_PATH,
+    INPUTS_PATH,
+    LAST_DAY,
+    RESULTS_PATH,
+    SUBMISSIONS_PATH,
+    TOKEN_PATH,
+)
+from aoc.discoveries import Index, discover
+from aoc.downloads import Downloader, TokenBucket
 from aoc.errors import DataNotFound, TokenNotFound
-from aoc.http import HTTPClient
-from aoc.primitives import Day, Key, Part, Year
-from aoc.runners import Runner
-from aoc.solutions import AnyFinalResult, AnyResult
-from aoc.time import aoc_today, get_key_for_date
+from aoc.formats import (
+    Format,
+    Writer,
+    serialize_error,
+    serialize_failure,
+    serialize_final_result,
+    serialize_result,
+    serialize_submission,
+)
+from aoc.histories import Comparison, History, get_commit, get_machine
+from aoc.histories import compare as compare_records
+from aoc.inputs import InputCache
+from aoc.isolation import Limits
+from aoc.memory import Memory, Tracker
+from aoc.primitives import Day, Key, Part, Phase, Year
+from aoc.profiles import Hotspot, Profiler
+from aoc.runners import Outcome, ParallelRunner, Runner
+from aoc.solutions import (
+    AnyBenchmark,
+    AnyFinalBenchmark,
+    AnyFinalResult,
+    AnyResult,
+    FinalResult,
+    Result,
+)
+from aoc.sources import DataSource
+from aoc.states import Reply, State
+from aoc.submissions import (
+    ProblemPart,
+    Submission,
+    SubmissionQueue,
+    get_wait,
+    resubmit_answers,
+    submit_answer,
+)
+from aoc.timers import Elapsed, Measure
 from aoc.tokens import dump_token, load_token, remove_token
-from aoc.versions import version_info
+from aoc.watchers import Watcher, unload_modules
+
+if TYPE_CHECKING:
+    from aoc.http import HTTPClient
+
+# heavy dependencies (`aiohttp`, `pendulum`, `trogon` and `versions`) are imported
+# in the commands that need them, so that startup stays fast
+
+T = TypeVar("T")
 
 ERROR = 1
 ALL = -1
 
 
+def run_coroutine(coroutine: Coroutine[Any, Any, T]) -> T:
+    from asyncio import run
+
+    return run(coroutine)
+
+
 @click.group()
 @click.help_option("--help", "-h")
-@click.version_option(str(version_info), "--version", "-V")
+@click.version_option(__version__, "--version", "-V")
 def aoc() -> None:
     pass
 
 
-if not TYPE_CHECKING:
-    UI = "ui"
-    UI_HELP = "Open UI."
+UI = "ui"
+UI_HELP = "Open UI."
 
-    aoc = tui(command=UI, help=UI_HELP)(aoc)
+
+@aoc.command(name=UI, help=UI_HELP, short_help=UI_HELP)
+@click.pass_context
+def ui(context: click.Context) -> None:
+    from trogon import Trogon  # type: ignore
+
+    Trogon(aoc, command_name=UI, click_context=context).run()
 
 
 INDENT = "    "
@@ -62,18 +147,116 @@ SOLVE_TWO_TIME = "solve two time: {}"
 solve_two_time = SOLVE_TWO_TIME.format
 
 
+CPU_TIME = "{} (process {} | thread {})"
+cpu_time = CPU_TIME.format
+
+INPUT_CACHED = "{} (input cached)"
+input_cached = INPUT_CACHED.format
+
+
+def format_elapsed(elapsed: Elapsed) -> str:
+    process_time = elapsed.process_time
+    thread_time = elapsed.thread_time
+
+    if process_time is None or thread_time is None:
+        return str(elapsed)
+
+    return cpu_time(elapsed, process_time, thread_time)
+
+
+PARSE_MEMORY = "parse memory: {}"
+parse_memory_string = PARSE_MEMORY.format
+
+SOLVE_MEMORY = "solve memory: {}"
+solve_memory_string = SOLVE_MEMORY.format
+
+SOLVE_ONE_MEMORY = "solve one memory: {}"
+solve_one_memory_string = SOLVE_ONE_MEMORY.format
+
+SOLVE_TWO_MEMORY = "solve two memory: {}"
+solve_two_memory_string = SOLVE_TWO_MEMORY.format
+
+MEMORY = "peak {} | rss {}"
+memory_string = MEMORY.format
+
+ALLOCATION = "{} | {} in {} block(s)"
+allocation_string = ALLOCATION.format
+
+UNKNOWN = "unknown"
+
+
+def format_memory(memory: Memory) -> str:
+    rss = memory.rss
+
+    return memory_string(memory.peak, UNKNOWN if rss is None else rss)
+
+
+def format_time(elapsed: Elapsed, cached: bool = False, profiled: bool = False) -> str:
+    string = format_elapsed(elapsed)
+
+    if profiled:
+        string = profiled_string(string)
+
+    return cached_string(string) if cached else string
+
+
+def format_parse_time(
+    elapsed: Elapsed, parse_cached: bool, cached: bool = False, profiled: bool = False
+) -> str:
+    string = format_time(elapsed, cached, profiled)
+
+    return input_cached(string) if parse_cached else string
+
+
+def print_memory(
+    memory: Optional[Memory], format: Callable[[str], str], indent: str = INDENT
+) -> None:
+    if memory is None:
+        return
+
+    click.echo(indent + format(format_memory(memory)))
+
+    for allocation in memory.allocations:
+        click.echo(
+            indent
+            + INDENT
+            + allocation_string(allocation.location, allocation.size, allocation.count)
+        )
+
+
 def print_result(result: AnyResult, indent: str = INDENT) -> None:
     click.echo(indent + answer_one(result.answer_one))
     click.echo(indent + answer_two(result.answer_two))
-    click.echo(indent + parse_time(result.parse_time))
-    click.echo(indent + solve_one_time(result.solve_one_time))
-    click.echo(indent + solve_two_time(result.solve_two_time))
+    cached = result.cached
+    profiled = result.profiled
+
+    click.echo(
+        indent
+        + parse_time(format_parse_time(result.parse_time, result.parse_cached, cached, profiled))
+    )
+    click.echo(indent + solve_one_time(format_time(result.solve_one_time, cached, profiled)))
+    click.echo(indent + solve_two_time(format_time(result.solve_two_time, cached, profiled)))
+
+    print_memory(result.parse_memory, parse_memory_string, indent)
+    print_memory(result.solve_one_memory, solve_one_memory_string, indent)
+    print_memory(result.solve_two_memory, solve_two_memory_string, indent)
 
 
 def print_final_result(final_result: AnyFinalResult, indent: str = INDENT) -> None:
     click.echo(indent + answer(final_result.answer))
-    click.echo(indent + parse_time(final_result.parse_time))
-    click.echo(indent + solve_time(final_result.solve_time))
+    cached = final_result.cached
+    profiled = final_result.profiled
+
+    click.echo(
+        indent
+        + parse_time(
+            format_parse_time(final_result.parse_time, final_result.parse_cached, cached, profiled)
+        )
+    )
+    click.echo(indent + solve_time(format_time(final_result.solve_time, cached, profiled)))
+
+    print_memory(final_result.parse_memory, parse_memory_string, indent)
+    print_memory(final_result.solve_memory, solve_memory_string, indent)
 
 
 PART_ONE = "part one: {}"
@@ -83,44 +266,129 @@ PART_TWO = "part two: {}"
 part_two = PART_TWO.format
 
 
+QUEUED = "queued for resubmission in {:.0f}s"
+queued = QUEUED.format
+
+
 async def submit_result(
-    result: AnyResult, key: Key, client: HTTPClient, indent: str = INDENT
+    result: AnyResult,
+    key: Key,
+    client: HTTPClient,
+    queue: Optional[SubmissionQueue] = None,
+    indent: str = INDENT,
+    writer: Optional[Writer] = None,
 ) -> None:
-    one = Part.ONE
-    two = Part.TWO
+    async with client:  # both parts are submitted over the same connection
+        await submit_parts(result, key, client, queue, indent, writer)
 
-    try:
-        result_one = await client.submit_answer(key, one, result.answer_one)
 
-    except ClientError:
-        click.echo(failed_to_submit(key, one.value), err=True)
+async def submit_parts(
+    result: AnyResult,
+    key: Key,
+    client: HTTPClient,
+    queue: Optional[SubmissionQueue] = None,
+    indent: str = INDENT,
+    writer: Optional[Writer] = None,
+) -> None:
+    await submit_part(key, Part.ONE, result.answer_one, client, queue, indent, writer, part_one)
+    await submit_part(key, Part.TWO, result.answer_two, client, queue, indent, writer, part_two)
 
-    else:
-        click.echo(indent + part_one(result_one.message))
+
+async def submit_final_result(
+    final_result: AnyFinalResult,
+    key: Key,
+    client: HTTPClient,
+    queue: Optional[SubmissionQueue] = None,
+    indent: str = INDENT,
+    writer: Optional[Writer] = None,
+) -> None:
+    await submit_part(key, Part.ONLY, final_result.answer, client, queue, indent, writer, str)
+
+
+async def submit_part(
+    key: Key,
+    part: Part,
+    answer: Any,
+    client: HTTPClient,
+    queue: Optional[SubmissionQueue] = None,
+    indent: str = INDENT,
+    writer: Optional[Writer] = None,
+    format_message: Callable[[str], str] = str,
+) -> None:
+    from aiohttp import ClientError
+
+    if queue is None:
+        queue = SubmissionQueue(None)
 
     try:
-        result_two = await client.submit_answer(key, two, result.answer_two)
+        reply = await submit_answer(client, queue, key, part, answer)
 
     except ClientError:
-        click.echo(failed_to_submit(key, two.value), err=True)
+        if writer is None:
+            click.echo(failed_to_submit(key, part.value), err=True)
+
+        else:
+            writer.write(serialize_submission(key, part, None))
 
     else:
-        click.echo(indent + part_two(result_two.message))
+        message = reply.state.message
 
+        if writer is None:
+            click.echo(indent + format_message(message))
 
-async def submit_final_result(
-    final_result: AnyFinalResult, key: Key, client: HTTPClient, indent: str = INDENT
+            if reply.state is State.TIMEOUT:
+                click.echo(indent + queued(get_wait(reply)))
+
+        else:
+            writer.write(serialize_submission(key, part, message))
+
+
+RESUBMITTED = "resubmitted the answer for problem `{}` part `{}`: {}"
+resubmitted = RESUBMITTED.format
+
+WAITING_TO_RESUBMIT = "waiting to resubmit {} answer(s)"
+waiting_to_resubmit = WAITING_TO_RESUBMIT.format
+
+FAILED_TO_RESUBMIT = "failed to resubmit answers (they are kept in the queue)"
+
+
+def resubmit_pending(
+    client: HTTPClient,
+    queue: SubmissionQueue,
+    writer: Optional[Writer] = None,
+    wait: bool = True,
+    parts: Optional[AbstractSet[ProblemPart]] = None,
 ) -> None:
-    only = Part.ONLY
+    from aiohttp import ClientError
+
+    selected = queue.select(parts)
+
+    if not selected:
+        return
+
+    def done(submission: Submission, reply: Reply) -> None:
+        key = submission.key
+        part = submission.part
+
+        message = reply.state.message
+
+        if writer is None:
+            click.echo(resubmitted(key, part.value, message))
+
+            if reply.state is State.TIMEOUT:
+                click.echo(INDENT + queued(get_wait(reply)))
+
+        else:
+            writer.write(serialize_submission(key, part, message))
+
+    if wait:
+        click.echo(waiting_to_resubmit(len(selected)), err=True)
 
     try:
-        result = await client.submit_answer(key, only, final_result.answer)
+        run_coroutine(resubmit_answers(client, queue, done, wait, parts))
 
     except ClientError:
-        click.echo(failed_to_submit(key, only.value), err=True)
-
-    else:
-        click.echo(indent + result.message)
+        click.echo(FAILED_TO_RESUBMIT, err=True)
 
 
 RESULT_FOR = "result for `{}`"
@@ -129,6 +397,15 @@ result_for = RESULT_FOR.format
 FINAL_RESULT_FOR = "final result for `{}`"
 final_result_for = FINAL_RESULT_FOR.format
 
+CACHED = "{} (cached)"
+cached_string = CACHED.format
+
+PROFILED = "{} (profiled)"
+profiled_string = PROFILED.format
+
+WATCHING = "watching {} path(s) for changes..."
+watching = WATCHING.format
+
 SOLUTION_DATA_NOT_FOUND = "data not found for solution `{}` ({})"
 solution_data_not_found = SOLUTION_DATA_NOT_FOUND.format
 
@@ -138,13 +415,105 @@ solution_errored = SOLUTION_ERRORED.format
 SOLUTION_PANICKED = "solution `{}` panicked ({})"
 solution_panicked = SOLUTION_PANICKED.format
 
+PANICS = "wraps.panics"
+
+
+def is_panic(error: BaseException) -> bool:
+    # panics can only be raised if `wraps.panics` is already imported,
+    # so there is no need to import it (and `wraps`) here
+    panics = loaded_modules.get(PANICS)
+
+    return panics is not None and isinstance(error, panics.Panic)
+
+
+SOLUTION_FAILED = "solution `{}` failed ({})"
+solution_failed = SOLUTION_FAILED.format
+
+DATA_NOT_FOUND = "data_not_found"
+ERRORED = "errored"
+PANICKED = "panicked"
+
+SINGLE = 1
+
+MEBIBYTE = 1 << 20
+
+
+def get_limits(time_limit: Optional[float], memory_limit: Optional[int]) -> Optional[Limits]:
+    if time_limit is None and memory_limit is None:
+        return None
+
+    memory = None if memory_limit is None else memory_limit * MEBIBYTE
+
+    return Limits(time_limit, memory)
+
+
+def get_cache(cache: bool, refresh: bool, cache_path: Path) -> Optional[ResultCache]:
+    if not cache:
+        return None
+
+    return ResultCache(cache_path, refresh=refresh)
+
+
+def get_inputs(cache_inputs: bool, inputs_path: Path) -> Optional[InputCache]:
+    if not cache_inputs:
+        return None
+
+    return InputCache(inputs_path)
+
+
+def get_writer(format: Format) -> Optional[Writer]:
+    if format is Format.TEXT:
+        return None
+
+    return Writer(stdout, format)
+
+
+def get_profiler(profile_path: Optional[Path]) -> Optional[Profiler]:
+    return None if profile_path is None else Profiler(profile_path)
+
+
+def get_tracker(track_memory: bool, top: int) -> Optional[Tracker]:
+    return Tracker(top) if track_memory else None
+
+
+def get_runner(
+    jobs: int,
+    limits: Optional[Limits] = None,
+    cache: Optional[ResultCache] = None,
+    profiler: Optional[Profiler] = None,
+    tracker: Optional[Tracker] = None,
+    inputs: Optional[InputCache] = None,
+) -> Runner:
+    if jobs == SINGLE:
+        return Runner(limits=limits, cache=cache, profiler=profiler, tracker=tracker, inputs=inputs)
+
+    return ParallelRunner(
+        jobs or None,
+        limits=limits,
+        cache=cache,
+        profiler=profiler,
+        tracker=tracker,
+        inputs=inputs,
+    )
+
 
 @aoc.command(
-    help="Runs the solutions provided in the paths.",
+    help=(
+        "Runs the solutions provided in the paths. "
+        "Directories are searched recursively for modules defining solutions."
+    ),
     short_help="Runs the solutions provided in the paths.",
 )
 @click.help_option("--help", "-h")
-@click.option("--submit", "-S", is_flag=True, help="Whether to submit the answers.")
+@click.option(
+    "--submit",
+    "-S",
+    is_flag=True,
+    help=(
+        "Whether to submit the answers. Answers submitted too recently are resubmitted "
+        "once their cooldowns expire (without waiting in the watch mode)."
+    ),
+)
 @click.option(
     "--data-path",
     "-D",
@@ -161,48 +530,735 @@ solution_panicked = SOLUTION_PANICKED.format
     show_default=True,
     help="The path to the token file.",
 )
+@click.option(
+    "--submissions-path",
+    "-Q",
+    type=Path,
+    default=SUBMISSIONS_PATH,
+    show_default=True,
+    help="The path to the queue of answers pending resubmission.",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=0),
+    default=SINGLE,
+    show_default=True,
+    help="The number of processes to run the paths in (`0` means the number of processors).",
+)
+@click.option(
+    "--time-limit",
+    "-t",
+    type=click.FloatRange(min=0.0, min_open=True),
+    default=None,
+    help="The time limit for each solution, in seconds (runs solutions in isolation).",
+)
+@click.option(
+    "--memory-limit",
+    "-m",
+    type=click.IntRange(min=1),
+    default=None,
+    help="The memory limit for each solution, in MiB (runs solutions in isolation).",
+)
+@click.option(
+    "--cache",
+    "-c",
+    "use_cache",
+    is_flag=True,
+    help=(
+        "Whether to load results from the result cache instead of rerunning solutions "
+        "whose modules and data are unchanged (cached timings are marked as such)."
+    ),
+)
+@click.option(
+    "--refresh",
+    "-R",
+    is_flag=True,
+    help="Whether to rerun solutions, refreshing the result cache (implies `--cache`).",
+)
+@click.option(
+    "--cache-path",
+    "-C",
+    type=Path,
+    default=RESULTS_PATH,
+    show_default=True,
+    help="The path to the result cache directory.",
+)
+@click.option(
+    "--cache-inputs",
+    "-N",
+    is_flag=True,
+    help="Whether to cache parsed inputs, loading them instead of parsing on repeated runs.",
+)
+@click.option(
+    "--inputs-path",
+    type=Path,
+    default=INPUTS_PATH,
+    show_default=True,
+    help="The path to the parsed input cache directory.",
+)
+@click.option(
+    "--watch", "-W", is_flag=True, help="Whether to rerun the solutions when they change."
+)
+@click.option(
+    "--interval",
+    "-i",
+    type=click.FloatRange(min=0.0, min_open=True),
+    default=DEFAULT_INTERVAL,
+    show_default=True,
+    help="The polling interval to watch with, in seconds.",
+)
+@click.option(
+    "--profile",
+    "-P",
+    "profile_path",
+    type=Path,
+    default=None,
+    help=(
+        "The path to dump the profiles of each phase into (bypasses the result cache; "
+        "profiled timings are marked as such)."
+    ),
+)
+@click.option(
+    "--track-memory",
+    "-M",
+    is_flag=True,
+    help="Whether to track memory usage of each phase (bypasses the result cache).",
+)
+@click.option(
+    "--top",
+    type=click.IntRange(min=1),
+    default=DEFAULT_TOP,
+    show_default=True,
+    help="The amount of hotspots (or allocating lines) to show for each phase.",
+)
+@click.option(
+    "--format",
+    "-f",
+    "output_format",
+    type=click.Choice([format.value for format in Format]),
+    default=Format.TEXT.value,
+    show_default=True,
+    help="The format to output results in (records are streamed as they come).",
+)
+@click.option(
+    "--year",
+    "-y",
+    "year_value",
+    type=click.IntRange(min=FIRST_YEAR),
+    default=None,
+    help=(
+        "The year to discover solutions for in directories. "
+        "Only affects directory discovery: modules given as files are always run, "
+        "and modules discovered are run as a whole (including solutions for other years)."
+    ),
+)
+@click.option(
+    "--index-path",
+    "-I",
+    type=Path,
+    default=INDEX_PATH,
+    show_default=True,
+    help="The path to the index of solutions defined in modules.",
+)
+@click.option(
+    "--auto-download",
+    "-A",
+    is_flag=True,
+    help="Whether to download missing data while running solutions for which it is present.",
+)
 @click.argument("paths", type=Path, nargs=ALL)
-def run(submit: bool, data_path: Path, token_path: Path, paths: DynamicTuple[Path]) -> None:
-    if paths:
-        runner = Runner()
+def run(
+    submit: bool,
+    data_path: Path,
+    token_path: Path,
+    submissions_path: Path,
+    jobs: int,
+    time_limit: Optional[float],
+    memory_limit: Optional[int],
+    use_cache: bool,
+    refresh: bool,
+    cache_path: Path,
+    cache_inputs: bool,
+    inputs_path: Path,
+    watch: bool,
+    interval: float,
+    profile_path: Optional[Path],
+    track_memory: bool,
+    top: int,
+    output_format: str,
+    year_value: Optional[int],
+    index_path: Path,
+    auto_download: bool,
+    paths: DynamicTuple[Path],
+) -> None:
+    year = None if year_value is None else Year(year_value)
+
+    index = Index(index_path)
+
+    paths = tuple(discover(paths, year, index))
+
+    if not paths:
+        return
+
+    limits = get_limits(time_limit, memory_limit)
+    # refreshing implies caching, and answers are only submitted for solutions that actually ran
+    cache = get_cache(use_cache or refresh, refresh or submit, cache_path)
+    profiler = get_profiler(profile_path)
+    tracker = get_tracker(track_memory, top)
+
+    inputs = get_inputs(cache_inputs, inputs_path)
+
+    runner = get_runner(jobs, limits, cache, profiler, tracker, inputs)
+
+    client = create_client(token_path) if submit else None
+
+    queue = SubmissionQueue(submissions_path) if submit else None
+
+    # the downloader runs in its own thread and event loop, so it gets its own client
+    downloader = Downloader(create_client(token_path), data_path, index) if auto_download else None
+
+    watcher = Watcher(list(paths), interval) if watch else None
+
+    writer = get_writer(Format(output_format))
+
+    try:
+        # waiting for cooldowns would block watching
+        wait = watcher is None
+
+        run_and_print(runner, paths, data_path, client, top, writer, downloader, queue, wait)
+
+        if watcher is None:
+            return
+
+        click.echo(watching(len(paths)), err=True)
+
+        try:
+            for changed in watcher.watch():
+                unload_modules(watcher.get_files(changed))
+
+                run_and_print(
+                    runner, changed, data_path, client, top, writer, downloader, queue, wait
+                )
+
+        except KeyboardInterrupt:
+            pass
+
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def create_client(token_path: Path) -> HTTPClient:
+    from aoc.http import HTTPClient
+
+    return HTTPClient(find_token(token_path))
+
+
+HOTSPOTS_FOR = "{} hotspots:"
+hotspots_for = HOTSPOTS_FOR.format
+
+HOTSPOT = "{} | {} call(s) | total {} | cumulative {}"
+hotspot_string = HOTSPOT.format
+
+SOLUTION_PHASES = (Phase.PARSE, Phase.SOLVE_ONE, Phase.SOLVE_TWO)
+FINAL_SOLUTION_PHASES = (Phase.PARSE, Phase.SOLVE)
+
+
+def print_hotspot(hotspot: Hotspot, indent: str = INDENT) -> None:
+    click.echo(
+        indent
+        + hotspot_string(
+            hotspot.location, hotspot.calls, hotspot.total_time, hotspot.cumulative_time
+        )
+    )
+
+
+def print_hotspots(
+    profiler: Profiler, key: Key, phases: Iterable[Phase], top: int, indent: str = INDENT
+) -> None:
+    for phase in phases:
+        hotspots = profiler.hotspots(key, phase, top)
+
+        if not hotspots:
+            continue
+
+        click.echo(indent + hotspots_for(phase.value))
+
+        for hotspot in hotspots:
+            print_hotspot(hotspot, indent + INDENT)
+
+
+def print_item(
+    path: Path,
+    key: Key,
+    outcome: Outcome,
+    profiler: Optional[Profiler] = None,
+    client: Optional[HTTPClient] = None,
+    top: int = DEFAULT_TOP,
+    writer: Optional[Writer] = None,
+    queue: Optional[SubmissionQueue] = None,
+) -> None:
+    if isinstance(outcome, Result):
+        if writer is None:
+            click.echo(cached_string(result_for(key)) if outcome.cached else result_for(key))
+
+            print_result(outcome)
+
+            if profiler is not None:
+                print_hotspots(profiler, key, SOLUTION_PHASES, top)
+
+        else:
+            writer.write(serialize_result(path, key, outcome))
+
+        if client is not None:
+            run_coroutine(submit_result(outcome, key, client, queue, writer=writer))
+
+    elif isinstance(outcome, FinalResult):
+        if writer is None:
+            click.echo(
+                cached_string(final_result_for(key)) if outcome.cached else final_result_for(key)
+            )
+
+            print_final_result(outcome)
+
+            if profiler is not None:
+                print_hotspots(profiler, key, FINAL_SOLUTION_PHASES, top)
+
+        else:
+            writer.write(serialize_final_result(path, key, outcome))
+
+        if client is not None:
+            run_coroutine(submit_final_result(outcome, key, client, queue, writer=writer))
+
+    elif writer is None:
+        click.echo(solution_failed(key, outcome.message), err=True)
+
+    else:
+        writer.write(serialize_failure(path, key, outcome))
+
+
+def run_and_print(
+    runner: Runner,
+    paths: Iterable[Path],
+    data_path: Path,
+    client: Optional[HTTPClient] = None,
+    top: int = DEFAULT_TOP,
+    writer: Optional[Writer] = None,
+    downloader: Optional[Downloader] = None,
+    queue: Optional[SubmissionQueue] = None,
+    wait: bool = True,
+) -> None:
+    profiler = runner.profiler
+
+    if downloader is not None:  # modules are run as soon as their data is available
+        paths = downloader.iter_ready(paths)
+
+    for path, items in runner.iter_paths(paths, data_path):
+        try:  # outcomes are printed as soon as each solution completes
+            for key, outcome in items:
+                print_item(path, key, outcome, profiler, client, top, writer, queue)
+
+        except DataNotFound as data_not_found:
+            if writer is None:
+                click.echo(solution_data_not_found(path, data_not_found), err=True)
+
+            else:
+                writer.write(serialize_error(path, DATA_NOT_FOUND, data_not_found))
+
+        except NormalError as error:
+            if writer is None:
+                click.echo(solution_errored(path, error), err=True)
+
+            else:
+                writer.write(serialize_error(path, ERRORED, error))
+
+        except BaseException as error:
+            if not is_panic(error):
+                raise
+
+            if writer is None:
+                click.echo(solution_panicked(path, error), err=True)
+
+            else:
+                writer.write(serialize_error(path, PANICKED, error))
+
+    if downloader is not None:
+        failures = downloader.failures
+
+        for key in failures:
+            click.echo(failed_to_download(key), err=True)
+
+        failures.clear()
+
+    # only the answers queued by this run are resubmitted (as soon as cooldowns expire)
+    if client is not None and queue is not None:
+        resubmit_pending(client, queue, writer, wait, queue.pushed)
+
+
+STATISTICS = "min {} | median {} | mean {} +- {} | p95 {} | p99 {} | max {}"
+statistics_string = STATISTICS.format
+
+P95 = 95.0
+P99 = 99.0
 
-        if submit:
-            token = find_token(token_path)
 
-            client = HTTPClient(token)
+def format_statistics(statistics: Statistics) -> str:
+    return statistics_string(
+        statistics.minimum,
+        statistics.median,
+        statistics.mean,
+        statistics.deviation,
+        statistics.percentile(P95),
+        statistics.percentile(P99),
+        statistics.maximum,
+    )
+
+
+ROUNDS = "rounds: {}"
+rounds_string = ROUNDS.format
+
+
+def print_benchmark(benchmark: AnyBenchmark, indent: str = INDENT) -> None:
+    click.echo(indent + answer_one(benchmark.answer_one))
+    click.echo(indent + answer_two(benchmark.answer_two))
+    click.echo(indent + rounds_string(benchmark.rounds))
+    click.echo(indent + parse_time(format_statistics(benchmark.parse)))
+    click.echo(indent + solve_one_time(format_statistics(benchmark.solve_one)))
+    click.echo(indent + solve_two_time(format_statistics(benchmark.solve_two)))
+
+
+def print_final_benchmark(final_benchmark: AnyFinalBenchmark, indent: str = INDENT) -> None:
+    click.echo(indent + answer(final_benchmark.answer))
+    click.echo(indent + rounds_string(final_benchmark.rounds))
+    click.echo(indent + parse_time(format_statistics(final_benchmark.parse)))
+    click.echo(indent + solve_time(format_statistics(final_benchmark.solve)))
+
+
+BENCHMARK_FOR = "benchmark for `{}`"
+benchmark_for = BENCHMARK_FOR.format
+
+FINAL_BENCHMARK_FOR = "final benchmark for `{}`"
+final_benchmark_for = FINAL_BENCHMARK_FOR.format
+
+
+HELP_OPTIONS = ("--help", "-h")
+
+
+class DefaultGroup(click.Group):
+    """Represents groups that invoke the default command
+    when the arguments do not start with the name of any other command.
+    """
+
+    def __init__(self, *args: Any, default_command: str, **keywords: Any) -> None:
+        super().__init__(*args, **keywords)
+
+        self.default_command = default_command
+
+    def parse_args(self, context: click.Context, args: List[str]) -> List[str]:
+        if not args or (args[0] not in self.commands and args[0] not in HELP_OPTIONS):
+            args = [self.default_command, *args]
+
+        return super().parse_args(context, args)
+
+
+BENCH_RUN = "run"
+
+
+@aoc.group(
+    cls=DefaultGroup,
+    default_command=BENCH_RUN,
+    help=(
+        "Benchmarks the solutions provided in the paths (see `bench run`), "
+        "or compares the benchmarks recorded in the history (see `bench compare`)."
+    ),
+    short_help="Benchmarks the solutions provided in the paths.",
+)
+@click.help_option(*HELP_OPTIONS)
+def bench() -> None:
+    pass
+
+
+@bench.command(
+    name=BENCH_RUN,
+    help=(
+        "Benchmarks the solutions provided in the paths, running them repeatedly. "
+        "Sampling is adaptive if the relative error or the budget is given. "
+        "The samples are recorded in the history, unless disabled."
+    ),
+    short_help="Benchmarks the solutions provided in the paths.",
+)
+@click.help_option("--help", "-h")
+@click.option(
+    "--rounds",
+    "-r",
+    type=click.IntRange(min=1),
+    default=DEFAULT_ROUNDS,
+    show_default=True,
+    help="The (minimum) amount of rounds.",
+)
+@click.option(
+    "--warmup",
+    "-w",
+    type=click.IntRange(min=0),
+    default=DEFAULT_WARMUP,
+    show_default=True,
+    help="The amount of warmup rounds.",
+)
+@click.option(
+    "--relative-error",
+    "-e",
+    type=click.FloatRange(min=0.0, min_open=True),
+    default=None,
+    help="The target relative standard error of the mean (adaptive).",
+)
+@click.option(
+    "--budget",
+    "-b",
+    type=click.FloatRange(min=0.0, min_open=True),
+    default=None,
+    help="The time budget for each solution, in seconds (adaptive).",
+)
+@click.option(
+    "--limit",
+    "-l",
+    type=click.IntRange(min=1),
+    default=DEFAULT_LIMIT,
+    show_default=True,
+    help="The maximum amount of rounds (adaptive).",
+)
+@click.option(
+    "--measure",
+    "-M",
+    type=click.Choice([measure.value for measure in Measure]),
+    default=Measure.WALL.value,
+    show_default=True,
+    help="The measure of time to compute statistics over.",
+)
+@click.option(
+    "--data-path",
+    "-D",
+    type=Path,
+    default=DATA_PATH,
+    show_default=True,
+    help="The path to the data cache directory.",
+)
+@click.option(
+    "--history-path",
+    "-H",
+    type=Path,
+    default=HISTORY_PATH,
+    show_default=True,
+    help="The path to the benchmark history database.",
+)
+@click.option("--no-history", is_flag=True, help="Whether to not record the benchmarks.")
+@click.argument("paths", type=Path, nargs=ALL)
+def bench_run(
+    rounds: int,
+    warmup: int,
+    relative_error: Optional[float],
+    budget: Optional[float],
+    limit: int,
+    measure: str,
+    data_path: Path,
+    history_path: Path,
+    no_history: bool,
+    paths: DynamicTuple[Path],
+) -> None:
+    runner = Runner()
+
+    history = None if no_history else History(history_path)
 
     for path in paths:
         try:
-            results = runner.run_path(path, data_path)
+            benchmarks = runner.benchmark_path(
+                path,
+                data_path,
+                rounds=rounds,
+                warmup=warmup,
+                relative_error=relative_error,
+                budget=budget,
+                limit=limit,
+                measure=Measure(measure),
+            )
 
         except DataNotFound as data_not_found:
             click.echo(solution_data_not_found(path, data_not_found), err=True)
 
             continue
 
-        except Panic as panic:
-            click.echo(solution_panicked(path, panic), err=True)
-            continue
-
         except NormalError as error:
             click.echo(solution_errored(path, error), err=True)
             continue
 
-        for key, result in results.results.items():
-            click.echo(result_for(key))
+        except BaseException as error:
+            if not is_panic(error):
+                raise
+
+            click.echo(solution_panicked(path, error), err=True)
+            continue
+
+        for key, benchmark in benchmarks.benchmarks.items():
+            click.echo(benchmark_for(key))
+
+            print_benchmark(benchmark)
+
+        for key, final_benchmark in benchmarks.final_benchmarks.items():
+            click.echo(final_benchmark_for(key))
+
+            print_final_benchmark(final_benchmark)
+
+        if history is not None:
+            commit = get_commit(path.parent.resolve())
+
+            history.append(benchmarks, commit, measure=Measure(measure))
+
+
+COMPARISON = "`{}` {}: {} -> {} (x{}, p = {})"
+comparison_string = COMPARISON.format
+
+REGRESSED = "regressed {}"
+regressed_string = REGRESSED.format
+
+NO_BASELINE = "no baseline for `{}` {}"
+no_baseline = NO_BASELINE.format
 
-            print_result(result)
+NO_RECORDS = "no records found"
 
-            if submit:
-                run_coroutine(submit_result(result, key, client))
+REGRESSIONS = "found {} regression(s)"
+regressions_string = REGRESSIONS.format
 
-        for key, final_result in results.final_results.items():
-            click.echo(final_result_for(key))
+RATIO_ROUNDING = 2
+P_VALUE_DIGITS = 3
 
-            print_final_result(final_result)
 
-            if submit:
-                run_coroutine(submit_final_result(final_result, key, client))
+def format_comparison(key: Key, phase: Phase, comparison: Comparison) -> str:
+    return comparison_string(
+        key,
+        phase.value,
+        comparison.baseline.statistics.median,
+        comparison.current.statistics.median,
+        round(comparison.ratio, RATIO_ROUNDING),
+        format(comparison.p_value, f".{P_VALUE_DIGITS}g"),
+    )
+
+
+@bench.command(
+    help=(
+        "Compares the latest benchmarks recorded in the history to the baseline ones "
+        "(taken on the same machine), exiting with the non-zero code on regressions. "
+        "By default, the baseline is the previous run of every phase."
+    ),
+    short_help="Compares the benchmarks recorded in the history.",
+)
+@click.help_option("--help", "-h")
+@click.option(
+    "--baseline",
+    "-B",
+    type=str,
+    default=None,
+    help="The (prefix of the) git commit to take the baseline at.",
+)
+@click.option(
+    "--commit",
+    "-c",
+    type=str,
+    default=None,
+    help="The (prefix of the) git commit to compare (defaults to the latest run).",
+)
+@click.option(
+    "--significance",
+    "-s",
+    type=click.FloatRange(min=0.0, max=1.0, min_open=True, max_open=True),
+    default=DEFAULT_SIGNIFICANCE,
+    show_default=True,
+    help="The significance level of the regression test.",
+)
+@click.option(
+    "--threshold",
+    "-t",
+    type=click.FloatRange(min=0.0),
+    default=DEFAULT_THRESHOLD,
+    show_default=True,
+    help="The minimum relative slowdown of the median considered a regression.",
+)
+@click.option(
+    "--measure",
+    "-M",
+    type=click.Choice([measure.value for measure in Measure]),
+    default=Measure.WALL.value,
+    show_default=True,
+    help="The measure of time to compare.",
+)
+@click.option(
+    "--history-path",
+    "-H",
+    type=Path,
+    default=HISTORY_PATH,
+    show_default=True,
+    help="The path to the benchmark history database.",
+)
+def compare(
+    baseline: Optional[str],
+    commit: Optional[str],
+    significance: float,
+    threshold: float,
+    measure: str,
+    history_path: Path,
+) -> None:
+    history = History(history_path)
+
+    machine = get_machine()
+
+    time_measure = Measure(measure)
+
+    phases = history.phases(machine, time_measure)
+
+    if not phases:
+        click.echo(NO_RECORDS, err=True)
+
+        return
+
+    regressions = 0
+
+    for key, phase in phases:
+        current_record = history.latest(key, phase, machine, time_measure, commit)
+
+        if current_record is None:
+            continue
+
+        baseline_record = history.latest(
+            key,
+            phase,
+            machine,
+            time_measure,
+            baseline,
+            before=None if baseline is not None else current_record.run,
+        )
+
+        if baseline_record is None:
+            click.echo(no_baseline(key, phase.value), err=True)
+
+            continue
+
+        comparison = compare_records(
+            baseline_record, current_record, significance=significance, threshold=threshold
+        )
+
+        string = format_comparison(key, phase, comparison)
+
+        if comparison.regressed:
+            regressions += 1
+
+            click.echo(regressed_string(string), err=True)
+
+        else:
+            click.echo(string)
+
+    if regressions:
+        click.echo(regressions_string(regressions), err=True)
+
+        exit(ERROR)
 
 
 NO_PROBLEM = "no problem"
@@ -228,6 +1284,8 @@ def today() -> None:
 )
 @click.help_option("--help", "-h")
 def show() -> None:
+    from aoc.time import aoc_today, get_key_for_date
+
     today = aoc_today()
 
     try:
@@ -260,7 +1318,18 @@ FAILED_TO_DOWNLOAD_CURRENT = "failed to download the current problem data"
     ),
 )
 @click.help_option("--help", "-h")
-@click.option("--save", "-s", is_flag=True, help="Whether to save the data to cache.")
+@click.option(
+    "--save",
+    "-s",
+    is_flag=True,
+    help="Whether to only save the data to cache, without printing it.",
+)
+@click.option(
+    "--force",
+    "-f",
+    is_flag=True,
+    help="Whether to revalidate cached data (downloading it again only if it changed).",
+)
 @click.option(
     "--data-path",
     "-D",
@@ -277,7 +1346,12 @@ FAILED_TO_DOWNLOAD_CURRENT = "failed to download the current problem data"
     show_default=True,
     help="The path to the token file.",
 )
-def download_today(save: bool, data_path: Path, token_path: Path) -> None:
+def download_today(save: bool, force: bool, data_path: Path, token_path: Path) -> None:
+    from aiohttp import ClientError
+
+    from aoc.http import HTTPClient
+    from aoc.time import aoc_today, get_key_for_date
+
     token = find_token(token_path)
 
     today = aoc_today()
@@ -290,21 +1364,18 @@ def download_today(save: bool, data_path: Path, token_path: Path) -> None:
 
         exit(ERROR)
 
-    client = HTTPClient(token)
+    source = DataSource(HTTPClient(token), data_path)
 
     try:
-        data = run_coroutine(client.download_data(key))
+        fetched = run_coroutine(source.get(key, force))
 
     except ClientError:
         click.echo(FAILED_TO_DOWNLOAD_CURRENT)
 
         exit(ERROR)
 
-    if save:
-        dump_data(data, key, data_path)
-
-    else:
-        click.echo(data)
+    if not save:
+        click.echo(fetched.data)
 
 
 SUBMIT = "submit"
@@ -328,8 +1399,29 @@ SUBMIT = "submit"
     show_default=True,
     help="The path to the token file.",
 )
+@click.option(
+    "--submissions-path",
+    "-Q",
+    type=Path,
+    default=SUBMISSIONS_PATH,
+    show_default=True,
+    help="The path to the queue of answers pending resubmission.",
+)
+@click.option(
+    "--wait",
+    "-w",
+    is_flag=True,
+    help="Whether to wait and resubmit the answer if it was submitted too recently.",
+)
 @click.argument("answer", type=str)
-def submit_today(part: int, token_path: Path, answer: str) -> None:
+def submit_today(
+    part: int, token_path: Path, submissions_path: Path, wait: bool, answer: str
+) -> None:
+    from aiohttp import ClientError
+
+    from aoc.http import HTTPClient
+    from aoc.time import aoc_today, get_key_for_date
+
     token = find_token(token_path)
 
     part_enum = get_part(part)
@@ -346,15 +1438,17 @@ def submit_today(part: int, token_path: Path, answer: str) -> None:
 
     client = HTTPClient(token)
 
+    queue = SubmissionQueue(submissions_path)
+
     try:
-        state = run_coroutine(client.submit_answer(key, part_enum, answer))
+        reply = run_coroutine(submit_answer(client, queue, key, part_enum, answer))
 
     except ClientError as client_error:
         click.echo(client_error, err=True)
 
         exit(ERROR)
 
-    click.echo(state.message)
+    print_reply(client, queue, reply, wait)
 
 
 @aoc.group(
@@ -428,24 +1522,28 @@ def remove(path: Path) -> None:
     remove_token(path)
 
 
-def get_key(year_value: int, day_value: int) -> Key:
+def get_year(year_value: int) -> Year:
     try:
-        year = Year(year_value)
+        return Year(year_value)
 
     except ValueError as invalid_year:
         click.echo(invalid_year, err=True)
 
         exit(ERROR)
 
+
+def get_day(day_value: int) -> Day:
     try:
-        day = Day(day_value)
+        return Day(day_value)
 
     except ValueError as invalid_day:
         click.echo(invalid_day, err=True)
 
         exit(ERROR)
 
-    return Key(year, day)
+
+def get_key(year_value: int, day_value: int) -> Key:
+    return Key(get_year(year_value), get_day(day_value))
 
 
 def get_part(part_value: int) -> Part:
@@ -466,14 +1564,69 @@ FAILED_TO_DOWNLOAD = "failed to download data for problem `{}`"
 failed_to_download = FAILED_TO_DOWNLOAD.format
 
 
+YEARS = ".."
+
+INVALID_YEARS = "invalid year range `{}`"
+invalid_years = INVALID_YEARS.format
+
+
+def get_years(string: str) -> List[Year]:
+    first_string, separator, last_string = string.partition(YEARS)
+
+    try:
+        first = int(first_string)
+        last = int(last_string) if separator else first
+
+    except ValueError:
+        click.echo(invalid_years(string), err=True)
+
+        exit(ERROR)
+
+    if first > last:
+        click.echo(invalid_years(string), err=True)
+
+        exit(ERROR)
+
+    return [get_year(value) for value in range(first, last + 1)]
+
+
+DOWNLOADED = "downloaded data for problem `{}`"
+downloaded = DOWNLOADED.format
+
+
 @aoc.command(
     short_help="Download the input from the Advent of Code server.",
-    help="Download the input from the Advent of Code server.",
+    help=(
+        "Download the input from the Advent of Code server. "
+        "Inputs are served from the cache if present, and cached when downloaded. "
+        "The year can be given as the range (for instance, `2015..2023`); "
+        "when several problems are requested, the inputs missing from the cache "
+        "are downloaded concurrently and saved as they arrive."
+    ),
 )
 @click.help_option("--help", "-h")
-@click.option("--year", "-y", type=int, required=True, prompt=True, help="The year of the problem.")
-@click.option("--day", "-d", type=int, required=True, prompt=True, help="The day of the problem.")
-@click.option("--save", "-s", is_flag=True, help="Whether to save the data to cache.")
+@click.option(
+    "--year",
+    "-y",
+    "year_string",
+    required=True,
+    prompt="Year",
+    help="The year (or the range of years, like `2015..2023`) of the problem.",
+)
+@click.option("--day", "-d", type=int, default=None, help="The day of the problem.")
+@click.option("--all", "-a", "all_days", is_flag=True, help="Whether to download all days.")
+@click.option(
+    "--save",
+    "-s",
+    is_flag=True,
+    help="Whether to only save the data to cache, without printing it.",
+)
+@click.option(
+    "--force",
+    "-f",
+    is_flag=True,
+    help="Whether to revalidate cached data (downloading it again only if it changed).",
+)
 @click.option(
     "--data-path",
     "-D",
@@ -490,26 +1643,108 @@ failed_to_download = FAILED_TO_DOWNLOAD.format
     show_default=True,
     help="The path to the token file.",
 )
-def download(year: int, day: int, save: bool, data_path: Path, token_path: Path) -> None:
+@click.option(
+    "--concurrency",
+    "-c",
+    type=click.IntRange(min=1),
+    default=DEFAULT_DOWNLOAD_CONCURRENCY,
+    show_default=True,
+    help="The maximum number of simultaneous downloads.",
+)
+@click.option(
+    "--rate",
+    "-r",
+    type=click.FloatRange(min=0.0, min_open=True),
+    default=DEFAULT_DOWNLOAD_RATE,
+    show_default=True,
+    help="The maximum average number of downloads started per second.",
+)
+@click.option(
+    "--burst",
+    "-b",
+    type=click.IntRange(min=1),
+    default=DEFAULT_DOWNLOAD_BURST,
+    show_default=True,
+    help="The maximum number of downloads started at once.",
+)
+def download(
+    year_string: str,
+    day: Optional[int],
+    all_days: bool,
+    save: bool,
+    force: bool,
+    data_path: Path,
+    token_path: Path,
+    concurrency: int,
+    rate: float,
+    burst: int,
+) -> None:
+    from aiohttp import ClientError
+
+    from aoc.http import HTTPClient
+
     token = find_token(token_path)
 
-    key = get_key(year, day)
+    years = get_years(year_string)
+
+    if all_days:
+        days = [Day(value) for value in range(FIRST_DAY, LAST_DAY + 1)]
+
+    else:
+        if day is None:
+            day = click.prompt("Day", type=int)
+
+        days = [get_day(day)]
+
+    keys = [Key(year, day) for year in years for day in days]
 
     client = HTTPClient(token)
 
+    if len(keys) > 1:
+        download_many(client, keys, data_path, force, concurrency, rate, burst)
+
+        return
+
+    (key,) = keys
+
+    source = DataSource(client, data_path)
+
     try:
-        data = run_coroutine(client.download_data(key))
+        fetched = run_coroutine(source.get(key, force))
 
     except ClientError:
         click.echo(failed_to_download(key), err=True)
 
         exit(ERROR)
 
-    if save:
-        dump_data(data, key, data_path)
+    if not save:
+        click.echo(fetched.data)
 
-    else:
-        click.echo(data)
+
+def download_many(
+    client: HTTPClient,
+    keys: List[Key],
+    data_path: Path,
+    force: bool,
+    concurrency: int,
+    rate: float,
+    burst: int,
+) -> None:
+    downloader = Downloader(
+        client, data_path, concurrency=concurrency, bucket=TokenBucket(rate, burst)
+    )
+
+    for key in run_coroutine(downloader.download_missing(keys, force)):
+        click.echo(downloaded(key))
+
+    failures = downloader.failures
+
+    for key in keys:
+        if key in failures:
+            click.echo(failed_to_download(key), err=True)
+
+    if failures:
+        exit(ERROR)
 
 
 FAILED_TO_SUBMIT = "failed to submit the answer for problem `{}` part `{}`"
@@ -532,20 +1767,104 @@ failed_to_submit = FAILED_TO_SUBMIT.format
     show_default=True,
     help="The path to the token file.",
 )
+@click.option(
+    "--submissions-path",
+    "-Q",
+    type=Path,
+    default=SUBMISSIONS_PATH,
+    show_default=True,
+    help="The path to the queue of answers pending resubmission.",
+)
+@click.option(
+    "--wait",
+    "-w",
+    is_flag=True,
+    help="Whether to wait and resubmit the answer if it was submitted too recently.",
+)
 @click.argument("answer", type=str)
-def submit(year: int, day: int, part: int, token_path: Path, answer: str) -> None:
+def submit(
+    year: int,
+    day: int,
+    part: int,
+    token_path: Path,
+    submissions_path: Path,
+    wait: bool,
+    answer: str,
+) -> None:
+    from aiohttp import ClientError
+
+    from aoc.http import HTTPClient
+
     token = find_token(token_path)
 
     key, part_enum = get_key_part_pair(year, day, part)
 
     client = HTTPClient(token)
 
+    queue = SubmissionQueue(submissions_path)
+
     try:
-        state = run_coroutine(client.submit_answer(key, part_enum, answer))
+        reply = run_coroutine(submit_answer(client, queue, key, part_enum, answer))
 
     except ClientError:
         click.echo(failed_to_submit(key, part_enum.value), err=True)
 
         exit(ERROR)
 
-    click.echo(state.message)
+    print_reply(client, queue, reply, wait)
+
+
+def print_reply(client: HTTPClient, queue: SubmissionQueue, reply: Reply, wait: bool) -> None:
+    click.echo(reply.state.message)
+
+    if reply.state is State.TIMEOUT:
+        click.echo(queued(get_wait(reply)))
+
+        if wait:
+            resubmit_pending(client, queue, parts=queue.pushed)
+
+
+NO_PENDING = "no answers are pending resubmission"
+
+
+@aoc.command(
+    short_help="Resubmit the answers that were submitted too recently.",
+    help=(
+        "Resubmit the answers that were submitted too recently (and thus queued), "
+        "as soon as the cooldowns expire. This includes answers queued by earlier runs, "
+        "and blocks until all of them are resubmitted (unless `--no-wait` is given)."
+    ),
+)
+@click.help_option("--help", "-h")
+@click.option(
+    "--token-path",
+    "-T",
+    type=Path,
+    default=TOKEN_PATH,
+    show_default=True,
+    help="The path to the token file.",
+)
+@click.option(
+    "--submissions-path",
+    "-Q",
+    type=Path,
+    default=SUBMISSIONS_PATH,
+    show_default=True,
+    help="The path to the queue of answers pending resubmission.",
+)
+@click.option(
+    "--wait/--no-wait",
+    "-w/-W",
+    default=True,
+    show_default=True,
+    help="Whether to wait for the answers that are not due yet.",
+)
+def resubmit(token_path: Path, submissions_path: Path, wait: bool) -> None:
+    queue = SubmissionQueue(submissions_path)
+
+    if not queue:
+        click.echo(NO_PENDING)
+
+        return
+
+    resubmit_pending(create_client(token_path), queue, wait=wait)
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+from fnmatch import fnmatch
+from itertools import islice
+from sys import platform, version_info
+from typing import TYPE_CHECKING, Callable, Final, List, Optional, Tuple, TypeVar, final
+
+from attrs import field, frozen
+
+from aoc import timers
+from aoc.constants import DEFAULT_ROUNDING, DEFAULT_TOP
+
+if TYPE_CHECKING:
+    import tracemalloc
+
+__all__ = ("Size", "Allocation", "Memory", "Tracker")
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+FACTORS: Final = (("GiB", 1 << 30), ("MiB", 1 << 20), ("KiB", 1 << 10))
+BYTES: Final = "B"
+
+DARWIN = "darwin"
+
+KIBIBYTE = 1 << 10
+
+MAXIMUM_RSS_SCALE = 1 if platform == DARWIN else KIBIBYTE  # `ru_maxrss` is in KiB on Linux
+
+LOCATION = "{}:{}"
+location = LOCATION.format
+
+EXCLUDED = (  # exclude allocations made by tracking, timing, profiling and importing
+    __file__,
+    timers.__file__,
+    "*/tracemalloc.py",
+    "*/cProfile.py",
+    "*/profile.py",
+    "*/pstats.py",
+    "*/importlib/_bootstrap*.py",
+    "*/_distutils_hack/*",
+    "<frozen *>",
+    "<unknown>",
+)
+"""The filename patterns of allocations excluded, matched like [`Filter`][tracemalloc.Filter]."""
+
+LINE_NUMBER = "lineno"
+
+RESET_PEAK_VERSION = (3, 9)
+
+
+@final
+@frozen()
+class Size:
+    """Represents memory sizes, in bytes and human-readable format."""
+
+    bytes: int = field()
+    """The size, in bytes."""
+
+    rounding: int = field(default=DEFAULT_ROUNDING)
+    """The rounding to use when converting to human-readable format."""
+
+    string: str = field(init=False)
+    """The size, in human-readable format."""
+
+    @string.default
+    def default_string(self) -> str:
+        bytes = self.bytes
+
+        for name, factor in FACTORS:
+            if bytes >= factor:
+                return str(round(bytes / factor, self.rounding)) + name
+
+        return str(bytes) + BYTES
+
+    def __str__(self) -> str:
+        return self.string
+
+
+@final
+@frozen()
+class Allocation:
+    """Represents lines that allocated memory."""
+
+    location: str
+    """The location of the line (`path:line`)."""
+
+    size: Size
+    """The memory allocated by the line and still alive at the end of the phase."""
+
+    count: int
+    """The number of memory blocks allocated by the line."""
+
+
+@final
+@frozen()
+class Memory:
+    """Represents memory usage of phases of solutions."""
+
+    peak: Size
+    """The peak memory traced during the phase."""
+
+    rss: Optional[Size]
+    """The growth of the maximum resident set size during the phase, including the overhead
+    of tracing ([`None`][None] if not supported on the platform).
+    """
+
+    allocations: List[Allocation]
+    """The top allocating lines, largest first."""
+
+
+def get_maximum_rss() -> Optional[int]:
+    try:
+        from resource import RUSAGE_SELF, getrusage
+
+    except ImportError:  # pragma: no cover  # not on Unix
+        return None
+
+    return getrusage(RUSAGE_SELF).ru_maxrss * MAXIMUM_RSS_SCALE
+
+
+def is_excluded(filename: str) -> bool:
+    return any(fnmatch(filename, pattern) for pattern in EXCLUDED)
+
+
+def create_allocation(statistic: tracemalloc.Statistic) -> Allocation:
+    frame = statistic.traceback[0]
+
+    return Allocation(location(frame.filename, frame.lineno), Size(statistic.size), statistic.count)
+
+
+@final
+@frozen()
+class Tracker:
+    """Represents trackers of memory usage of phases of solutions.
+
+    Memory is traced using [`tracemalloc`][tracemalloc], which slows the traced code down,
+    so the times measured while tracking are inflated.
+    """
+
+    top: int = DEFAULT_TOP
+    """The amount of top allocating lines to record."""
+
+    def call(self, function: Callable[[T], R], argument: T) -> Tuple[R, Memory]:
+        """Calls the `function` with the `argument`, tracking its memory usage.
+
+        If [`tracemalloc`][tracemalloc] is already tracing, it is left running,
+        and only the peak is reset (on Python 3.9 and above).
+
+        Arguments:
+            function: The function to call.
+            argument: The argument to pass.
+
+        Returns:
+            The value returned by the `function` and its memory usage.
+        """
+        import tracemalloc
+
+        tracing = tracemalloc.is_tracing()
+
+        if tracing:
+            if version_info >= RESET_PEAK_VERSION:
+                tracemalloc.reset_peak()
+
+        else:
+            tracemalloc.start()
+
+        maximum_rss = get_maximum_rss()
+
+        try:
+            value = function(argument)
+
+            _, peak = tracemalloc.get_traced_memory()
+
+            snapshot = tracemalloc.take_snapshot()
+
+        finally:
+            if not tracing:
+                tracemalloc.stop()
+
+        after_maximum_rss = get_maximum_rss()
+
+        rss = (
+            None
+            if maximum_rss is None or after_maximum_rss is None
+            else Size(after_maximum_rss - maximum_rss)
+        )
+
+        # grouping by lines first is much faster than filtering every trace
+        statistics = (
+            statistic
+            for statistic in snapshot.statistics(LINE_NUMBER)
+            if not is_excluded(statistic.traceback[0].filename)
+        )
+
+        allocations = [create_allocation(statistic) for statistic in islice(statistics, self.top)]
+
+        return (value, Memory(Size(peak), rss, allocations))
@@ -0,0 +1,140 @@
+from ast import Import, ImportFrom, parse, walk
+from hashlib import sha256
+from pathlib import Path
+from sys import version as python_version
+from typing import Iterable, Iterator, List, Optional
+
+from aoc.constants import DEFAULT_ENCODING
+
+__all__ = ("find_imports", "find_local_modules", "hash_module")
+
+DOT = "."
+
+PYTHON_SUFFIX = ".py"
+INIT = "__init__"
+
+INIT_PATH = INIT + PYTHON_SUFFIX
+
+
+def find_imports(source: str) -> Iterator[str]:
+    """Finds the names of modules imported in the `source`.
+
+    Both `import module` and `from module import name` forms are found; in the latter case,
+    `module.name` is yielded as well, since `name` can be a submodule.
+
+    Relative imports are ignored.
+
+    Arguments:
+        source: The source code to search.
+
+    Returns:
+        The iterator over names of modules imported.
+
+    Raises:
+        SyntaxError: The `source` is not valid Python code.
+    """
+    for node in walk(parse(source)):
+        if isinstance(node, Import):
+            for alias in node.names:
+                yield alias.name
+
+        if isinstance(node, ImportFrom):
+            module = node.module
+
+            if node.level or module is None:
+                continue
+
+            yield module
+
+            for alias in node.names:
+                yield module + DOT + alias.name
+
+
+def resolve_module(name: str, roots: Iterable[Path]) -> Optional[Path]:
+    parts = name.split(DOT)
+
+    for root in roots:
+        base = root.joinpath(*parts)
+
+        module = base.with_name(base.name + PYTHON_SUFFIX)
+
+        if module.is_file():
+            return module
+
+        package = base / INIT_PATH
+
+        if package.is_file():
+            return package
+
+    return None
+
+
+def find_local_modules(path: Path) -> List[Path]:
+    """Finds local modules imported by the module at `path`, recursively.
+
+    Modules are considered local if they can be found in the directory of the module
+    or in the current working directory. Third-party modules are never searched for.
+
+    Modules that can not be read or parsed are skipped.
+
+    Arguments:
+        path: The path to the module.
+
+    Returns:
+        The paths to the local modules, sorted (excluding the module itself).
+    """
+    roots = (path.parent.resolve(), Path.cwd())
+
+    origin = path.resolve()
+
+    seen = {origin}
+    stack = [origin]
+
+    while stack:
+        current = stack.pop()
+
+        try:
+            source = current.read_text(DEFAULT_ENCODING)
+
+            names = list(find_imports(source))
+
+        except (OSError, SyntaxError, ValueError):
+            continue
+
+        for name in names:
+            module = resolve_module(name, roots)
+
+            if module is None:
+                continue
+
+            module = module.resolve()
+
+            if module not in seen:
+                seen.add(module)
+                stack.append(module)
+
+    seen.discard(origin)
+
+    return sorted(seen)
+
+
+def hash_module(path: Path) -> str:
+    """Hashes the source of the module at `path` along with its local modules
+    (see [`find_local_modules`][aoc.modules.find_local_modules]) and the Python version.
+
+    Arguments:
+        path: The path to the module.
+
+    Returns:
+        The hex digest of the hash.
+
+    Raises:
+        OSError: The module could not be read.
+    """
+    hasher = sha256(python_version.encode(DEFAULT_ENCODING))
+
+    for module in (path, *find_local_modules(path)):
+        hasher.update(str(module.resolve()).encode(DEFAULT_ENCODING))
+        hasher.update(module.read_bytes())
+
+    return hasher.hexdigest()
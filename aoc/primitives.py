@@ -7,7 +7,7 @@ from attrs import Attribute, field, frozen
 
 from aoc.constants import FIRST_DAY, FIRST_YEAR, LAST_DAY
 
-__all__ = ("Year", "Day", "Key", "Part")
+__all__ = ("Year", "Day", "Key", "Part", "Phase")
 
 EXPECTED_YEAR = f"expected `year >= {FIRST_YEAR}`"
 
@@ -93,3 +93,19 @@ class Part(Enum):
 
     ONLY = ONE
     """The only part of the problem."""
+
+
+class Phase(Enum):
+    """The phase of the solution."""
+
+    PARSE = "parse"
+    """Parsing the data."""
+
+    SOLVE = "solve"
+    """Solving the problem (for final solutions)."""
+
+    SOLVE_ONE = "solve_one"
+    """Solving part one of the problem."""
+
+    SOLVE_TWO = "solve_two"
+    """Solving part two of the problem."""
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, List, final
+
+from attrs import frozen
+
+from aoc.constants import DEFAULT_TOP
+from aoc.primitives import Key, Phase
+from aoc.timers import Elapsed
+
+if TYPE_CHECKING:
+    from cProfile import Profile
+
+__all__ = ("Hotspot", "Profiler")
+
+SUFFIX = ".pstats"
+
+NAME = "{}-{}" + SUFFIX
+name = NAME.format
+
+LOCATION = "{}:{}({})"
+location = LOCATION.format
+
+SECOND = 1_000_000_000
+
+
+@final
+@frozen()
+class Hotspot:
+    """Represents functions found hot by the profiler."""
+
+    location: str
+    """The location of the function (`path:line(name)`)."""
+
+    calls: int
+    """The number of calls to the function."""
+
+    total_time: Elapsed
+    """The time spent in the function itself."""
+
+    cumulative_time: Elapsed
+    """The time spent in the function, including the functions it calls."""
+
+
+@final
+@frozen()
+class Profiler:
+    """Represents profilers that profile each phase of the solution separately.
+
+    Profiles are dumped into [`path`][aoc.profiles.Profiler.path] as `.pstats` files,
+    named by the key and the phase (for instance, `2015-01-parse.pstats`),
+    so that they can be loaded back by any process.
+
+    The profiles of the solution are cleared whenever it is executed, so that phases
+    which did not run do not leave stale profiles behind. The times of profiled phases
+    include the overhead of profiling, and results are marked as profiled accordingly.
+    """
+
+    path: Path
+    """The path to the directory to dump the profiles into."""
+
+    def get_path(self, key: Key, phase: Phase) -> Path:
+        """Returns the path to the profile of the `phase` of the solution for the `key`.
+
+        Arguments:
+            key: The key of the solution.
+            phase: The phase of the solution.
+
+        Returns:
+            The path to the profile.
+        """
+        return self.path / name(key, phase.value)
+
+    def clear(self, key: Key) -> None:
+        """Removes the profiles of every phase of the solution for the `key`.
+
+        Arguments:
+            key: The key of the solution.
+        """
+        for phase in Phase:
+            self.get_path(key, phase).unlink(missing_ok=True)
+
+    def dump(self, key: Key, phase: Phase, profile: Profile) -> None:
+        """Dumps the `profile` of the `phase` of the solution for the `key`.
+
+        Arguments:
+            key: The key of the solution.
+            phase: The phase of the solution.
+            profile: The profile to dump.
+        """
+        path = self.get_path(key, phase)
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        profile.dump_stats(path)
+
+    def hotspots(self, key: Key, phase: Phase, top: int = DEFAULT_TOP) -> List[Hotspot]:
+        """Loads the profile of the `phase` of the solution for the `key`, returning
+        the `top` functions by the time spent in them.
+
+        Arguments:
+            key: The key of the solution.
+            phase: The phase of the solution.
+            top: The amount of functions to return.
+
+        Returns:
+            The hot functions, hottest first (empty if the profile does not exist).
+        """
+        path = self.get_path(key, phase)
+
+        if not path.exists():
+            return []
+
+        from pstats import Stats
+
+        stats = Stats(str(path)).stats  # type: ignore[attr-defined]
+
+        entries = sorted(stats.items(), key=lambda item: item[1][2], reverse=True)[:top]
+
+        return [
+            Hotspot(
+                location(file, line, function),
+                calls,
+                Elapsed(round(total_time * SECOND)),
+                Elapsed(round(cumulative_time * SECOND)),
+            )
+            for (file, line, function), (_, calls, total_time, cumulative_time, _) in entries
+        ]
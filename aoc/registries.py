@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, final
+
+from attrs import define, field
+
+from aoc.primitives import Key
+
+if TYPE_CHECKING:
+    from aoc.solutions import AnyFinalSolutionType, AnySolutionType
+
+__all__ = ("Registry", "REGISTRY", "get_registry")
+
+
+@final
+@define()
+class Registry:
+    """Represents registries of solution types.
+
+    Solution types are registered on definition into the current registry
+    (see [`get_registry`][aoc.registries.get_registry]).
+
+    Multiple implementations can be registered for each key;
+    the last one registered is considered the primary one.
+    """
+
+    solutions: Dict[Key, List[AnySolutionType]] = field(factory=dict)
+    """The [`Solution`][aoc.solutions.Solution] types registered, by keys."""
+
+    final_solutions: Dict[Key, List[AnyFinalSolutionType]] = field(factory=dict)
+    """The [`FinalSolution`][aoc.solutions.FinalSolution] types registered, by keys."""
+
+    def register_solution(self, key: Key, solution_type: AnySolutionType) -> None:
+        """Registers the `solution_type` for the given `key`.
+
+        Arguments:
+            key: The key to register the solution type for.
+            solution_type: The solution type to register.
+        """
+        self.solutions.setdefault(key, []).append(solution_type)
+
+    def register_final_solution(self, key: Key, final_solution_type: AnyFinalSolutionType) -> None:
+        """Registers the `final_solution_type` for the given `key`.
+
+        Arguments:
+            key: The key to register the final solution type for.
+            final_solution_type: The final solution type to register.
+        """
+        self.final_solutions.setdefault(key, []).append(final_solution_type)
+
+    def get_solution(self, key: Key) -> Optional[AnySolutionType]:
+        """Returns the primary [`Solution`][aoc.solutions.Solution] type for the given `key`.
+
+        Arguments:
+            key: The key to get the solution type for.
+
+        Returns:
+            The solution type registered last, or [`None`][None] if there are none.
+        """
+        solution_types = self.solutions.get(key)
+
+        return solution_types[-1] if solution_types else None
+
+    def get_final_solution(self, key: Key) -> Optional[AnyFinalSolutionType]:
+        """Returns the primary [`FinalSolution`][aoc.solutions.FinalSolution] type
+        for the given `key`.
+
+        Arguments:
+            key: The key to get the final solution type for.
+
+        Returns:
+            The final solution type registered last, or [`None`][None] if there are none.
+        """
+        final_solution_types = self.final_solutions.get(key)
+
+        return final_solution_types[-1] if final_solution_types else None
+
+    def primary_solutions(self) -> Dict[Key, AnySolutionType]:
+        """Returns the primary [`Solution`][aoc.solutions.Solution] types, by keys.
+
+        Returns:
+            The primary solution types.
+        """
+        return {key: types[-1] for key, types in self.solutions.items() if types}
+
+    def primary_final_solutions(self) -> Dict[Key, AnyFinalSolutionType]:
+        """Returns the primary [`FinalSolution`][aoc.solutions.FinalSolution] types, by keys.
+
+        Returns:
+            The primary final solution types.
+        """
+        return {key: types[-1] for key, types in self.final_solutions.items() if types}
+
+    def retain(self, predicate: Callable[[type], bool]) -> None:
+        """Retains only the solution types satisfying the `predicate`.
+
+        Arguments:
+            predicate: The predicate to check solution types with.
+        """
+        for solution_types in self.solutions.values():
+            solution_types[:] = filter(predicate, solution_types)
+
+        for final_solution_types in self.final_solutions.values():
+            final_solution_types[:] = filter(predicate, final_solution_types)
+
+    def clear(self) -> None:
+        """Removes all solution types from the registry."""
+        self.solutions.clear()
+        self.final_solutions.clear()
+
+    @contextmanager
+    def scope(self) -> Iterator[Registry]:
+        """Makes this registry the current one within the `with` block.
+
+        ```python
+        registry = Registry()
+
+        with registry.scope():
+            run_path(path)  # solutions defined here are registered into `registry`
+        ```
+
+        Returns:
+            The context manager yielding this registry.
+        """
+        token = CURRENT.set(self)
+
+        try:
+            yield self
+
+        finally:
+            CURRENT.reset(token)
+
+
+REGISTRY = Registry()
+"""The global registry, used when no other registry is in scope."""
+
+CURRENT: ContextVar[Registry] = ContextVar("CURRENT", default=REGISTRY)
+
+
+def get_registry() -> Registry:
+    """Returns the current registry.
+
+    Returns:
+        The registry in scope, or the global [`REGISTRY`][aoc.registries.REGISTRY].
+    """
+    return CURRENT.get()
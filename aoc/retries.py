@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from random import random
+from typing import Callable, FrozenSet, Optional, final
+
+from attrs import Attribute, field, frozen
+
+from aoc.constants import (
+    DEFAULT_BACKOFF,
+    DEFAULT_BACKOFF_FACTOR,
+    DEFAULT_BACKOFF_MAXIMUM,
+    DEFAULT_DEADLINE,
+    DEFAULT_JITTER,
+)
+
+__all__ = ("RETRYABLE_STATUSES", "RetryPolicy", "parse_retry_after")
+
+RETRYABLE_STATUSES = frozenset((408, 425, 429, 500, 502, 503, 504))
+"""The HTTP statuses of responses that are worth retrying."""
+
+EXPECTED_BACKOFF = "expected `backoff >= 0`"
+EXPECTED_FACTOR = "expected `factor >= 1`"
+EXPECTED_JITTER = "expected `0 <= jitter <= 1`"
+
+
+def parse_retry_after(value: Optional[str], now: Optional[datetime] = None) -> Optional[float]:
+    """Parses the `Retry-After` header `value`.
+
+    The header can either contain the amount of seconds or the HTTP date to retry after.
+
+    Arguments:
+        value: The value of the header, if any.
+        now: The current time (defaults to the actual one), used for HTTP dates.
+
+    Returns:
+        The delay to retry after, in seconds, or [`None`][None] if the header
+        is missing or invalid.
+    """
+    if value is None:
+        return None
+
+    value = value.strip()
+
+    if value.isdigit():
+        return float(value)
+
+    try:
+        date = parsedate_to_datetime(value)
+
+    except (TypeError, ValueError):
+        return None
+
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+
+    if now is None:
+        now = datetime.now(timezone.utc)
+
+    return max((date - now).total_seconds(), 0.0)
+
+
+@final
+@frozen()
+class RetryPolicy:
+    """Represents policies of retrying failed requests.
+
+    Delays between retries grow exponentially, starting from
+    [`backoff`][aoc.retries.RetryPolicy.backoff] and multiplied by
+    [`factor`][aoc.retries.RetryPolicy.factor] each time, up to
+    [`maximum`][aoc.retries.RetryPolicy.maximum]. The
+    [`jitter`][aoc.retries.RetryPolicy.jitter] fraction of each delay is randomized,
+    so that clients failing together do not retry together.
+
+    Delays requested by servers via `Retry-After` take precedence, and no retries are made
+    past the [`deadline`][aoc.retries.RetryPolicy.deadline].
+
+    Only responses with [`statuses`][aoc.retries.RetryPolicy.statuses] are retried;
+    other errors (for instance, `400` and `404`) will not go away by retrying.
+    """
+
+    backoff: float = field(default=DEFAULT_BACKOFF)
+    """The delay before the first retry, in seconds."""
+
+    factor: float = field(default=DEFAULT_BACKOFF_FACTOR)
+    """The factor to multiply the delay by on each retry."""
+
+    maximum: float = field(default=DEFAULT_BACKOFF_MAXIMUM)
+    """The maximum delay between retries, in seconds."""
+
+    jitter: float = field(default=DEFAULT_JITTER)
+    """The fraction of delays that is randomized (`0` means no jitter)."""
+
+    deadline: Optional[float] = field(default=DEFAULT_DEADLINE)
+    """The maximum total time spent on the request, in seconds ([`None`][None] means no limit)."""
+
+    statuses: FrozenSet[int] = field(default=RETRYABLE_STATUSES)
+    """The HTTP statuses of responses to retry."""
+
+    random: Callable[[], float] = field(default=random, repr=False, eq=False)
+    """The function returning random numbers in `[0, 1)` range, used for jitter."""
+
+    @backoff.validator
+    def check_backoff(self, attribute: Attribute[float], backoff: float) -> None:
+        if backoff < 0.0:
+            raise ValueError(EXPECTED_BACKOFF)
+
+    @factor.validator
+    def check_factor(self, attribute: Attribute[float], factor: float) -> None:
+        if factor < 1.0:
+            raise ValueError(EXPECTED_FACTOR)
+
+    @jitter.validator
+    def check_jitter(self, attribute: Attribute[float], jitter: float) -> None:
+        if not 0.0 <= jitter <= 1.0:
+            raise ValueError(EXPECTED_JITTER)
+
+    def is_retryable(self, status: int) -> bool:
+        """Checks whether responses with the given `status` should be retried.
+
+        Arguments:
+            status: The HTTP status of the response.
+
+        Returns:
+            Whether to retry.
+        """
+        return status in self.statuses
+
+    def get_backoff(self, attempt: int) -> float:
+        """Computes the delay before retrying the `attempt`, including jitter.
+
+        Arguments:
+            attempt: The number of the failed attempt (starting from `0`).
+
+        Returns:
+            The delay, in seconds.
+        """
+        delay = min(self.backoff * self.factor**attempt, self.maximum)
+
+        return delay * (1.0 - self.jitter * self.random())
+
+    def get_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Computes the delay before retrying the `attempt`.
+
+        Arguments:
+            attempt: The number of the failed attempt (starting from `0`).
+            retry_after: The delay requested by the server, if any
+                (see [`parse_retry_after`][aoc.retries.parse_retry_after]).
+
+        Returns:
+            The delay, in seconds.
+        """
+        if retry_after is None:
+            return self.get_backoff(attempt)
+
+        return retry_after
+
+    def get_remaining(self, elapsed: float) -> Optional[float]:
+        """Computes the time left until the deadline.
+
+        Arguments:
+            elapsed: The time spent on the request so far, in seconds.
+
+        Returns:
+            The time left, in seconds, or [`None`][None] if there is no deadline.
+        """
+        deadline = self.deadline
+
+        return None if deadline is None else deadline - elapsed
+
+    def allows(self, elapsed: float, delay: float) -> bool:
+        """Checks whether retrying after the `delay` fits the deadline.
+
+        Arguments:
+            elapsed: The time spent on the request so far, in seconds.
+            delay: The delay before retrying, in seconds.
+
+        Returns:
+            Whether retrying is allowed.
+        """
+        deadline = self.deadline
+
+        return deadline is None or elapsed + delay <= deadline
@@ -1,16 +1,76 @@
+from __future__ import annotations
+
+from functools import partial
 from pathlib import Path
+from queue import Queue
 from runpy import run_path as run_python_path
-from typing import Dict, Type, final
-
-from attrs import frozen
-
-from aoc.constants import DATA_PATH
-from aoc.data import load_data
-from aoc.names import get_key_by_name
+from threading import Thread
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    final,
+)
+
+from attrs import evolve, field, frozen
+from typing_aliases import Nullary
+
+from aoc.constants import (
+    DATA_PATH,
+    DEFAULT_ENCODING,
+    DEFAULT_LIMIT,
+    DEFAULT_ROUNDS,
+    DEFAULT_WARMUP,
+)
+from aoc.discoveries import find_keys
+from aoc.inputs import InputCache
+from aoc.isolation import Failure, Limits, get_safe_context, run_isolated
+from aoc.memory import Tracker
 from aoc.primitives import Key
-from aoc.solutions import FINAL_SOLUTIONS, SOLUTIONS, AnyFinalResult, AnyResult
-
-__all__ = ("Results", "Runner", "run_path")
+from aoc.profiles import Profiler
+from aoc.registries import Registry
+from aoc.solutions import (
+    AnyBenchmark,
+    AnyFinalBenchmark,
+    AnyFinalResult,
+    AnyFinalSolutionType,
+    AnyResult,
+    AnySolutionType,
+    FinalResult,
+    Result,
+)
+from aoc.timers import Measure
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future, ProcessPoolExecutor
+
+    from aoc.caches import ResultCache
+
+__all__ = (
+    "Outcome",
+    "Item",
+    "Results",
+    "Benchmarks",
+    "Solutions",
+    "Fetch",
+    "Runner",
+    "ParallelRunner",
+    "run_path",
+    "run_paths",
+)
+
+
+Outcome = Union[AnyResult, AnyFinalResult, Failure]
+"""Represents outcomes of running solutions."""
+
+Item = Tuple[Key, Outcome]
+"""Represents keys of solutions paired with the outcomes of running them."""
 
 
 @final
@@ -24,17 +84,175 @@ class Results:
     final_results: Dict[Key, AnyFinalResult]
     """The results of running [`FinalSolution`][aoc.solutions.FinalSolution] instances."""
 
+    failures: Dict[Key, Failure] = field(factory=dict)
+    """The failures of solutions run in isolation."""
+
+    cached: bool = field(default=False)
+    """Whether the results were loaded from the cache."""
+
+    @classmethod
+    def from_items(cls, items: Iterable[Item]) -> Results:
+        """Collects the `items` into results.
+
+        Arguments:
+            items: The items to collect.
+
+        Returns:
+            The results collected.
+        """
+        results = {}
+        final_results = {}
+        failures = {}
+
+        for key, outcome in items:
+            if isinstance(outcome, Result):
+                results[key] = outcome
+
+            elif isinstance(outcome, FinalResult):
+                final_results[key] = outcome
 
-# TODO: here
+            else:
+                failures[key] = outcome
+
+        return cls(results, final_results, failures)
+
+    def iter_items(self) -> Iterator[Item]:
+        """Iterates over the results, final results and failures, in this order.
+
+        If the results were loaded from the cache, the results yielded are marked as cached.
+
+        Returns:
+            The iterator over items.
+        """
+        cached = self.cached
+
+        for key, result in self.results.items():
+            yield (key, evolve(result, cached=True) if cached else result)
+
+        for key, final_result in self.final_results.items():
+            yield (key, evolve(final_result, cached=True) if cached else final_result)
+
+        yield from self.failures.items()
+
+
+@final
+@frozen()
+class Benchmarks:
+    """Represents the benchmarks of modules."""
+
+    benchmarks: Dict[Key, AnyBenchmark]
+    """The benchmarks of [`Solution`][aoc.solutions.Solution] instances."""
+
+    final_benchmarks: Dict[Key, AnyFinalBenchmark]
+    """The benchmarks of [`FinalSolution`][aoc.solutions.FinalSolution] instances."""
+
+
+@final
+@frozen()
+class Solutions:
+    """Represents the solutions found in modules."""
+
+    solutions: Dict[Key, AnySolutionType]
+    """The [`Solution`][aoc.solutions.Solution] types found."""
+
+    final_solutions: Dict[Key, AnyFinalSolutionType]
+    """The [`FinalSolution`][aoc.solutions.FinalSolution] types found."""
+
+
+def run_keyed_solution(
+    path: Path,
+    key: Key,
+    data_path: Path,
+    profiler: Optional[Profiler] = None,
+    tracker: Optional[Tracker] = None,
+    inputs: Optional[InputCache] = None,
+) -> Optional[Union[AnyResult, AnyFinalResult]]:
+    solutions = Runner().find_solutions(path)
+
+    solution_type = solutions.solutions.get(key)
+
+    if solution_type is not None:
+        return solution_type().load_and_execute(data_path, profiler, tracker, inputs)
+
+    final_solution_type = solutions.final_solutions.get(key)
+
+    if final_solution_type is not None:
+        return final_solution_type().load_and_execute(data_path, profiler, tracker, inputs)
+
+    return None  # the class found statically is not a solution
+
+
+Fetch = Nullary[Results]
+"""Represents functions that fetch the results of running modules.
+
+Fetching the results raises any error that occured while running the module.
+"""
+
+Submission = Union[Tuple[Path, "Future[Results]"], BaseException, None]
 
 
 @frozen()
 class Runner:
     """Represents runners for python paths containing modules."""
 
+    limits: Optional[Limits] = field(default=None, kw_only=True)
+    """The limits to run each solution in isolation with.
+
+    If given, each solution is run in the separate process, along with the top-level code
+    of its module (see [`run_path_isolated`][aoc.runners.Runner.run_path_isolated]),
+    and its failures are reported in [`failures`][aoc.runners.Results.failures].
+    """
+
+    cache: Optional[ResultCache] = field(default=None, kw_only=True)
+    """The cache to load and dump the results of running modules with."""
+
+    profiler: Optional[Profiler] = field(default=None, kw_only=True)
+    """The profiler to profile each phase of solutions with.
+
+    Results are never loaded from the cache when profiling.
+    """
+
+    tracker: Optional[Tracker] = field(default=None, kw_only=True)
+    """The tracker to track memory usage of each phase of solutions with.
+
+    Results are never loaded from the cache when tracking.
+    """
+
+    inputs: Optional[InputCache] = field(default=None, kw_only=True)
+    """The cache to load parsed inputs of solutions from (and dump them to)."""
+
+    def find_solutions(self, path: Path) -> Solutions:
+        """Runs the module from the `path` and finds the solutions defined in it.
+
+        Only the solutions found in the namespace of the module are included, so that
+        solutions defined in other modules it imports (for the first time) are not.
+
+        Arguments:
+            path: The path to the module.
+
+        Returns:
+            The solutions found.
+
+        Raises:
+            AnyError: Any error that occurs while running.
+        """
+        registry = Registry()
+
+        with registry.scope():
+            namespace = run_python_path(str(path))
+
+        defined = set(map(id, namespace.values()))
+
+        registry.retain(lambda solution_type: id(solution_type) in defined)
+
+        return Solutions(registry.primary_solutions(), registry.primary_final_solutions())
+
     def run_path(self, path: Path, data_path: Path = DATA_PATH) -> Results:
         """Runs the module from the `path` and returns the results.
 
+        This is a thin wrapper around [`iter_path`][aoc.runners.Runner.iter_path]
+        that collects the results.
+
         Arguments:
             path: The path to the module.
             data_path: The path to the data directory.
@@ -45,37 +263,397 @@ class Runner:
         Raises:
             AnyError: Any error that occurs while running.
         """
-        namespace = run_python_path(str(path))
+        results = self.load_path(path, data_path)
 
-        solutions = SOLUTIONS
-        final_solutions = FINAL_SOLUTIONS
+        if results is None:
+            results = Results.from_items(self.execute_iter_path(path, data_path))
 
-        results = {}
-        final_results = {}
+        return results
 
-        for name in namespace:
-            try:
-                key = get_key_by_name(name)
+    def load_path(self, path: Path, data_path: Path = DATA_PATH) -> Optional[Results]:
+        """Loads the results of running the module from the `path` from the
+        [`cache`][aoc.runners.Runner.cache], if possible.
 
-            except TypeError:
-                pass
+        Arguments:
+            path: The path to the module.
+            data_path: The path to the data directory.
 
-            else:
-                if key in solutions:
-                    solution = solutions[key]()
+        Returns:
+            The results cached, or [`None`][None] if there are none (or the cache is bypassed).
+        """
+        cache = self.cache
+
+        if cache is None or self.profiler is not None or self.tracker is not None:
+            return None
+
+        return cache.load(path, data_path)
+
+    def iter_path(self, path: Path, data_path: Path = DATA_PATH) -> Iterator[Item]:
+        """Runs the module from the `path`, yielding the outcomes as each solution completes.
+
+        If the [`cache`][aoc.runners.Runner.cache] is given, the results are loaded from it
+        when possible (and are marked as cached), and dumped to it once every solution
+        has completed otherwise.
+
+        Arguments:
+            path: The path to the module.
+            data_path: The path to the data directory.
+
+        Returns:
+            The iterator over keys and outcomes of running the solutions.
+
+        Raises:
+            AnyError: Any error that occurs while running.
+        """
+        results = self.load_path(path, data_path)
+
+        if results is None:
+            yield from self.execute_iter_path(path, data_path)
+
+        else:
+            yield from results.iter_items()
+
+    async def async_iter_path(self, path: Path, data_path: Path = DATA_PATH) -> AsyncIterator[Item]:
+        """Runs the module from the `path` in the default executor of the running loop,
+        yielding the outcomes as each solution completes.
+
+        See [`iter_path`][aoc.runners.Runner.iter_path] for more information.
+
+        Arguments:
+            path: The path to the module.
+            data_path: The path to the data directory.
+
+        Returns:
+            The asynchronous iterator over keys and outcomes of running the solutions.
+
+        Raises:
+            AnyError: Any error that occurs while running.
+        """
+        from asyncio import get_running_loop
+
+        loop = get_running_loop()
+
+        iterator = self.iter_path(path, data_path)
+
+        while True:
+            item = await loop.run_in_executor(None, next, iterator, None)
+
+            if item is None:
+                break
+
+            yield item
+
+    def execute_iter_path(self, path: Path, data_path: Path = DATA_PATH) -> Iterator[Item]:
+        """Runs the module from the `path`, yielding the outcomes as each solution completes,
+        and dumps the results to the [`cache`][aoc.runners.Runner.cache] (if given)
+        once every solution has completed.
 
-                    data = load_data(key, data_path)
+        Arguments:
+            path: The path to the module.
+            data_path: The path to the data directory.
+
+        Returns:
+            The iterator over keys and outcomes of running the solutions.
+
+        Raises:
+            AnyError: Any error that occurs while running.
+        """
+        cache = self.cache
+
+        if cache is None or self.profiler is not None or self.tracker is not None:
+            yield from self.execute_path(path, data_path)
+
+            return
+
+        items = []
+
+        for item in self.execute_path(path, data_path):
+            items.append(item)
+
+            yield item
+
+        cache.dump(path, Results.from_items(items), data_path)
+
+    def execute_path(self, path: Path, data_path: Path = DATA_PATH) -> Iterator[Item]:
+        """Runs the module from the `path`, yielding the outcomes as each solution completes,
+        bypassing the cache.
+
+        Arguments:
+            path: The path to the module.
+            data_path: The path to the data directory.
+
+        Returns:
+            The iterator over keys and outcomes of running the solutions.
+
+        Raises:
+            AnyError: Any error that occurs while running.
+        """
+        limits = self.limits
+
+        if limits is not None:
+            yield from self.run_path_isolated(path, limits, data_path)
+
+            return
+
+        solutions = self.find_solutions(path)
+
+        profiler = self.profiler
+        tracker = self.tracker
+        inputs = self.inputs
 
-                    results[key] = solution.execute(data)
+        for key, solution_type in solutions.solutions.items():
+            solution = solution_type()
 
-                if key in final_solutions:
-                    final_solution = final_solutions[key]()
+            yield (key, solution.load_and_execute(data_path, profiler, tracker, inputs))
 
-                    data = load_data(key, data_path)
+        for key, final_solution_type in solutions.final_solutions.items():
+            final_solution = final_solution_type()
 
-                    final_results[key] = final_solution.execute(data)
+            yield (key, final_solution.load_and_execute(data_path, profiler, tracker, inputs))
+
+    def run_path_isolated(
+        self, path: Path, limits: Limits, data_path: Path = DATA_PATH
+    ) -> Iterator[Item]:
+        """Runs each of the solutions from the `path` in isolation, respecting the `limits`,
+        yielding the outcomes as each solution completes.
+
+        The module is never run in this process, so that its top-level code respects
+        the `limits` as well: the keys of solutions are found statically
+        (see [`find_keys`][aoc.discoveries.find_keys]), and each child process runs
+        the module before running the solution with the given key.
+
+        Child processes are started without forking (see
+        [`get_safe_context`][aoc.isolation.get_safe_context]), therefore the results
+        need to be picklable; in particular, answers can not be of types defined
+        in the module itself, since it is not importable.
+
+        Arguments:
+            path: The path to the module.
+            limits: The limits to respect.
+            data_path: The path to the data directory.
+
+        Returns:
+            The iterator over keys and outcomes (including failures) of running the solutions.
+
+        Raises:
+            AnyError: Any error that occurs while running.
+        """
+        profiler = self.profiler
+        tracker = self.tracker
+        inputs = self.inputs
+
+        for key in find_keys(path.read_text(DEFAULT_ENCODING)):
+            outcome = run_isolated(
+                partial(run_keyed_solution, path, key, data_path, profiler, tracker, inputs),
+                limits,
+            )
+
+            if outcome is not None:
+                yield (key, outcome)
+
+    def benchmark_path(
+        self,
+        path: Path,
+        data_path: Path = DATA_PATH,
+        rounds: int = DEFAULT_ROUNDS,
+        warmup: int = DEFAULT_WARMUP,
+        relative_error: Optional[float] = None,
+        budget: Optional[float] = None,
+        limit: int = DEFAULT_LIMIT,
+        measure: Measure = Measure.WALL,
+    ) -> Benchmarks:
+        """Benchmarks the module from the `path` and returns the benchmarks.
+
+        Each solution loads and parses its data the way it does when run (see
+        [`load_and_execute_benchmark`][aoc.solutions.Solution.load_and_execute_benchmark]).
+
+        See [`sample`][aoc.benchmarks.sample] for more information on sampling.
+
+        Arguments:
+            path: The path to the module.
+            data_path: The path to the data directory.
+            rounds: The (minimum) amount of rounds.
+            warmup: The amount of warmup rounds.
+            relative_error: The target relative standard error of the mean.
+            budget: The time budget for each solution, in seconds.
+            limit: The maximum amount of rounds, in adaptive mode.
+            measure: The measure of time to use.
+
+        Returns:
+            The benchmarks of the module.
+
+        Raises:
+            AnyError: Any error that occurs while running.
+        """
+        solutions = self.find_solutions(path)
+
+        benchmarks = {}
+        final_benchmarks = {}
+
+        for key, solution_type in solutions.solutions.items():
+            benchmarks[key] = solution_type().load_and_execute_benchmark(
+                data_path,
+                rounds=rounds,
+                warmup=warmup,
+                relative_error=relative_error,
+                budget=budget,
+                limit=limit,
+                measure=measure,
+            )
+
+        for key, final_solution_type in solutions.final_solutions.items():
+            final_benchmarks[key] = final_solution_type().load_and_execute_benchmark(
+                data_path,
+                rounds=rounds,
+                warmup=warmup,
+                relative_error=relative_error,
+                budget=budget,
+                limit=limit,
+                measure=measure,
+            )
+
+        return Benchmarks(benchmarks, final_benchmarks)
+
+    def run_paths(
+        self, paths: Iterable[Path], data_path: Path = DATA_PATH
+    ) -> Iterator[Tuple[Path, Fetch]]:
+        """Runs the modules from the `paths`, yielding the results in order.
+
+        Each path is yielded along with the function that fetches its results, so that
+        errors can be handled for each path separately.
+
+        Modules are run one by one, when their results are fetched.
+
+        Arguments:
+            paths: The paths to the modules.
+            data_path: The path to the data directory.
+
+        Returns:
+            The iterator over paths and functions fetching their results.
+        """
+        for path in paths:
+            yield (path, partial(self.run_path, path, data_path))
 
-        return Results(results, final_results)
+    def iter_paths(
+        self, paths: Iterable[Path], data_path: Path = DATA_PATH
+    ) -> Iterator[Tuple[Path, Iterator[Item]]]:
+        """Runs the modules from the `paths`, yielding the outcomes in order.
+
+        Each path is yielded along with the iterator over its outcomes, so that errors
+        can be handled for each path separately. Errors are raised while iterating.
+
+        Modules are run one by one, as their outcomes are iterated over
+        (see [`iter_path`][aoc.runners.Runner.iter_path]).
+
+        Arguments:
+            paths: The paths to the modules.
+            data_path: The path to the data directory.
+
+        Returns:
+            The iterator over paths and iterators over their outcomes.
+        """
+        for path in paths:
+            yield (path, self.iter_path(path, data_path))
+
+
+@frozen()
+class ParallelRunner(Runner):
+    """Represents runners that run modules in parallel, using the process pool."""
+
+    jobs: Optional[int] = field(default=None)
+    """The maximum number of processes to use (defaults to the number of processors)."""
+
+    def run_paths(
+        self, paths: Iterable[Path], data_path: Path = DATA_PATH
+    ) -> Iterator[Tuple[Path, Fetch]]:
+        """Runs the modules from the `paths` in parallel, yielding the results in order.
+
+        Each path is yielded along with the function that fetches its results, so that
+        errors can be handled for each path separately.
+
+        Modules are submitted to the process pool as the `paths` are iterated over
+        (in the background thread), so that modules run as soon as they are available
+        (see [`Downloader.iter_ready`][aoc.downloads.Downloader.iter_ready]), and each one
+        is yielded right after it is submitted; fetching the results waits for
+        the corresponding module to finish running.
+
+        Any error raised while iterating over the `paths` is raised here.
+
+        Worker processes are started without forking this one (see
+        [`get_safe_context`][aoc.isolation.get_safe_context]), since other threads
+        (for instance, the one of the [`Downloader`][aoc.downloads.Downloader]) may be running.
+
+        Arguments:
+            paths: The paths to the modules.
+            data_path: The path to the data directory.
+
+        Returns:
+            The iterator over paths and functions fetching their results.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(self.jobs, get_safe_context()) as executor:
+            queue: Queue[Submission] = Queue()
+
+            thread = Thread(
+                target=self.submit_paths, args=(executor, paths, data_path, queue), daemon=True
+            )
+            thread.start()
+
+            while True:
+                submission = queue.get()
+
+                if submission is None:
+                    break
+
+                if isinstance(submission, BaseException):
+                    raise submission
+
+                path, future = submission
+
+                yield (path, future.result)
+
+    def submit_paths(
+        self,
+        executor: ProcessPoolExecutor,
+        paths: Iterable[Path],
+        data_path: Path,
+        queue: Queue[Submission],
+    ) -> None:
+        try:
+            for path in paths:
+                queue.put((path, executor.submit(self.run_path, path, data_path)))
+
+        except BaseException as error:  # reported through the queue so the consumer never hangs
+            queue.put(error)
+
+        else:
+            queue.put(None)
+
+    def iter_paths(
+        self, paths: Iterable[Path], data_path: Path = DATA_PATH
+    ) -> Iterator[Tuple[Path, Iterator[Item]]]:
+        """Runs the modules from the `paths` in parallel, yielding the outcomes in order.
+
+        Each path is yielded along with the iterator over its outcomes, so that errors
+        can be handled for each path separately. Errors are raised while iterating.
+
+        Outcomes of each module are only available once the module finishes running
+        in its process (see [`run_paths`][aoc.runners.ParallelRunner.run_paths]).
+
+        Arguments:
+            paths: The paths to the modules.
+            data_path: The path to the data directory.
+
+        Returns:
+            The iterator over paths and iterators over their outcomes.
+        """
+        for path, fetch in self.run_paths(paths, data_path):
+            yield (path, iter_fetched(fetch))
+
+
+def iter_fetched(fetch: Fetch) -> Iterator[Item]:
+    yield from fetch().iter_items()
 
 
 def run_path(
@@ -101,3 +679,25 @@ def run_path(
         AnyError: Any error that occurs while running.
     """
     return runner_type().run_path(path, data_path)
+
+
+def run_paths(
+    paths: Iterable[Path], data_path: Path = DATA_PATH, runner_type: Type[Runner] = Runner
+) -> Iterator[Tuple[Path, Fetch]]:
+    """Runs the modules from the `paths`, yielding the results in order.
+
+    This is equivalent to:
+
+    ```python
+    runner_type().run_paths(paths, data_path)
+    ```
+
+    Arguments:
+        paths: The paths to the modules.
+        data_path: The path to the data directory.
+        runner_type: The runner type to use.
+
+    Returns:
+        The iterator over paths and functions fetching their results.
+    """
+    return runner_type().run_paths(paths, data_path)
@@ -1,16 +1,62 @@
 from __future__ import annotations
 
 from abc import abstractmethod as required
-from typing import Any, Dict, Generic, Protocol, Type, TypeVar, final
+from functools import partial
+from io import StringIO
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Generic,
+    Iterator,
+    Optional,
+    Protocol,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    final,
+)
 
 from attrs import frozen
 from named import get_name
-
+from typing_aliases import Nullary
+
+from aoc.benchmarks import Statistics, sample
+from aoc.constants import (
+    DATA_PATH,
+    DEFAULT_ENCODING,
+    DEFAULT_LIMIT,
+    DEFAULT_ROUNDS,
+    DEFAULT_WARMUP,
+)
+from aoc.data import Buffer, iter_lines, load_data, load_data_bytes, map_data, open_data
+from aoc.inputs import InputCache
+from aoc.isolation import Failure, Limits, can_fork, start_isolated
+from aoc.memory import Memory, Tracker
 from aoc.names import get_key_by_name
-from aoc.primitives import Key
-from aoc.timers import Elapsed, now
-
-__all__ = ("Result", "Solution", "FinalResult", "FinalSolution")
+from aoc.primitives import Key, Part, Phase
+from aoc.profiles import Profiler
+from aoc.registries import get_registry
+from aoc.timers import Elapsed, Measure, now
+
+__all__ = (
+    "Result",
+    "Benchmark",
+    "Solution",
+    "FinalResult",
+    "FinalBenchmark",
+    "FinalSolution",
+    "LineSolution",
+    "FinalLineSolution",
+    "BytesSolution",
+    "FinalBytesSolution",
+)
+
+R = TypeVar("R")
+
+D = TypeVar("D")  # data
 
 I = TypeVar("I")  # input
 T = TypeVar("T", covariant=True)  # part one (can be the only part)
@@ -37,33 +83,202 @@ class Result(Generic[T, U]):
     solve_two_time: Elapsed
     """The time it took to solve part two."""
 
+    parse_memory: Optional[Memory] = None
+    """The memory usage of parsing the data, if tracked."""
+
+    solve_one_memory: Optional[Memory] = None
+    """The memory usage of solving part one, if tracked."""
+
+    solve_two_memory: Optional[Memory] = None
+    """The memory usage of solving part two, if tracked."""
+
+    parse_cached: bool = False
+    """Whether the input was loaded from the input cache instead of parsing
+    (in which case the parse time is the time it took to load it).
+    """
+
+    cached: bool = False
+    """Whether the result was loaded from the cache."""
+
+    profiled: bool = False
+    """Whether the phases were profiled (in which case the times include the overhead
+    of profiling).
+    """
+
 
 AnyResult = Result[Any, Any]
 
+
+@final
+@frozen()
+class Benchmark(Generic[T, U]):
+    """Represents the result of benchmarking the problem solution."""
+
+    answer_one: T
+    """The answer to the part one of the problem."""
+
+    answer_two: U
+    """The answer to the part two of the problem."""
+
+    parse: Statistics
+    """The statistics of the time it took to parse the data."""
+
+    solve_one: Statistics
+    """The statistics of the time it took to solve part one."""
+
+    solve_two: Statistics
+    """The statistics of the time it took to solve part two."""
+
+    @property
+    def rounds(self) -> int:
+        """The amount of rounds benchmarked."""
+        return self.parse.count
+
+
+AnyBenchmark = Benchmark[Any, Any]
+
 MUST_IMPLEMENT = "solutions must implement the `{}` method"
 must_implement = MUST_IMPLEMENT.format
 
 PARSE = "parse"
+PARSE_LINES = "parse_lines"
+PARSE_BYTES = "parse_bytes"
 SOLVE = "solve"
 SOLVE_ONE = "solve_one"
 SOLVE_TWO = "solve_two"
 
 MUST_IMPLEMENT_PARSE = must_implement(PARSE)
+MUST_IMPLEMENT_PARSE_LINES = must_implement(PARSE_LINES)
+MUST_IMPLEMENT_PARSE_BYTES = must_implement(PARSE_BYTES)
 MUST_IMPLEMENT_SOLVE = must_implement(SOLVE)
 MUST_IMPLEMENT_SOLVE_ONE = must_implement(SOLVE_ONE)
 MUST_IMPLEMENT_SOLVE_TWO = must_implement(SOLVE_TWO)
 
 
-SOLUTIONS: Dict[Key, AnySolutionType] = {}
+PART_FAILED = "solving the part {} {}"
+part_failed = PART_FAILED.format
+
+
+def timed(function: Callable[[I], R], input: I) -> Tuple[R, Elapsed]:
+    timer = now()
+
+    value = function(input)
+
+    return (value, timer.elapsed())
+
+
+def profiled(
+    function: Callable[[I], R], input: I, key: Key, phase: Phase, profiler: Optional[Profiler]
+) -> Tuple[R, Elapsed]:
+    if profiler is None:
+        return timed(function, input)
+
+    from cProfile import Profile
+
+    profile = Profile()
+
+    try:  # only the function itself is profiled, not the timing around it
+        return timed(partial(profile.runcall, function), input)
+
+    finally:
+        profiler.dump(key, phase, profile)
+
+
+def clear_profiles(key: Key, profiler: Optional[Profiler]) -> None:
+    if profiler is not None:  # so that phases not run this time do not leave stale profiles
+        profiler.clear(key)
+
+
+Phased = Tuple[R, Elapsed, Optional[Memory]]
+
+
+def run_phase(
+    function: Callable[[I], R],
+    input: I,
+    key: Key,
+    phase: Phase,
+    profiler: Optional[Profiler] = None,
+    tracker: Optional[Tracker] = None,
+) -> Phased[R]:
+    if tracker is None:
+        value, elapsed = profiled(function, input, key, phase, profiler)
+
+        return (value, elapsed, None)
+
+    (value, elapsed), memory = tracker.call(
+        partial(profiled, function, key=key, phase=phase, profiler=profiler), input
+    )
+
+    return (value, elapsed, memory)
+
+
+Parsed = Tuple[R, Elapsed, Optional[Memory], bool]
+
+
+def run_parse(
+    solution: Any,
+    parse: Callable[[D], R],
+    data: D,
+    key: Key,
+    profiler: Optional[Profiler] = None,
+    tracker: Optional[Tracker] = None,
+    inputs: Optional[InputCache] = None,
+) -> Parsed[R]:
+    text = data if isinstance(data, str) else None  # streamed data can not be cached
+
+    if inputs is None or text is None:
+        return (*run_phase(parse, data, key, Phase.PARSE, profiler, tracker), False)
+
+    solution_type = type(solution)
+
+    entry, elapsed, memory = run_phase(
+        partial(inputs.load, solution_type), text, key, Phase.PARSE, profiler, tracker
+    )
+
+    if entry is not None:
+        return (entry.input, elapsed, memory, True)
+
+    input, elapsed, memory = run_phase(parse, data, key, Phase.PARSE, profiler, tracker)
+
+    inputs.dump(solution_type, text, input)  # dumping is not timed
+
+    return (input, elapsed, memory, False)
+
+
+IS_PROTOCOL = "_is_protocol"
+
+
+def is_protocol(cls: type) -> bool:
+    return vars(cls).get(IS_PROTOCOL, False)
+
+
+def get_key(solution: Any) -> Key:
+    return get_key_by_name(type(solution).__name__)
+
+
+def unwrap_part(outcome: Union[Phased[R], Failure], part: Part) -> Phased[R]:
+    if isinstance(outcome, Failure):
+        raise ChildProcessError(part_failed(part.value, outcome.message))
+
+    return outcome
 
 
 class Solution(Protocol[I, T, U]):
     """Represents problem solutions."""
 
+    concurrent: ClassVar[bool] = False
+    """Whether to solve the parts concurrently, in separate processes.
+
+    See [`execute_concurrent`][aoc.solutions.Solution.execute_concurrent] for more information.
+    """
+
     def __init_subclass__(cls, **keywords: Any) -> None:
         super().__init_subclass__(**keywords)
 
-        SOLUTIONS[get_key_by_name(get_name(cls))] = cls
+        if is_protocol(cls):  # protocols extending solutions are not solutions themselves
+            return
+
+        get_registry().register_solution(get_key_by_name(get_name(cls)), cls)
 
     @required
     def parse(self, data: str) -> I:
@@ -101,38 +316,350 @@ class Solution(Protocol[I, T, U]):
         """
         raise NotImplementedError(MUST_IMPLEMENT_SOLVE_TWO)
 
-    def execute(self, data: str) -> Result[T, U]:
+    def execute(
+        self,
+        data: str,
+        profiler: Optional[Profiler] = None,
+        tracker: Optional[Tracker] = None,
+        inputs: Optional[InputCache] = None,
+    ) -> Result[T, U]:
         """Executes the problem solution on the given data.
 
         Arguments:
             data: The data to parse and solve the problem for.
+            profiler: The profiler to profile each phase with, if any.
+            tracker: The tracker to track memory usage of each phase with, if any.
+            inputs: The cache to load parsed inputs from (and dump them to), if any.
+
+        Returns:
+            The result of the solution.
+        """
+        return self.execute_parsing(self.parse, data, profiler, tracker, inputs)
+
+    def execute_parsing(
+        self,
+        parse: Callable[[D], I],
+        data: D,
+        profiler: Optional[Profiler] = None,
+        tracker: Optional[Tracker] = None,
+        inputs: Optional[InputCache] = None,
+    ) -> Result[T, U]:
+        """Executes the problem solution on the given data, parsing it with `parse`.
+
+        See [`execute`][aoc.solutions.Solution.execute] for more information.
+
+        Arguments:
+            parse: The function to parse the data with.
+            data: The data to parse and solve the problem for.
+            profiler: The profiler to profile each phase with, if any.
+            tracker: The tracker to track memory usage of each phase with, if any.
+            inputs: The cache to load parsed inputs from (and dump them to), if any;
+                only used if the `data` is a string.
+
+        Returns:
+            The result of the solution.
+        """
+        if self.concurrent:
+            return self.execute_concurrent_parsing(parse, data, profiler, tracker, inputs)
+
+        return self.execute_sequential_parsing(parse, data, profiler, tracker, inputs)
+
+    def execute_sequential_parsing(
+        self,
+        parse: Callable[[D], I],
+        data: D,
+        profiler: Optional[Profiler] = None,
+        tracker: Optional[Tracker] = None,
+        inputs: Optional[InputCache] = None,
+    ) -> Result[T, U]:
+        """Executes the problem solution on the given data, parsing it with `parse`,
+        solving the parts one after another in this process
+        (regardless of [`concurrent`][aoc.solutions.Solution.concurrent]).
+
+        See [`execute`][aoc.solutions.Solution.execute] for more information.
+
+        Arguments:
+            parse: The function to parse the data with.
+            data: The data to parse and solve the problem for.
+            profiler: The profiler to profile each phase with, if any.
+            tracker: The tracker to track memory usage of each phase with, if any.
+            inputs: The cache to load parsed inputs from (and dump them to), if any;
+                only used if the `data` is a string.
+
+        Returns:
+            The result of the solution.
+        """
+        key = get_key(self)
+
+        clear_profiles(key, profiler)
+
+        input, parse_time, parse_memory, parse_cached = run_parse(
+            self, parse, data, key, profiler, tracker, inputs
+        )
+
+        answer_one, solve_one_time, solve_one_memory = run_phase(
+            self.solve_one, input, key, Phase.SOLVE_ONE, profiler, tracker
+        )
+
+        answer_two, solve_two_time, solve_two_memory = run_phase(
+            self.solve_two, input, key, Phase.SOLVE_TWO, profiler, tracker
+        )
+
+        return Result(
+            answer_one,
+            answer_two,
+            parse_time,
+            solve_one_time,
+            solve_two_time,
+            parse_memory,
+            solve_one_memory,
+            solve_two_memory,
+            parse_cached,
+            profiled=profiler is not None,
+        )
+
+    def execute_concurrent(
+        self,
+        data: str,
+        profiler: Optional[Profiler] = None,
+        tracker: Optional[Tracker] = None,
+        inputs: Optional[InputCache] = None,
+    ) -> Result[T, U]:
+        """Executes the problem solution on the given data, solving the parts concurrently.
+
+        The data is parsed once, and then each part is solved in its own forked child process.
+        The child processes share the parsed input with the parent (copy-on-write),
+        so it does not need to be copied; the answers need to be picklable though.
+
+        The `fork` start method is required, since solutions defined in modules run from paths
+        can not be pickled; where child processes can not be forked safely (see
+        [`can_fork`][aoc.isolation.can_fork]), the parts are solved sequentially
+        in this process instead.
+
+        Each part is timed (and tracked) in its child process.
+
+        Arguments:
+            data: The data to parse and solve the problem for.
+            profiler: The profiler to profile each phase with, if any.
+            tracker: The tracker to track memory usage of each phase with, if any.
+            inputs: The cache to load parsed inputs from (and dump them to), if any.
 
         Returns:
             The result of the solution.
+
+        Raises:
+            ChildProcessError: The child process failed.
         """
-        parse = self.parse
-        solve_one = self.solve_one
-        solve_two = self.solve_two
+        return self.execute_concurrent_parsing(self.parse, data, profiler, tracker, inputs)
+
+    def execute_concurrent_parsing(
+        self,
+        parse: Callable[[D], I],
+        data: D,
+        profiler: Optional[Profiler] = None,
+        tracker: Optional[Tracker] = None,
+        inputs: Optional[InputCache] = None,
+    ) -> Result[T, U]:
+        """Executes the problem solution on the given data, parsing it with `parse`,
+        solving the parts concurrently.
+
+        See [`execute_concurrent`][aoc.solutions.Solution.execute_concurrent]
+        for more information.
+
+        Arguments:
+            parse: The function to parse the data with.
+            data: The data to parse and solve the problem for.
+            profiler: The profiler to profile each phase with, if any.
+            tracker: The tracker to track memory usage of each phase with, if any.
+            inputs: The cache to load parsed inputs from (and dump them to), if any;
+                only used if the `data` is a string.
 
-        timer = now()
+        Returns:
+            The result of the solution.
 
-        input = parse(data)
+        Raises:
+            ChildProcessError: The child process failed.
+        """
+        if not can_fork():
+            return self.execute_sequential_parsing(parse, data, profiler, tracker, inputs)
+
+        key = get_key(self)
+
+        clear_profiles(key, profiler)
+
+        input, parse_time, parse_memory, parse_cached = run_parse(
+            self, parse, data, key, profiler, tracker, inputs
+        )
+
+        limits = Limits()
+
+        phase_one = partial(
+            run_phase, self.solve_one, input, key, Phase.SOLVE_ONE, profiler, tracker
+        )
+        phase_two = partial(
+            run_phase, self.solve_two, input, key, Phase.SOLVE_TWO, profiler, tracker
+        )
+
+        isolated_one = start_isolated(phase_one, limits, fork=True)
+        isolated_two = start_isolated(phase_two, limits, fork=True)
+
+        try:
+            outcome_one = isolated_one.wait()
+
+        finally:
+            outcome_two = isolated_two.wait()
+
+        answer_one, solve_one_time, solve_one_memory = unwrap_part(outcome_one, Part.ONE)
+        answer_two, solve_two_time, solve_two_memory = unwrap_part(outcome_two, Part.TWO)
+
+        return Result(
+            answer_one,
+            answer_two,
+            parse_time,
+            solve_one_time,
+            solve_two_time,
+            parse_memory,
+            solve_one_memory,
+            solve_two_memory,
+            parse_cached,
+            profiled=profiler is not None,
+        )
+
+    def load_and_execute(
+        self,
+        data_path: Path = DATA_PATH,
+        profiler: Optional[Profiler] = None,
+        tracker: Optional[Tracker] = None,
+        inputs: Optional[InputCache] = None,
+    ) -> Result[T, U]:
+        """Loads the data for the problem from the `data_path` and executes the solution on it.
+
+        See [`execute`][aoc.solutions.Solution.execute] for more information.
 
-        parse_time = timer.elapsed()
+        Arguments:
+            data_path: The path to the data directory.
+            profiler: The profiler to profile each phase with, if any.
+            tracker: The tracker to track memory usage of each phase with, if any.
+            inputs: The cache to load parsed inputs from (and dump them to), if any.
 
-        timer = timer.reset()
+        Returns:
+            The result of the solution.
 
-        answer_one = solve_one(input)
+        Raises:
+            DataNotFound: The data could not be loaded.
+        """
+        return self.execute(load_data(get_key(self), data_path), profiler, tracker, inputs)
+
+    def load_and_execute_benchmark(
+        self,
+        data_path: Path = DATA_PATH,
+        rounds: int = DEFAULT_ROUNDS,
+        warmup: int = DEFAULT_WARMUP,
+        relative_error: Optional[float] = None,
+        budget: Optional[float] = None,
+        limit: int = DEFAULT_LIMIT,
+        measure: Measure = Measure.WALL,
+    ) -> Benchmark[T, U]:
+        """Loads the data for the problem from the `data_path` and repeatedly executes
+        the solution on it.
+
+        See [`execute_benchmark`][aoc.solutions.Solution.execute_benchmark] for more information.
 
-        solve_one_time = timer.elapsed()
+        Arguments:
+            data_path: The path to the data directory.
+            rounds: The (minimum) amount of rounds.
+            warmup: The amount of warmup rounds.
+            relative_error: The target relative standard error of the mean.
+            budget: The time budget, in seconds.
+            limit: The maximum amount of rounds, in adaptive mode.
+            measure: The measure of time to use.
 
-        timer = timer.reset()
+        Returns:
+            The benchmark of the solution.
 
-        answer_two = solve_two(input)
+        Raises:
+            DataNotFound: The data could not be loaded.
+        """
+        return self.execute_benchmark(
+            load_data(get_key(self), data_path),
+            rounds=rounds,
+            warmup=warmup,
+            relative_error=relative_error,
+            budget=budget,
+            limit=limit,
+            measure=measure,
+        )
+
+    def execute_benchmark(
+        self,
+        data: str,
+        rounds: int = DEFAULT_ROUNDS,
+        warmup: int = DEFAULT_WARMUP,
+        relative_error: Optional[float] = None,
+        budget: Optional[float] = None,
+        limit: int = DEFAULT_LIMIT,
+        measure: Measure = Measure.WALL,
+    ) -> Benchmark[T, U]:
+        """Repeatedly executes the problem solution on the given data.
+
+        See [`sample`][aoc.benchmarks.sample] for more information on sampling.
 
-        solve_two_time = timer.elapsed()
+        Arguments:
+            data: The data to parse and solve the problem for.
+            rounds: The (minimum) amount of rounds.
+            warmup: The amount of warmup rounds.
+            relative_error: The target relative standard error of the mean.
+            budget: The time budget, in seconds.
+            limit: The maximum amount of rounds, in adaptive mode.
+            measure: The measure of time to use.
 
-        return Result(answer_one, answer_two, parse_time, solve_one_time, solve_two_time)
+        Returns:
+            The benchmark of the solution.
+        """
+        return sample_benchmark(
+            partial(self.execute, data),
+            rounds=rounds,
+            warmup=warmup,
+            relative_error=relative_error,
+            budget=budget,
+            limit=limit,
+            measure=measure,
+        )
+
+
+def sample_benchmark(
+    execute: Nullary[Result[T, U]],
+    rounds: int = DEFAULT_ROUNDS,
+    warmup: int = DEFAULT_WARMUP,
+    relative_error: Optional[float] = None,
+    budget: Optional[float] = None,
+    limit: int = DEFAULT_LIMIT,
+    measure: Measure = Measure.WALL,
+) -> Benchmark[T, U]:
+    results = sample(
+        execute,
+        result_phases,
+        rounds=rounds,
+        warmup=warmup,
+        relative_error=relative_error,
+        budget=budget,
+        limit=limit,
+        measure=measure,
+    )
+
+    last = results[-1]
+
+    return Benchmark(
+        last.answer_one,
+        last.answer_two,
+        Statistics.from_elapsed((result.parse_time for result in results), measure=measure),
+        Statistics.from_elapsed((result.solve_one_time for result in results), measure=measure),
+        Statistics.from_elapsed((result.solve_two_time for result in results), measure=measure),
+    )
+
+
+def result_phases(result: AnyResult) -> Tuple[Elapsed, Elapsed, Elapsed]:
+    return (result.parse_time, result.solve_one_time, result.solve_two_time)
 
 
 AnySolution = Solution[Any, Any, Any]
@@ -153,10 +680,50 @@ class FinalResult(Generic[T]):
     solve_time: Elapsed
     """The time it took to solve the problem."""
 
+    parse_memory: Optional[Memory] = None
+    """The memory usage of parsing the data, if tracked."""
+
+    solve_memory: Optional[Memory] = None
+    """The memory usage of solving the problem, if tracked."""
+
+    parse_cached: bool = False
+    """Whether the input was loaded from the input cache instead of parsing
+    (in which case the parse time is the time it took to load it).
+    """
+
+    cached: bool = False
+    """Whether the final result was loaded from the cache."""
+
+    profiled: bool = False
+    """Whether the phases were profiled (in which case the times include the overhead
+    of profiling).
+    """
+
 
 AnyFinalResult = FinalResult[Any]
 
-FINAL_SOLUTIONS: Dict[Key, AnyFinalSolutionType] = {}
+
+@final
+@frozen()
+class FinalBenchmark(Generic[T]):
+    """Represents the result of benchmarking the final problem solution."""
+
+    answer: T
+    """The answer to the problem."""
+
+    parse: Statistics
+    """The statistics of the time it took to parse the data."""
+
+    solve: Statistics
+    """The statistics of the time it took to solve the problem."""
+
+    @property
+    def rounds(self) -> int:
+        """The amount of rounds benchmarked."""
+        return self.parse.count
+
+
+AnyFinalBenchmark = FinalBenchmark[Any]
 
 
 class FinalSolution(Protocol[I, T]):
@@ -165,7 +732,10 @@ class FinalSolution(Protocol[I, T]):
     def __init_subclass__(cls, **keywords: Any) -> None:
         super().__init_subclass__(**keywords)
 
-        FINAL_SOLUTIONS[get_key_by_name(get_name(cls))] = cls
+        if is_protocol(cls):  # protocols extending final solutions are not final solutions
+            return
+
+        get_registry().register_final_solution(get_key_by_name(get_name(cls)), cls)
 
     @required
     def parse(self, data: str) -> I:
@@ -192,32 +762,459 @@ class FinalSolution(Protocol[I, T]):
         """
         raise NotImplementedError(MUST_IMPLEMENT_SOLVE)
 
-    def execute(self, data: str) -> FinalResult[T]:
+    def execute(
+        self,
+        data: str,
+        profiler: Optional[Profiler] = None,
+        tracker: Optional[Tracker] = None,
+        inputs: Optional[InputCache] = None,
+    ) -> FinalResult[T]:
         """Executes the problem solution on the given data.
 
         Arguments:
             data: The data to parse and solve the problem for.
+            profiler: The profiler to profile each phase with, if any.
+            tracker: The tracker to track memory usage of each phase with, if any.
+            inputs: The cache to load parsed inputs from (and dump them to), if any.
+
+        Returns:
+            The result of the solution.
+        """
+        return self.execute_parsing(self.parse, data, profiler, tracker, inputs)
+
+    def execute_parsing(
+        self,
+        parse: Callable[[D], I],
+        data: D,
+        profiler: Optional[Profiler] = None,
+        tracker: Optional[Tracker] = None,
+        inputs: Optional[InputCache] = None,
+    ) -> FinalResult[T]:
+        """Executes the problem solution on the given data, parsing it with `parse`.
+
+        See [`execute`][aoc.solutions.FinalSolution.execute] for more information.
+
+        Arguments:
+            parse: The function to parse the data with.
+            data: The data to parse and solve the problem for.
+            profiler: The profiler to profile each phase with, if any.
+            tracker: The tracker to track memory usage of each phase with, if any.
+            inputs: The cache to load parsed inputs from (and dump them to), if any;
+                only used if the `data` is a string.
 
         Returns:
             The result of the solution.
         """
-        parse = self.parse
-        solve = self.solve
+        key = get_key(self)
+
+        clear_profiles(key, profiler)
+
+        input, parse_time, parse_memory, parse_cached = run_parse(
+            self, parse, data, key, profiler, tracker, inputs
+        )
+
+        answer, solve_time, solve_memory = run_phase(
+            self.solve, input, key, Phase.SOLVE, profiler, tracker
+        )
+
+        return FinalResult(
+            answer,
+            parse_time,
+            solve_time,
+            parse_memory,
+            solve_memory,
+            parse_cached,
+            profiled=profiler is not None,
+        )
+
+    def load_and_execute(
+        self,
+        data_path: Path = DATA_PATH,
+        profiler: Optional[Profiler] = None,
+        tracker: Optional[Tracker] = None,
+        inputs: Optional[InputCache] = None,
+    ) -> FinalResult[T]:
+        """Loads the data for the problem from the `data_path` and executes the solution on it.
+
+        See [`execute`][aoc.solutions.FinalSolution.execute] for more information.
+
+        Arguments:
+            data_path: The path to the data directory.
+            profiler: The profiler to profile each phase with, if any.
+            tracker: The tracker to track memory usage of each phase with, if any.
+            inputs: The cache to load parsed inputs from (and dump them to), if any.
 
-        timer = now()
+        Returns:
+            The result of the solution.
 
-        input = parse(data)
+        Raises:
+            DataNotFound: The data could not be loaded.
+        """
+        return self.execute(load_data(get_key(self), data_path), profiler, tracker, inputs)
+
+    def load_and_execute_benchmark(
+        self,
+        data_path: Path = DATA_PATH,
+        rounds: int = DEFAULT_ROUNDS,
+        warmup: int = DEFAULT_WARMUP,
+        relative_error: Optional[float] = None,
+        budget: Optional[float] = None,
+        limit: int = DEFAULT_LIMIT,
+        measure: Measure = Measure.WALL,
+    ) -> FinalBenchmark[T]:
+        """Loads the data for the problem from the `data_path` and repeatedly executes
+        the solution on it.
+
+        See [`execute_benchmark`][aoc.solutions.FinalSolution.execute_benchmark] for more information.
 
-        parse_time = timer.elapsed()
+        Arguments:
+            data_path: The path to the data directory.
+            rounds: The (minimum) amount of rounds.
+            warmup: The amount of warmup rounds.
+            relative_error: The target relative standard error of the mean.
+            budget: The time budget, in seconds.
+            limit: The maximum amount of rounds, in adaptive mode.
+            measure: The measure of time to use.
 
-        timer = timer.reset()
+        Returns:
+            The benchmark of the solution.
 
-        answer = solve(input)
+        Raises:
+            DataNotFound: The data could not be loaded.
+        """
+        return self.execute_benchmark(
+            load_data(get_key(self), data_path),
+            rounds=rounds,
+            warmup=warmup,
+            relative_error=relative_error,
+            budget=budget,
+            limit=limit,
+            measure=measure,
+        )
+
+    def execute_benchmark(
+        self,
+        data: str,
+        rounds: int = DEFAULT_ROUNDS,
+        warmup: int = DEFAULT_WARMUP,
+        relative_error: Optional[float] = None,
+        budget: Optional[float] = None,
+        limit: int = DEFAULT_LIMIT,
+        measure: Measure = Measure.WALL,
+    ) -> FinalBenchmark[T]:
+        """Repeatedly executes the problem solution on the given data.
+
+        See [`sample`][aoc.benchmarks.sample] for more information on sampling.
 
-        solve_time = timer.elapsed()
+        Arguments:
+            data: The data to parse and solve the problem for.
+            rounds: The (minimum) amount of rounds.
+            warmup: The amount of warmup rounds.
+            relative_error: The target relative standard error of the mean.
+            budget: The time budget, in seconds.
+            limit: The maximum amount of rounds, in adaptive mode.
+            measure: The measure of time to use.
 
-        return FinalResult(answer, parse_time, solve_time)
+        Returns:
+            The benchmark of the solution.
+        """
+        return sample_final_benchmark(
+            partial(self.execute, data),
+            rounds=rounds,
+            warmup=warmup,
+            relative_error=relative_error,
+            budget=budget,
+            limit=limit,
+            measure=measure,
+        )
+
+
+def sample_final_benchmark(
+    execute: Nullary[FinalResult[T]],
+    rounds: int = DEFAULT_ROUNDS,
+    warmup: int = DEFAULT_WARMUP,
+    relative_error: Optional[float] = None,
+    budget: Optional[float] = None,
+    limit: int = DEFAULT_LIMIT,
+    measure: Measure = Measure.WALL,
+) -> FinalBenchmark[T]:
+    final_results = sample(
+        execute,
+        final_result_phases,
+        rounds=rounds,
+        warmup=warmup,
+        relative_error=relative_error,
+        budget=budget,
+        limit=limit,
+        measure=measure,
+    )
+
+    last = final_results[-1]
+
+    return FinalBenchmark(
+        last.answer,
+        Statistics.from_elapsed(
+            (final_result.parse_time for final_result in final_results), measure=measure
+        ),
+        Statistics.from_elapsed(
+            (final_result.solve_time for final_result in final_results), measure=measure
+        ),
+    )
+
+
+def final_result_phases(final_result: AnyFinalResult) -> Tuple[Elapsed, Elapsed]:
+    return (final_result.parse_time, final_result.solve_time)
 
 
 AnyFinalSolution = FinalSolution[Any, Any]
 AnyFinalSolutionType = Type[AnyFinalSolution]
+
+
+class LineSolution(Solution[I, T, U], Protocol[I, T, U]):
+    """Represents problem solutions parsing the data line by line.
+
+    When run from the data path, the data is read from the file incrementally, so that
+    huge inputs can be parsed without loading them into memory as a whole.
+
+    Note:
+        Parsed inputs can not be cached when the data is streamed.
+    """
+
+    @required
+    def parse_lines(self, lines: Iterator[str]) -> I:
+        """Parses the lines of the data into the input type.
+
+        Arguments:
+            lines: The iterator over the lines of the data (without the trailing new lines).
+
+        Returns:
+            The input of the problem.
+        """
+        raise NotImplementedError(MUST_IMPLEMENT_PARSE_LINES)
+
+    def parse(self, data: str) -> I:
+        return self.parse_lines(iter_lines(StringIO(data)))
+
+    def load_and_execute(
+        self,
+        data_path: Path = DATA_PATH,
+        profiler: Optional[Profiler] = None,
+        tracker: Optional[Tracker] = None,
+        inputs: Optional[InputCache] = None,
+    ) -> Result[T, U]:
+        with open_data(get_key(self), data_path) as file:
+            return self.execute_parsing(self.parse_lines, iter_lines(file), profiler, tracker)
+
+    def load_and_execute_benchmark(
+        self,
+        data_path: Path = DATA_PATH,
+        rounds: int = DEFAULT_ROUNDS,
+        warmup: int = DEFAULT_WARMUP,
+        relative_error: Optional[float] = None,
+        budget: Optional[float] = None,
+        limit: int = DEFAULT_LIMIT,
+        measure: Measure = Measure.WALL,
+    ) -> Benchmark[T, U]:
+        return sample_benchmark(  # the data is streamed anew in each round
+            partial(self.load_and_execute, data_path),
+            rounds=rounds,
+            warmup=warmup,
+            relative_error=relative_error,
+            budget=budget,
+            limit=limit,
+            measure=measure,
+        )
+
+
+AnyLineSolution = LineSolution[Any, Any, Any]
+
+
+class FinalLineSolution(FinalSolution[I, T], Protocol[I, T]):
+    """Represents final problem solutions parsing the data line by line.
+
+    See [`LineSolution`][aoc.solutions.LineSolution] for more information.
+    """
+
+    @required
+    def parse_lines(self, lines: Iterator[str]) -> I:
+        """Parses the lines of the data into the input type.
+
+        Arguments:
+            lines: The iterator over the lines of the data (without the trailing new lines).
+
+        Returns:
+            The input of the problem.
+        """
+        raise NotImplementedError(MUST_IMPLEMENT_PARSE_LINES)
+
+    def parse(self, data: str) -> I:
+        return self.parse_lines(iter_lines(StringIO(data)))
+
+    def load_and_execute(
+        self,
+        data_path: Path = DATA_PATH,
+        profiler: Optional[Profiler] = None,
+        tracker: Optional[Tracker] = None,
+        inputs: Optional[InputCache] = None,
+    ) -> FinalResult[T]:
+        with open_data(get_key(self), data_path) as file:
+            return self.execute_parsing(self.parse_lines, iter_lines(file), profiler, tracker)
+
+    def load_and_execute_benchmark(
+        self,
+        data_path: Path = DATA_PATH,
+        rounds: int = DEFAULT_ROUNDS,
+        warmup: int = DEFAULT_WARMUP,
+        relative_error: Optional[float] = None,
+        budget: Optional[float] = None,
+        limit: int = DEFAULT_LIMIT,
+        measure: Measure = Measure.WALL,
+    ) -> FinalBenchmark[T]:
+        return sample_final_benchmark(  # the data is streamed anew in each round
+            partial(self.load_and_execute, data_path),
+            rounds=rounds,
+            warmup=warmup,
+            relative_error=relative_error,
+            budget=budget,
+            limit=limit,
+            measure=measure,
+        )
+
+
+AnyFinalLineSolution = FinalLineSolution[Any, Any]
+
+
+def load_buffer(key: Key, data_path: Path, mapped: bool) -> Buffer:
+    return map_data(key, data_path) if mapped else load_data_bytes(key, data_path)
+
+
+class BytesSolution(Solution[I, T, U], Protocol[I, T, U]):
+    """Represents problem solutions parsing the raw data, skipping decoding entirely.
+
+    When run from the data path, the data is read as [`bytes`][bytes], or mapped into memory
+    if [`mapped`][aoc.solutions.BytesSolution.mapped] is set.
+
+    Note:
+        Parsed inputs can not be cached when the data is raw.
+    """
+
+    mapped: ClassVar[bool] = False
+    """Whether to map the data into memory (see [`map_data`][aoc.data.map_data])
+    instead of reading it.
+
+    The mapping is only valid while referenced, so inputs can keep (zero-copy) views into it.
+    """
+
+    @required
+    def parse_bytes(self, data: Buffer) -> I:
+        """Parses the raw data into the input type.
+
+        Arguments:
+            data: The raw data to parse.
+
+        Returns:
+            The input of the problem.
+        """
+        raise NotImplementedError(MUST_IMPLEMENT_PARSE_BYTES)
+
+    def parse(self, data: str) -> I:
+        return self.parse_bytes(data.encode(DEFAULT_ENCODING))
+
+    def load_and_execute(
+        self,
+        data_path: Path = DATA_PATH,
+        profiler: Optional[Profiler] = None,
+        tracker: Optional[Tracker] = None,
+        inputs: Optional[InputCache] = None,
+    ) -> Result[T, U]:
+        data = load_buffer(get_key(self), data_path, self.mapped)
+
+        return self.execute_parsing(self.parse_bytes, data, profiler, tracker)
+
+    def load_and_execute_benchmark(
+        self,
+        data_path: Path = DATA_PATH,
+        rounds: int = DEFAULT_ROUNDS,
+        warmup: int = DEFAULT_WARMUP,
+        relative_error: Optional[float] = None,
+        budget: Optional[float] = None,
+        limit: int = DEFAULT_LIMIT,
+        measure: Measure = Measure.WALL,
+    ) -> Benchmark[T, U]:
+        data = load_buffer(get_key(self), data_path, self.mapped)
+
+        return sample_benchmark(
+            partial(self.execute_parsing, self.parse_bytes, data),
+            rounds=rounds,
+            warmup=warmup,
+            relative_error=relative_error,
+            budget=budget,
+            limit=limit,
+            measure=measure,
+        )
+
+
+AnyBytesSolution = BytesSolution[Any, Any, Any]
+
+
+class FinalBytesSolution(FinalSolution[I, T], Protocol[I, T]):
+    """Represents final problem solutions parsing the raw data, skipping decoding entirely.
+
+    See [`BytesSolution`][aoc.solutions.BytesSolution] for more information.
+    """
+
+    mapped: ClassVar[bool] = False
+    """Whether to map the data into memory (see [`map_data`][aoc.data.map_data])
+    instead of reading it.
+    """
+
+    @required
+    def parse_bytes(self, data: Buffer) -> I:
+        """Parses the raw data into the input type.
+
+        Arguments:
+            data: The raw data to parse.
+
+        Returns:
+            The input of the problem.
+        """
+        raise NotImplementedError(MUST_IMPLEMENT_PARSE_BYTES)
+
+    def parse(self, data: str) -> I:
+        return self.parse_bytes(data.encode(DEFAULT_ENCODING))
+
+    def load_and_execute(
+        self,
+        data_path: Path = DATA_PATH,
+        profiler: Optional[Profiler] = None,
+        tracker: Optional[Tracker] = None,
+        inputs: Optional[InputCache] = None,
+    ) -> FinalResult[T]:
+        data = load_buffer(get_key(self), data_path, self.mapped)
+
+        return self.execute_parsing(self.parse_bytes, data, profiler, tracker)
+
+    def load_and_execute_benchmark(
+        self,
+        data_path: Path = DATA_PATH,
+        rounds: int = DEFAULT_ROUNDS,
+        warmup: int = DEFAULT_WARMUP,
+        relative_error: Optional[float] = None,
+        budget: Optional[float] = None,
+        limit: int = DEFAULT_LIMIT,
+        measure: Measure = Measure.WALL,
+    ) -> FinalBenchmark[T]:
+        data = load_buffer(get_key(self), data_path, self.mapped)
+
+        return sample_final_benchmark(
+            partial(self.execute_parsing, self.parse_bytes, data),
+            rounds=rounds,
+            warmup=warmup,
+            relative_error=relative_error,
+            budget=budget,
+            limit=limit,
+            measure=measure,
+        )
+
+
+AnyFinalBytesSolution = FinalBytesSolution[Any, Any]
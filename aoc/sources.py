@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+from json import dumps, loads
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Mapping, Optional, final
+
+from attrs import define, field, frozen
+
+from aoc.constants import DATA_PATH, DEFAULT_ENCODING
+from aoc.data import dump_data, get_path_for_key, load_data
+from aoc.errors import DataNotFound
+from aoc.primitives import Key
+from aoc.stores import write_atomic
+
+if TYPE_CHECKING:
+    from aoc.http import HTTPClient
+
+__all__ = (
+    "Metadata",
+    "Fetched",
+    "DataSource",
+    "get_metadata_path_for_key",
+    "load_metadata",
+    "dump_metadata",
+)
+
+NOT_MODIFIED = 304
+
+ETAG_LITERAL = "ETag"
+LAST_MODIFIED_LITERAL = "Last-Modified"
+
+IF_NONE_MATCH_LITERAL = "If-None-Match"
+IF_MODIFIED_SINCE_LITERAL = "If-Modified-Since"
+
+ETAG = "etag"
+LAST_MODIFIED = "last_modified"
+
+METADATA_SUFFIX = ".json"
+
+
+@final
+@frozen()
+class Metadata:
+    """Represents validators of data downloaded, used to revalidate it."""
+
+    etag: Optional[str] = None
+    """The `ETag` of the data, if any."""
+
+    last_modified: Optional[str] = None
+    """The `Last-Modified` date of the data, if any."""
+
+    @classmethod
+    def from_headers(cls, headers: Mapping[str, str]) -> Metadata:
+        """Creates metadata from the response `headers`.
+
+        Arguments:
+            headers: The headers of the response.
+
+        Returns:
+            The metadata created.
+        """
+        return cls(headers.get(ETAG_LITERAL), headers.get(LAST_MODIFIED_LITERAL))
+
+    def to_headers(self) -> Dict[str, str]:
+        """Converts the metadata to the headers of conditional requests.
+
+        Returns:
+            The `If-None-Match` and `If-Modified-Since` headers (for the values present).
+        """
+        headers = {}
+
+        etag = self.etag
+
+        if etag is not None:
+            headers[IF_NONE_MATCH_LITERAL] = etag
+
+        last_modified = self.last_modified
+
+        if last_modified is not None:
+            headers[IF_MODIFIED_SINCE_LITERAL] = last_modified
+
+        return headers
+
+
+def get_metadata_path_for_key(key: Key, data_path: Path = DATA_PATH) -> Path:
+    """Gets the path to the metadata file in `data_path` for the given `key`.
+
+    Arguments:
+        key: The key to get the path for.
+        data_path: The path to the data directory.
+
+    Returns:
+        The path to the metadata file, next to the data file.
+    """
+    path = get_path_for_key(key, data_path)
+
+    return path.with_name(path.name + METADATA_SUFFIX)
+
+
+def load_metadata(key: Key, data_path: Path = DATA_PATH) -> Metadata:
+    """Loads the metadata of the data for the given `key`.
+
+    Missing or corrupted metadata files are treated as empty.
+
+    Arguments:
+        key: The key to load the metadata for.
+        data_path: The path to the data directory.
+
+    Returns:
+        The metadata loaded.
+    """
+    try:
+        content = loads(get_metadata_path_for_key(key, data_path).read_text(DEFAULT_ENCODING))
+
+        return Metadata(content.get(ETAG), content.get(LAST_MODIFIED))
+
+    except Exception:  # missing or corrupted metadata files are empty
+        return Metadata()
+
+
+def dump_metadata(metadata: Metadata, key: Key, data_path: Path = DATA_PATH) -> None:
+    """Dumps the `metadata` of the data for the given `key` (atomically).
+
+    Arguments:
+        metadata: The metadata to dump.
+        key: The key to dump the metadata for.
+        data_path: The path to the data directory.
+    """
+    path = get_metadata_path_for_key(key, data_path)
+
+    content = {ETAG: metadata.etag, LAST_MODIFIED: metadata.last_modified}
+
+    write_atomic(path, dumps(content).encode(DEFAULT_ENCODING))
+
+
+@final
+@frozen()
+class Fetched:
+    """Represents data fetched from sources."""
+
+    data: str
+    """The data fetched."""
+
+    modified: bool
+    """Whether the data was (re)downloaded, as opposed to served from the cache."""
+
+
+@final
+@define()
+class DataSource:
+    """Represents cache-first sources of problem data.
+
+    The data is served from the [`data_path`][aoc.sources.DataSource.data_path] if present,
+    and downloaded using the [`client`][aoc.sources.DataSource.client] otherwise.
+
+    The `ETag` and `Last-Modified` validators of downloaded data are stored next to it
+    (see [`Metadata`][aoc.sources.Metadata]), so that forcing the refresh only sends
+    conditional requests, and unchanged data is never downloaded again.
+    """
+
+    client: HTTPClient = field()
+    """The client to download the data with."""
+
+    data_path: Path = field(default=DATA_PATH)
+    """The path to the data directory."""
+
+    async def get(self, key: Key, force: bool = False) -> Fetched:
+        """Gets the data for the given `key`, from the cache if possible.
+
+        Arguments:
+            key: The key to get the data for.
+            force: Whether to revalidate the cached data (see
+                [`refresh`][aoc.sources.DataSource.refresh]).
+
+        Returns:
+            The data fetched.
+
+        Raises:
+            ClientError: All request attempts failed.
+            OSError: The data could not be dumped.
+        """
+        if not force:
+            try:
+                return Fetched(load_data(key, self.data_path), modified=False)
+
+            except DataNotFound:
+                pass
+
+        return await self.refresh(key)
+
+    async def refresh(self, key: Key) -> Fetched:
+        """Downloads the data for the given `key`, unless the cached one is up to date.
+
+        If the data is cached, the request is conditional on its metadata; when the server
+        replies with `304 Not Modified`, the cached data is returned. Otherwise the data
+        downloaded is dumped along with its metadata.
+
+        Arguments:
+            key: The key to refresh the data for.
+
+        Returns:
+            The data fetched.
+
+        Raises:
+            ClientError: All request attempts failed.
+            OSError: The data could not be dumped.
+        """
+        data_path = self.data_path
+
+        cached = get_path_for_key(key, data_path).is_file()
+
+        metadata = load_metadata(key, data_path) if cached else Metadata()
+
+        response = await self.client.fetch_data(key, headers=metadata.to_headers())
+
+        if response.status == NOT_MODIFIED:
+            try:
+                return Fetched(load_data(key, data_path), modified=False)
+
+            except DataNotFound:  # removed in the meantime
+                response = await self.client.fetch_data(key)
+
+        data = response.text
+
+        dump_data(data, key, data_path)
+        dump_metadata(Metadata.from_headers(response.headers), key, data_path)
+
+        return Fetched(data, modified=True)
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 from enum import Enum, auto
+from re import compile
+from typing import Optional, final
 
+from attrs import frozen
 from typing_extensions import assert_never
 
-__all__ = ("State",)
+__all__ = ("State", "Reply", "parse_wait")
 
 CORRECT_MATCH = "that's the right answer"
 SOLVED_MATCH = "did you already complete it"
@@ -21,9 +24,41 @@ WRONG_MESSAGE = "the answer is wrong"
 TIMEOUT_MESSAGE = "the answer was submitted too recently"
 UNKNOWN_MESSAGE = "the answer state is unknown"
 
+WAIT = compile(r"you have (?:(?P<minutes>\d+)m)?\s*(?:(?P<seconds>\d+)s)? left to wait")
+
+MINUTES = "minutes"
+SECONDS = "seconds"
+
+SECONDS_IN_MINUTE = 60
+
 case_fold = str.casefold
 
 
+def parse_wait(string: str) -> Optional[float]:
+    """Parses the time left to wait before submitting again from the given `string`.
+
+    The string is expected to contain the phrase like `you have 1m 23s left to wait`.
+
+    Arguments:
+        string: The string to parse.
+
+    Returns:
+        The time left to wait, in seconds, or [`None`][None] if it is not found.
+    """
+    match = WAIT.search(case_fold(string))
+
+    if match is None:
+        return None
+
+    minutes = match.group(MINUTES)
+    seconds = match.group(SECONDS)
+
+    if minutes is None and seconds is None:
+        return None
+
+    return float(int(minutes or 0) * SECONDS_IN_MINUTE + int(seconds or 0))
+
+
 class State(Enum):
     """Represents the state of answers."""
 
@@ -111,3 +146,28 @@ class State(Enum):
             return UNKNOWN_MESSAGE
 
         assert_never(self)  # pragma: never
+
+
+@final
+@frozen()
+class Reply:
+    """Represents replies to submitted answers."""
+
+    state: State
+    """The state of the answer."""
+
+    wait: Optional[float] = None
+    """The time left to wait before submitting again, in seconds, if known."""
+
+    @classmethod
+    def match(cls, string: str) -> Reply:
+        """Matches the given `string` and returns the corresponding reply.
+
+        Arguments:
+            string: The string to match.
+
+        Returns:
+            The corresponding reply (see [`State.match`][aoc.states.State.match] and
+            [`parse_wait`][aoc.states.parse_wait]).
+        """
+        return cls(State.match(string), parse_wait(string))
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from os import replace, utime
+from pathlib import Path
+from typing import Optional, final
+
+from attrs import frozen
+
+__all__ = ("Store", "write_atomic")
+
+TEMPORARY_SUFFIX = ".temporary"
+
+ANY = "*"
+
+
+def write_atomic(path: Path, content: bytes) -> None:
+    """Writes the `content` to the `path` atomically.
+
+    The `content` is written to the temporary file next to the `path` first, which then
+    replaces the `path`, so that readers never see partially written files.
+
+    Parent directories are created as needed.
+
+    Arguments:
+        path: The path to write to.
+        content: The content to write.
+
+    Raises:
+        OSError: The content could not be written.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    temporary = path.with_name(path.name + TEMPORARY_SUFFIX)
+
+    temporary.write_bytes(content)
+
+    replace(temporary, path)
+
+
+@final
+@frozen()
+class Store:
+    """Represents content-addressed stores of files, bounded in size.
+
+    Files are named by the hex digests of hashes of whatever they are computed from,
+    and the least recently used files are evicted first once the total size of the store
+    exceeds the [`limit`][aoc.stores.Store.limit].
+    """
+
+    path: Path
+    """The path to the store directory."""
+
+    suffix: str
+    """The suffix of the files in the store."""
+
+    limit: int
+    """The maximum size of the store, in bytes."""
+
+    def get_path(self, digest: str) -> Path:
+        """Returns the path to the file with the given `digest`.
+
+        Arguments:
+            digest: The hex digest of the file.
+
+        Returns:
+            The path to the file.
+        """
+        return self.path / (digest + self.suffix)
+
+    def read(self, digest: str) -> Optional[bytes]:
+        """Reads the file with the given `digest`, marking it as recently used.
+
+        Arguments:
+            digest: The hex digest of the file.
+
+        Returns:
+            The content of the file, or [`None`][None] if it could not be read.
+        """
+        path = self.get_path(digest)
+
+        try:
+            content = path.read_bytes()
+
+        except OSError:
+            return None
+
+        try:
+            utime(path)  # mark as recently used
+
+        except OSError:
+            pass
+
+        return content
+
+    def write(self, digest: str, content: bytes) -> None:
+        """Writes the file with the given `digest` atomically (see
+        [`write_atomic`][aoc.stores.write_atomic]), evicting files to fit the limit.
+
+        Arguments:
+            digest: The hex digest of the file.
+            content: The content to write.
+
+        Raises:
+            OSError: The content could not be written.
+        """
+        write_atomic(self.get_path(digest), content)
+
+        self.evict()
+
+    def evict(self) -> None:
+        """Evicts the least recently used files until the store fits the limit."""
+        files = []
+
+        for path in self.path.glob(ANY + self.suffix):
+            try:
+                status = path.stat()
+
+            except OSError:
+                continue
+
+            files.append((status.st_mtime, status.st_size, path))
+
+        total = sum(size for _, size, _ in files)
+
+        limit = self.limit
+
+        for _, size, path in sorted(files):
+            if total <= limit:
+                break
+
+            path.unlink(missing_ok=True)
+
+            total -= size
@@ -0,0 +1,352 @@
+from __future__ import annotations
+
+from json import dumps, loads
+from pathlib import Path
+from time import time
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    final,
+)
+
+from attrs import define, evolve, field, frozen
+
+from aoc.constants import DEFAULT_ENCODING, DEFAULT_SUBMISSION_WAIT, SUBMISSIONS_PATH
+from aoc.primitives import Day, Key, Part, Year
+from aoc.states import Reply, State
+from aoc.stores import write_atomic
+
+if TYPE_CHECKING:
+    from aoc.http import HTTPClient
+
+__all__ = (
+    "ProblemPart",
+    "Submission",
+    "SubmissionQueue",
+    "get_wait",
+    "submit_answer",
+    "resubmit_answers",
+)
+
+ProblemPart = Tuple[Key, Part]
+"""Represents keys and parts of problems."""
+
+YEAR = "year"
+DAY = "day"
+PART = "part"
+ANSWER = "answer"
+DUE = "due"
+
+
+@final
+@frozen()
+class Submission:
+    """Represents pending submissions of answers."""
+
+    key: Key
+    """The key of the problem."""
+
+    part: Part
+    """The part of the problem."""
+
+    answer: str
+    """The answer to submit."""
+
+    due: float
+    """The time to submit the answer at, as the UNIX timestamp."""
+
+    def dump(self) -> Dict[str, Any]:
+        """Dumps the submission into the JSON-compatible record.
+
+        Returns:
+            The record of the submission.
+        """
+        key = self.key
+
+        return {
+            YEAR: key.year.value,
+            DAY: key.day.value,
+            PART: self.part.value,
+            ANSWER: self.answer,
+            DUE: self.due,
+        }
+
+    @classmethod
+    def load(cls, content: Dict[str, Any]) -> Submission:
+        """Loads the submission from the record.
+
+        Arguments:
+            content: The record to load the submission from.
+
+        Returns:
+            The submission loaded.
+
+        Raises:
+            KeyError: The record is missing values.
+            ValueError: The record contains invalid values.
+        """
+        key = Key(Year(content[YEAR]), Day(content[DAY]))
+
+        return cls(key, Part(content[PART]), str(content[ANSWER]), float(content[DUE]))
+
+
+def get_wait(reply: Reply) -> float:
+    """Returns the time to wait before resubmitting after the `reply`.
+
+    Arguments:
+        reply: The reply to the submission.
+
+    Returns:
+        The time to wait, in seconds (defaults to
+        [`DEFAULT_SUBMISSION_WAIT`][aoc.constants.DEFAULT_SUBMISSION_WAIT]).
+    """
+    wait = reply.wait
+
+    return DEFAULT_SUBMISSION_WAIT if wait is None else wait
+
+
+@final
+@define()
+class SubmissionQueue:
+    """Represents queues of pending submissions, stored in JSON files.
+
+    Answers submitted too recently (see [`TIMEOUT`][aoc.states.State.TIMEOUT]) are queued
+    along with the time they can be resubmitted at, and the queue is dumped on every change,
+    so that no answers are lost if the process exits before resubmitting them.
+    """
+
+    path: Optional[Path] = field(default=SUBMISSIONS_PATH)
+    """The path to the queue file ([`None`][None] to keep the queue in memory only)."""
+
+    submissions: List[Submission] = field(factory=list, init=False)
+    """The pending submissions, in order of due times."""
+
+    pushed: Set[ProblemPart] = field(factory=set, init=False)
+    """The problem parts pushed since the queue was created (as opposed to loaded)."""
+
+    def __attrs_post_init__(self) -> None:
+        self.load()
+
+    def __len__(self) -> int:
+        return len(self.submissions)
+
+    def load(self) -> None:
+        """Loads the queue from the [`path`][aoc.submissions.SubmissionQueue.path], if possible.
+
+        Missing or corrupted queue files are treated as empty.
+        """
+        path = self.path
+
+        if path is None:
+            return
+
+        try:
+            content = loads(path.read_text(DEFAULT_ENCODING))
+
+            submissions = [Submission.load(item) for item in content]
+
+        except Exception:  # missing or corrupted queue files are empty
+            return
+
+        submissions.sort(key=get_due)
+
+        self.submissions = submissions
+
+    def dump(self) -> None:
+        """Dumps the queue to the [`path`][aoc.submissions.SubmissionQueue.path] (atomically)."""
+        path = self.path
+
+        if path is None:
+            return
+
+        content = [submission.dump() for submission in self.submissions]
+
+        write_atomic(path, dumps(content).encode(DEFAULT_ENCODING))
+
+    def push(self, submission: Submission) -> None:
+        """Pushes the `submission` onto the queue and dumps it.
+
+        Pending submissions for the same problem part are replaced, so that only
+        the latest answer is resubmitted.
+
+        Arguments:
+            submission: The submission to push.
+        """
+        submissions = self.get_others(submission.key, submission.part)
+
+        submissions.append(submission)
+        submissions.sort(key=get_due)
+
+        self.submissions = submissions
+
+        self.pushed.add((submission.key, submission.part))
+
+        self.dump()
+
+    def discard(self, key: Key, part: Part) -> None:
+        """Discards the pending submission for the problem `part` and the given `key`, if any.
+
+        Arguments:
+            key: The key of the problem.
+            part: The part of the problem.
+        """
+        submissions = self.get_others(key, part)
+
+        if len(submissions) != len(self.submissions):
+            self.submissions = submissions
+
+            self.dump()
+
+    def get_others(self, key: Key, part: Part) -> List[Submission]:
+        return [
+            pending
+            for pending in self.submissions
+            if pending.key != key or pending.part is not part
+        ]
+
+    def remove(self, submission: Submission) -> None:
+        """Removes the `submission` from the queue (if present) and dumps it.
+
+        Arguments:
+            submission: The submission to remove.
+        """
+        submissions = self.submissions
+
+        if submission in submissions:
+            submissions.remove(submission)
+
+            self.dump()
+
+    def select(self, parts: Optional[AbstractSet[ProblemPart]] = None) -> List[Submission]:
+        """Selects the submissions for the given problem `parts`.
+
+        Arguments:
+            parts: The keys and parts of problems to select ([`None`][None] means all).
+
+        Returns:
+            The submissions selected, in order of due times.
+        """
+        if parts is None:
+            return list(self.submissions)
+
+        return [
+            submission
+            for submission in self.submissions
+            if (submission.key, submission.part) in parts
+        ]
+
+    def peek(self, parts: Optional[AbstractSet[ProblemPart]] = None) -> Optional[Submission]:
+        """Returns the submission due first, if any.
+
+        Arguments:
+            parts: The keys and parts of problems to consider ([`None`][None] means all).
+
+        Returns:
+            The submission due first, or [`None`][None] if there are none.
+        """
+        submissions = self.select(parts)
+
+        return submissions[0] if submissions else None
+
+
+def get_due(submission: Submission) -> float:
+    return submission.due
+
+
+async def submit_answer(
+    client: HTTPClient, queue: SubmissionQueue, key: Key, part: Part, answer: Any
+) -> Reply:
+    """Submits the `answer` for the problem `part` and the given `key`, queueing it
+    for resubmission if it was submitted too recently.
+
+    Arguments:
+        client: The client to submit the answer with.
+        queue: The queue to push the submission onto.
+        key: The key of the problem.
+        part: The part of the problem.
+        answer: The answer to submit.
+
+    Returns:
+        The reply to the submission.
+
+    Raises:
+        ClientError: All request attempts failed.
+    """
+    reply = await client.submit_answer_reply(key, part, answer)
+
+    if reply.state is State.TIMEOUT:
+        queue.push(Submission(key, part, str(answer), time() + get_wait(reply)))
+
+    else:  # the pending answer (if any) is superseded
+        queue.discard(key, part)
+
+    return reply
+
+
+Done = Callable[[Submission, Reply], None]
+
+
+async def resubmit_answers(
+    client: HTTPClient,
+    queue: SubmissionQueue,
+    done: Done,
+    wait: bool = True,
+    parts: Optional[AbstractSet[ProblemPart]] = None,
+) -> None:
+    """Resubmits the submissions in the `queue` as soon as they are due.
+
+    Submissions that are rejected again for being too recent are pushed back with the new
+    due times; the rest are removed from the queue.
+
+    Arguments:
+        client: The client to resubmit answers with.
+        queue: The queue of pending submissions.
+        done: The function to call with each submission and the reply to it.
+        wait: Whether to wait for submissions that are not due yet
+            (otherwise, only the ones due already are resubmitted).
+        parts: The keys and parts of problems to resubmit answers for
+            ([`None`][None] means all; for instance,
+            [`pushed`][aoc.submissions.SubmissionQueue.pushed] only resubmits the answers
+            queued by this process).
+
+    Raises:
+        ClientError: All request attempts failed (the submission stays queued).
+    """
+    if not queue.select(parts):
+        return
+
+    async with client:
+        while True:
+            submission = queue.peek(parts)
+
+            if submission is None:
+                return
+
+            delay = submission.due - time()
+
+            if delay > 0.0:
+                if not wait:
+                    return
+
+                from asyncio import sleep
+
+                await sleep(delay)
+
+            reply = await client.submit_answer_reply(
+                submission.key, submission.part, submission.answer
+            )
+
+            if reply.state is State.TIMEOUT:
+                queue.push(evolve(submission, due=time() + get_wait(reply)))
+
+            else:
+                queue.remove(submission)
+
+            done(submission, reply)
@@ -1,13 +1,27 @@
+from __future__ import annotations
+
+from enum import Enum
+from functools import lru_cache
 from time import perf_counter_ns as default_clock
-from typing import Final, final
+from time import process_time_ns as default_process_clock
+from time import thread_time_ns as default_thread_clock
+from typing import Final, Optional, final
 
 from attrs import field, frozen
 from typing_aliases import Nullary
 from typing_extensions import Self
 
-from aoc.constants import DEFAULT_ROUNDING
+from aoc.constants import DEFAULT_CALIBRATION_ROUNDS, DEFAULT_ROUNDING
 
-__all__ = ("Elapsed", "Clock", "Timer", "now")
+__all__ = (
+    "Elapsed",
+    "Measure",
+    "Clock",
+    "Overhead",
+    "Timer",
+    "calibrate",
+    "now",
+)
 
 FACTORS: Final = (("s", 1_000_000_000), ("ms", 1_000_000), ("us", 1_000), ("ns", 1))
 INSTANT: Final = "instant"
@@ -16,10 +30,31 @@ Clock = Nullary[int]
 """The type representing clocks which return time in nanoseconds."""
 
 
+class Measure(Enum):
+    """Represents measures of time."""
+
+    WALL = "wall"
+    """The wall-clock time."""
+
+    PROCESS = "process"
+    """The CPU time of the process (summed over all of its threads)."""
+
+    THREAD = "thread"
+    """The CPU time of the current thread."""
+
+
+NOT_MEASURED = "{} time was not measured"
+not_measured = NOT_MEASURED.format
+
+
 @final
 @frozen()
 class Elapsed:
-    """Represents elapsed time, in nanoseconds and human-readable format."""
+    """Represents elapsed time, in nanoseconds and human-readable format.
+
+    The [`nanoseconds`][aoc.timers.Elapsed.nanoseconds] are always the wall-clock time;
+    CPU times are optional, as not every clock measures them.
+    """
 
     nanoseconds: int = field()
     """The time elapsed, in nanoseconds."""
@@ -27,34 +62,154 @@ class Elapsed:
     rounding: int = field(default=DEFAULT_ROUNDING)
     """The rounding to use when converting to human-readable format."""
 
+    process_nanoseconds: Optional[int] = field(default=None, kw_only=True)
+    """The CPU time of the process elapsed, in nanoseconds, if measured."""
+
+    thread_nanoseconds: Optional[int] = field(default=None, kw_only=True)
+    """The CPU time of the current thread elapsed, in nanoseconds, if measured."""
+
     string: str = field(init=False)
     """The time elapsed, in human-readable format."""
 
     @string.default
     def default_string(self) -> str:
-        nanoseconds = self.nanoseconds
-
-        for name, factor in FACTORS:
-            if nanoseconds > factor:
-                return str(round(nanoseconds / factor, self.rounding)) + name
-
-        return INSTANT
+        return format_nanoseconds(self.nanoseconds, self.rounding)
 
     def __str__(self) -> str:
         return self.string
 
+    @property
+    def process_time(self) -> Optional[Elapsed]:
+        """The CPU time of the process elapsed, if measured."""
+        return self.create_elapsed(self.process_nanoseconds)
+
+    @property
+    def thread_time(self) -> Optional[Elapsed]:
+        """The CPU time of the current thread elapsed, if measured."""
+        return self.create_elapsed(self.thread_nanoseconds)
+
+    def get_nanoseconds(self, measure: Measure) -> int:
+        """Returns the time elapsed according to the `measure`, in nanoseconds.
+
+        Arguments:
+            measure: The measure of time to use.
+
+        Returns:
+            The time elapsed, in nanoseconds.
+
+        Raises:
+            ValueError: The time was not measured according to the `measure`.
+        """
+        if measure is Measure.WALL:
+            return self.nanoseconds
+
+        nanoseconds = (
+            self.process_nanoseconds if measure is Measure.PROCESS else self.thread_nanoseconds
+        )
+
+        if nanoseconds is None:
+            raise ValueError(not_measured(measure.value))
+
+        return nanoseconds
+
+    def create_elapsed(self, nanoseconds: Optional[int]) -> Optional[Elapsed]:
+        return None if nanoseconds is None else Elapsed(nanoseconds, self.rounding)
+
+
+def format_nanoseconds(nanoseconds: int, rounding: int) -> str:
+    for name, factor in FACTORS:
+        if nanoseconds > factor:
+            return str(round(nanoseconds / factor, rounding)) + name
+
+    return INSTANT
+
+
+@final
+@frozen()
+class Overhead:
+    """Represents overheads of timing, in nanoseconds, by measures."""
+
+    wall: int = 0
+    """The wall-clock overhead."""
+
+    process: int = 0
+    """The process CPU time overhead."""
+
+    thread: int = 0
+    """The thread CPU time overhead."""
+
+
+NO_OVERHEAD = Overhead()
+
+
+def subtract(nanoseconds: int, overhead: int) -> int:
+    return max(nanoseconds - overhead, 0)
+
+
+def subtract_optional(nanoseconds: Optional[int], overhead: int) -> Optional[int]:
+    return None if nanoseconds is None else subtract(nanoseconds, overhead)
+
+
+def read_optional(clock: Optional[Clock]) -> Optional[int]:
+    return None if clock is None else clock()
+
 
 @final
 @frozen()
 class Timer:
-    """Represents timers."""
+    """Represents timers.
+
+    Timers measure wall-clock time along with process and thread CPU times, when the respective
+    clocks are given. The [`overhead`][aoc.timers.Timer.overhead] of timing itself is subtracted
+    from the times measured (which never go below zero).
+
+    The overhead is calibrated once per process (see [`calibrate`][aoc.timers.calibrate])
+    for timers using the default clocks, and is assumed to be zero otherwise.
+    """
 
     clock: Clock = field(default=default_clock)
-    """The clock to use."""
+    """The wall clock to use."""
+
+    process_clock: Optional[Clock] = field(default=default_process_clock)
+    """The process CPU clock to use, if any."""
+
+    thread_clock: Optional[Clock] = field(default=default_thread_clock)
+    """The thread CPU clock to use, if any."""
+
+    overhead: Overhead = field()
+    """The overhead to subtract."""
+
+    @overhead.default
+    def default_overhead(self) -> Overhead:
+        if (
+            self.clock is default_clock
+            and self.process_clock is default_process_clock
+            and self.thread_clock is default_thread_clock
+        ):
+            return default_calibrate()
+
+        return NO_OVERHEAD
+
+    process_created: Optional[int] = field(init=False)
+    """The creation process CPU time of the timer, if measured."""
+
+    thread_created: Optional[int] = field(init=False)
+    """The creation thread CPU time of the timer, if measured."""
 
     created: int = field(init=False)
     """The creation time of the timer."""
 
+    # CPU clocks are read first and the wall clock last on creation (and vice versa
+    # on measuring), so that the wall-clock time includes as little overhead as possible
+
+    @process_created.default
+    def default_process_created(self) -> Optional[int]:
+        return read_optional(self.process_clock)
+
+    @thread_created.default
+    def default_thread_created(self) -> Optional[int]:
+        return read_optional(self.thread_clock)
+
     @created.default
     def default_created(self) -> int:
         return self.clock()
@@ -65,15 +220,79 @@ class Timer:
         Returns:
             The time elapsed since the creation of this timer.
         """
-        return Elapsed(self.clock() - self.created, rounding)
+        current = self.clock()
+
+        process_current = read_optional(self.process_clock)
+        thread_current = read_optional(self.thread_clock)
+
+        overhead = self.overhead
+
+        return Elapsed(
+            subtract(current - self.created, overhead.wall),
+            rounding,
+            process_nanoseconds=subtract_optional(
+                difference_optional(process_current, self.process_created), overhead.process
+            ),
+            thread_nanoseconds=subtract_optional(
+                difference_optional(thread_current, self.thread_created), overhead.thread
+            ),
+        )
 
     def reset(self) -> Self:
-        """Creates and returns a new timer of the same type with the same clock.
+        """Creates and returns a new timer of the same type with the same clocks and overhead.
 
         Returns:
             The timer created.
         """
-        return type(self)(self.clock)
+        return type(self)(self.clock, self.process_clock, self.thread_clock, self.overhead)
+
+
+def difference_optional(current: Optional[int], created: Optional[int]) -> Optional[int]:
+    return None if current is None or created is None else current - created
+
+
+def calibrate(
+    clock: Clock = default_clock,
+    process_clock: Optional[Clock] = default_process_clock,
+    thread_clock: Optional[Clock] = default_thread_clock,
+    rounds: int = DEFAULT_CALIBRATION_ROUNDS,
+) -> Overhead:
+    """Calibrates the overhead of timing with the given clocks.
+
+    The overhead is estimated as the minimum time measured for doing nothing
+    over the given amount of `rounds`.
+
+    Arguments:
+        clock: The wall clock to use.
+        process_clock: The process CPU clock to use, if any.
+        thread_clock: The thread CPU clock to use, if any.
+        rounds: The amount of rounds to calibrate for.
+
+    Returns:
+        The overhead calibrated.
+    """
+    wall = process = thread = None
+
+    for _ in range(rounds):
+        elapsed = Timer(clock, process_clock, thread_clock, NO_OVERHEAD).elapsed()
+
+        wall = minimum_optional(wall, elapsed.nanoseconds)
+        process = minimum_optional(process, elapsed.process_nanoseconds)
+        thread = minimum_optional(thread, elapsed.thread_nanoseconds)
+
+    return Overhead(wall or 0, process or 0, thread or 0)
+
+
+def minimum_optional(current: Optional[int], value: Optional[int]) -> Optional[int]:
+    if value is None:
+        return current
+
+    return value if current is None else min(current, value)
+
+
+@lru_cache(maxsize=None)
+def default_calibrate() -> Overhead:
+    return calibrate()
 
 
 def now(clock: Clock = default_clock) -> Timer:
@@ -0,0 +1,114 @@
+from pathlib import Path
+from sys import modules as loaded_modules
+from time import sleep
+from typing import Dict, Iterable, Iterator, List, Optional, final
+
+from attrs import define, field
+
+from aoc.constants import DEFAULT_INTERVAL
+from aoc.modules import find_local_modules
+
+__all__ = ("Snapshot", "Watcher", "unload_modules")
+
+Snapshot = Dict[Path, Optional[int]]
+"""Represents snapshots of modification times of files, in nanoseconds."""
+
+
+def get_modification_time(path: Path) -> Optional[int]:
+    try:
+        return path.stat().st_mtime_ns
+
+    except OSError:
+        return None
+
+
+def take_snapshot(path: Path) -> Snapshot:
+    return {module: get_modification_time(module) for module in (path, *find_local_modules(path))}
+
+
+@final
+@define()
+class Watcher:
+    """Represents watchers that poll modules (and their local modules) for changes."""
+
+    paths: List[Path] = field()
+    """The paths to the modules to watch."""
+
+    interval: float = field(default=DEFAULT_INTERVAL)
+    """The polling interval, in seconds."""
+
+    snapshots: Dict[Path, Snapshot] = field(init=False)
+    """The last snapshots taken for each module."""
+
+    @snapshots.default
+    def default_snapshots(self) -> Dict[Path, Snapshot]:
+        return {path: take_snapshot(path) for path in self.paths}
+
+    def changed(self) -> List[Path]:
+        """Takes new snapshots and returns the paths to the modules that changed since
+        the last snapshots, along with any of their local modules.
+
+        Returns:
+            The paths to the modules changed, in order.
+        """
+        snapshots = self.snapshots
+
+        changed = []
+
+        for path in self.paths:
+            snapshot = take_snapshot(path)
+
+            if snapshot != snapshots[path]:
+                snapshots[path] = snapshot
+
+                changed.append(path)
+
+        return changed
+
+    def get_files(self, paths: Iterable[Path]) -> List[Path]:
+        """Returns the files tracked by the snapshots of the modules at `paths`.
+
+        Arguments:
+            paths: The paths to the modules.
+
+        Returns:
+            The files tracked.
+        """
+        snapshots = self.snapshots
+
+        return [file for path in paths for file in snapshots[path]]
+
+    def watch(self) -> Iterator[List[Path]]:
+        """Polls for changes every [`interval`][aoc.watchers.Watcher.interval] seconds,
+        yielding the paths to the modules that changed.
+
+        Returns:
+            The iterator over non-empty lists of the paths to the modules changed.
+        """
+        interval = self.interval
+
+        while True:
+            sleep(interval)
+
+            changed = self.changed()
+
+            if changed:
+                yield changed
+
+
+def unload_modules(paths: Iterable[Path]) -> None:
+    """Removes the modules loaded from `paths` from [`sys.modules`][sys.modules],
+    so that they are loaded anew when imported again.
+
+    Third-party modules stay loaded.
+
+    Arguments:
+        paths: The paths to the modules to unload.
+    """
+    targets = {path.resolve() for path in paths}
+
+    for name, module in list(loaded_modules.items()):
+        file = getattr(module, "__file__", None)
+
+        if file is not None and Path(file).resolve() in targets:
+            del loaded_modules[name]
@@ -0,0 +1,105 @@
+"""Compares requests per second of HTTP clients with and without the pooled session.
+
+The local stand-in server serves problem data, and the client downloads it repeatedly,
+either within its own session for each request, or within the pooled one.
+
+```console
+$ python benchmarks/clients.py [requests] [concurrency]
+```
+"""
+
+from asyncio import Semaphore, gather, run
+from sys import argv
+from typing import Awaitable, Callable, List, Tuple
+
+from aiohttp import web
+
+from aoc.http import HTTPClient
+from aoc.primitives import Day, Key, Year
+from aoc.timers import now
+
+DEFAULT_REQUESTS = 2000
+DEFAULT_CONCURRENCY = 10
+
+HOST = "127.0.0.1"
+PORT = 0  # any free port
+
+DATA = "(" * 10000
+
+TOKEN = "token"
+
+KEY = Key(Year(2015), Day(1))
+
+BASE_URL = "http://{}:{}/"
+base_url = BASE_URL.format
+
+RESULT = "{:>8} | {} request(s) in {} | {} request(s) per second"
+result_string = RESULT.format
+
+ROUTE = "/{year}/day/{day}/input"
+
+NANOSECONDS = 1_000_000_000
+
+
+async def handle(request: web.Request) -> web.Response:
+    return web.Response(text=DATA)
+
+
+async def download_all(client: HTTPClient, requests: int, concurrency: int) -> None:
+    semaphore = Semaphore(concurrency)
+
+    async def download() -> None:
+        async with semaphore:
+            await client.download_data(KEY)
+
+    await gather(*(download() for _ in range(requests)))
+
+
+async def unpooled(client: HTTPClient, requests: int, concurrency: int) -> None:
+    await download_all(client, requests, concurrency)
+
+
+async def pooled(client: HTTPClient, requests: int, concurrency: int) -> None:
+    async with client:
+        await download_all(client, requests, concurrency)
+
+
+async def main(requests: int = DEFAULT_REQUESTS, concurrency: int = DEFAULT_CONCURRENCY) -> None:
+    application = web.Application()
+    application.router.add_get(ROUTE, handle)
+
+    runner = web.AppRunner(application, access_log=None)
+
+    await runner.setup()
+
+    site = web.TCPSite(runner, HOST, PORT)
+
+    await site.start()
+
+    _, port = runner.addresses[0][:2]
+
+    client = HTTPClient(TOKEN, retries=0, base_url=base_url(HOST, port))
+
+    cases: List[Tuple[str, Callable[[HTTPClient, int, int], Awaitable[None]]]] = [
+        ("unpooled", unpooled),
+        ("pooled", pooled),
+    ]
+
+    try:
+        for name, function in cases:
+            timer = now()
+
+            await function(client, requests, concurrency)
+
+            elapsed = timer.elapsed()
+
+            rate = round(requests * NANOSECONDS / elapsed.nanoseconds)
+
+            print(result_string(name, requests, elapsed, rate))
+
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    run(main(*map(int, argv[1:3])))
@@ -0,0 +1,129 @@
+"""Compares lazy splitters from `aoc.ext.splits` against the list ones.
+
+Each splitter chains blocks, lines and fields over the generated input, counting the fields.
+
+```console
+$ python benchmarks/splits.py [size]
+```
+"""
+
+from random import Random
+from sys import argv
+from typing import Callable, Iterable, List, Tuple
+
+from aoc.ext.constants import DOUBLE_NEW_LINE, NEW_LINE
+from aoc.ext.splits import (
+    iter_blocks,
+    iter_fields,
+    iter_split_lines,
+    split_double_lines,
+    split_lines,
+    split_whitespace,
+)
+from aoc.memory import Tracker
+from aoc.timers import Elapsed, now
+
+DEFAULT_SIZE = 1 << 24  # 16 MiB
+
+SEED = 13
+
+LINES_PER_BLOCK = 10
+FIELDS_PER_LINE = 8
+FIELD_LIMIT = 1_000_000
+
+SPACE = " "
+
+ROUNDS = 5
+
+RESULT = "{:>6} | time {} | peak {} | fields {}"
+result_string = RESULT.format
+
+SIZE = "input size {} bytes"
+size_string = SIZE.format
+
+
+def generate(size: int, seed: int = SEED) -> str:
+    random = Random(seed)
+
+    blocks: List[str] = []
+
+    total = 0
+
+    while total < size:
+        block = NEW_LINE.join(
+            SPACE.join(str(random.randrange(FIELD_LIMIT)) for _ in range(FIELDS_PER_LINE))
+            for _ in range(LINES_PER_BLOCK)
+        )
+
+        blocks.append(block)
+
+        total += len(block) + len(DOUBLE_NEW_LINE)
+
+    return DOUBLE_NEW_LINE.join(blocks)
+
+
+def count_lists(string: str) -> int:
+    return sum(
+        len(split_whitespace(line))
+        for block in split_double_lines(string)
+        for line in split_lines(block)
+    )
+
+
+def count_lazy(string: str) -> int:
+    return sum(
+        1
+        for block in iter_blocks(string)
+        for line in iter_split_lines(block)
+        for _ in iter_fields(line)
+    )
+
+
+def count_mixed(string: str) -> int:  # lazy blocks and lines, materialized fields of each line
+    return sum(
+        len(split_whitespace(line))
+        for block in iter_blocks(string)
+        for line in iter_split_lines(block)
+    )
+
+
+def measure(function: Callable[[str], int], string: str) -> Tuple[int, Elapsed, str]:
+    best = None
+
+    for _ in range(ROUNDS):
+        timer = now()
+
+        count = function(string)
+
+        elapsed = timer.elapsed()
+
+        if best is None or elapsed.nanoseconds < best.nanoseconds:
+            best = elapsed
+
+    _, memory = Tracker(top=0).call(function, string)
+
+    assert best is not None
+
+    return (count, best, str(memory.peak))
+
+
+CASES: Iterable[Tuple[str, Callable[[str], int]]] = (
+    ("lists", count_lists),
+    ("lazy", count_lazy),
+    ("mixed", count_mixed),
+)
+
+
+def main(size: int = DEFAULT_SIZE) -> None:
+    string = generate(size)
+
+    print(size_string(len(string)))
+
+    for name, function in CASES:
+        count, elapsed, peak = measure(function, string)
+
+        print(result_string(name, elapsed, peak, count))
+
+
+if __name__ == "__main__":
+    main(*map(int, argv[1:2]))
@@ -0,0 +1,73 @@
+from typing import Tuple
+
+import pytest
+
+from aoc.benchmarks import Statistics, mann_whitney, sample
+from aoc.timers import Elapsed
+
+SAMPLES = [5, 1, 4, 2, 3]
+
+
+def test_statistics() -> None:
+    statistics = Statistics(SAMPLES)
+
+    assert statistics.samples == sorted(SAMPLES)
+    assert statistics.count == len(SAMPLES)
+
+    assert statistics.minimum.nanoseconds == 1
+    assert statistics.maximum.nanoseconds == 5
+    assert statistics.median.nanoseconds == 3
+    assert statistics.mean.nanoseconds == 3
+
+    assert statistics.deviation_value == pytest.approx(2.5**0.5)
+
+
+def test_percentile() -> None:
+    statistics = Statistics(SAMPLES)
+
+    assert statistics.percentile(0.0).nanoseconds == 1
+    assert statistics.percentile(100.0).nanoseconds == 5
+    assert statistics.percentile(62.5).nanoseconds == 4  # 3.5 rounds to 4
+
+    with pytest.raises(ValueError):
+        statistics.percentile(101.0)
+
+
+def test_statistics_empty() -> None:
+    with pytest.raises(ValueError):
+        Statistics([])
+
+
+def execute() -> Elapsed:
+    return Elapsed(100)
+
+
+def phases(elapsed: Elapsed) -> Tuple[Elapsed]:
+    return (elapsed,)
+
+
+def test_sample_fixed() -> None:
+    assert len(sample(execute, phases, rounds=7, warmup=3)) == 7
+
+
+def test_sample_adaptive() -> None:
+    # constant samples reach any relative error immediately
+    assert len(sample(execute, phases, rounds=1, warmup=0, relative_error=0.01)) == 2
+
+
+def test_sample_limit() -> None:
+    assert len(sample(execute, phases, rounds=1, warmup=0, budget=60.0, limit=10)) == 10
+
+
+BASELINE = [100, 101, 102, 103, 104, 105, 106, 107, 108, 109]
+SLOWER = [sample + 50 for sample in BASELINE]
+
+
+def test_mann_whitney() -> None:
+    assert mann_whitney(BASELINE, SLOWER) < 0.001
+    assert mann_whitney(SLOWER, BASELINE) > 0.999
+
+    assert mann_whitney(BASELINE, BASELINE) > 0.1
+
+    assert mann_whitney([1, 1], [1, 1]) == 1.0
+    assert mann_whitney([], BASELINE) == 1.0
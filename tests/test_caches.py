@@ -0,0 +1,106 @@
+from pathlib import Path
+
+import pytest
+
+from aoc import caches
+from aoc.caches import ResultCache
+from aoc.data import dump_data
+from aoc.modules import find_local_modules, hash_module
+from aoc.primitives import Day, Key, Year
+from aoc.runners import Results
+from aoc.solutions import FinalResult
+from aoc.timers import Elapsed
+
+KEY = Key(Year(2015), Day(25))
+
+DATA = "data"
+CHANGED = "changed"
+
+SOURCE = "import helper\n"
+HELPER = "VALUE = 13\n"
+CHANGED_HELPER = "VALUE = 42\n"
+
+ANSWER = 13
+
+
+def create_results() -> Results:
+    final_result = FinalResult(ANSWER, Elapsed(1), Elapsed(2))
+
+    return Results({}, {KEY: final_result})
+
+
+def create_module(tmp_path: Path) -> Path:
+    path = tmp_path / "solution.py"
+    path.write_text(SOURCE)
+
+    (tmp_path / "helper.py").write_text(HELPER)
+
+    return path
+
+
+def test_find_local_modules(tmp_path: Path) -> None:
+    path = create_module(tmp_path)
+
+    assert find_local_modules(path) == [(tmp_path / "helper.py").resolve()]
+
+
+def test_hash_module(tmp_path: Path) -> None:
+    path = create_module(tmp_path)
+
+    hash = hash_module(path)
+
+    (tmp_path / "helper.py").write_text(CHANGED_HELPER)
+
+    assert hash_module(path) != hash
+
+
+def test_result_cache(tmp_path: Path) -> None:
+    path = create_module(tmp_path)
+
+    data_path = tmp_path / "data"
+
+    dump_data(DATA, KEY, data_path)
+
+    cache = ResultCache(tmp_path / "cache")
+
+    assert cache.load(path, data_path) is None
+
+    cache.dump(path, create_results(), data_path)
+
+    results = cache.load(path, data_path)
+
+    assert results is not None
+    assert results.cached
+    assert results.final_results[KEY].answer == ANSWER
+
+    assert ResultCache(tmp_path / "cache", refresh=True).load(path, data_path) is None
+
+    dump_data(CHANGED, KEY, data_path)
+
+    assert cache.load(path, data_path) is None
+
+
+def test_result_cache_version(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = create_module(tmp_path)
+
+    data_path = tmp_path / "data"
+
+    dump_data(DATA, KEY, data_path)
+
+    cache = ResultCache(tmp_path / "cache")
+
+    cache.dump(path, create_results(), data_path)
+
+    monkeypatch.setattr(caches, "__version__", "0.0.0")  # results are not reused across versions
+
+    assert cache.load(path, data_path) is None
+
+
+def test_result_cache_evict(tmp_path: Path) -> None:
+    path = create_module(tmp_path)
+
+    cache = ResultCache(tmp_path / "cache", limit=0)
+
+    cache.dump(path, create_results(), tmp_path / "data")
+
+    assert not list(cache.path.iterdir())
@@ -0,0 +1,47 @@
+from mmap import mmap
+from pathlib import Path
+
+import pytest
+
+from aoc.data import dump_data, iter_lines, load_data_bytes, map_data, open_data
+from aoc.errors import DataNotFound
+from aoc.primitives import Day, Key, Year
+
+KEY = Key(Year(2015), Day(1))
+
+DATA = "((())\n)(\n"
+
+
+def test_load_data_bytes(tmp_path: Path) -> None:
+    dump_data(DATA, KEY, tmp_path)
+
+    assert load_data_bytes(KEY, tmp_path) == DATA.encode()
+
+
+def test_map_data(tmp_path: Path) -> None:
+    dump_data(DATA, KEY, tmp_path)
+
+    data = map_data(KEY, tmp_path)
+
+    assert isinstance(data, mmap)
+    assert data[:] == DATA.encode()
+
+    data.close()
+
+
+def test_map_data_empty(tmp_path: Path) -> None:
+    dump_data("", KEY, tmp_path)
+
+    assert map_data(KEY, tmp_path) == bytes()
+
+
+def test_map_data_not_found(tmp_path: Path) -> None:
+    with pytest.raises(DataNotFound):
+        map_data(KEY, tmp_path)
+
+
+def test_iter_lines(tmp_path: Path) -> None:
+    dump_data(DATA, KEY, tmp_path)
+
+    with open_data(KEY, tmp_path) as file:
+        assert list(iter_lines(file)) == DATA.splitlines()
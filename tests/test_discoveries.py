@@ -0,0 +1,98 @@
+from pathlib import Path
+
+from aoc.discoveries import Index, discover, find_keys
+from aoc.primitives import Day, Key, Year
+
+SOURCE = """
+from aoc.solutions import FinalSolution, Solution
+
+
+class Year2016Day02(Solution[str, int, int]):
+    ...
+
+
+class Year2016Day25(FinalSolution[str, int]):
+    ...
+
+
+class Helper:
+    ...
+"""
+
+OTHER = """
+class Year2015Day01:
+    ...
+"""
+
+BROKEN = "class Year2017Day01("
+
+KEY = Key(Year(2016), Day(2))
+FINAL_KEY = Key(Year(2016), Day(25))
+OTHER_KEY = Key(Year(2015), Day(1))
+
+
+def create_tree(root: Path) -> None:
+    (root / "2016").mkdir(parents=True)
+    (root / "2016" / "solutions.py").write_text(SOURCE)
+
+    (root / "2015").mkdir()
+    (root / "2015" / "day_01.py").write_text(OTHER)
+    (root / "2015" / "broken.py").write_text(BROKEN)
+    (root / "2015" / "helper.py").write_text("VALUE = 13\n")
+
+    (root / ".hidden").mkdir()
+    (root / ".hidden" / "day_01.py").write_text(OTHER)
+
+
+def test_find_keys() -> None:
+    assert find_keys(SOURCE) == [KEY, FINAL_KEY]
+
+
+def test_discover(tmp_path: Path) -> None:
+    create_tree(tmp_path)
+
+    assert discover([tmp_path]) == [
+        tmp_path / "2015" / "day_01.py",
+        tmp_path / "2016" / "solutions.py",
+    ]
+
+    assert discover([tmp_path], Year(2016)) == [tmp_path / "2016" / "solutions.py"]
+
+
+def test_discover_year_filters_directories_only(tmp_path: Path) -> None:
+    create_tree(tmp_path)
+
+    mixed = tmp_path / "mixed.py"
+    mixed.write_text(SOURCE + OTHER)
+
+    file = tmp_path / "2015" / "day_01.py"
+
+    assert discover([tmp_path, file], Year(2016)) == [
+        file,
+        tmp_path / "2016" / "solutions.py",
+        mixed,
+    ]
+
+
+def test_index(tmp_path: Path) -> None:
+    root = tmp_path / "root"
+
+    create_tree(root)
+
+    index_path = tmp_path / "index.json"
+
+    discover([root], index=Index(index_path))
+
+    assert index_path.exists()
+
+    index = Index(index_path)
+
+    path = root / "2016" / "solutions.py"
+
+    assert index.get_keys(path) == [KEY, FINAL_KEY]
+    assert not index.changed
+
+    path.write_text(OTHER + "\n")  # the size changes along with the modification time
+
+    assert index.get_keys(path) == [OTHER_KEY]
+    assert index.changed
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+from asyncio import run, sleep
+from pathlib import Path
+from typing import Any, Dict, Optional, Set
+
+import pytest
+
+from aoc.data import dump_data, load_data
+from aoc.discoveries import Index
+from aoc.downloads import Downloader, TokenBucket, find_missing
+from aoc.http import Response
+from aoc.primitives import Day, Key, Year
+
+PRESENT = Key(Year(2015), Day(1))
+MISSING = Key(Year(2015), Day(2))
+FAILING = Key(Year(2015), Day(3))
+
+SOURCE = "class Year{:04d}Day{:02d}:\n    ...\n"
+source = SOURCE.format
+
+DATA = "data"
+
+ETAG = "etag"
+
+NOT_MODIFIED = 304
+OK = 200
+
+
+class Client:
+    def __init__(self) -> None:
+        self.downloaded: Set[Key] = set()
+
+    async def __aenter__(self) -> Client:
+        return self
+
+    async def __aexit__(self, *arguments: Any) -> None:
+        pass
+
+    async def fetch_data(self, key: Key, headers: Optional[Dict[str, str]] = None) -> Response:
+        await sleep(0)
+
+        if key == FAILING:
+            raise ValueError(key)
+
+        if headers and headers.get("If-None-Match") == ETAG:
+            return Response(NOT_MODIFIED, "", {})
+
+        self.downloaded.add(key)
+
+        return Response(OK, DATA, {"ETag": ETAG})
+
+
+def create_module(directory: Path, key: Key) -> Path:
+    path = directory / f"{key.day}.py"
+    path.write_text(source(key.year.value, key.day.value))
+
+    return path
+
+
+def test_find_missing(tmp_path: Path) -> None:
+    dump_data(DATA, PRESENT, tmp_path)
+
+    assert find_missing([PRESENT, MISSING], tmp_path) == [MISSING]
+
+
+def test_iter_ready(tmp_path: Path) -> None:
+    data_path = tmp_path / "data"
+
+    dump_data(DATA, PRESENT, data_path)
+
+    present = create_module(tmp_path, PRESENT)
+    missing = create_module(tmp_path, MISSING)
+    failing = create_module(tmp_path, FAILING)
+
+    client = Client()
+
+    downloader = Downloader(client, data_path, Index(None))  # type: ignore[arg-type]
+
+    ready = list(downloader.iter_ready([missing, failing, present]))
+
+    assert ready[0] == present
+    assert set(ready) == {present, missing, failing}
+
+    assert client.downloaded == {MISSING}
+    assert load_data(MISSING, data_path) == DATA
+
+    assert set(downloader.failures) == {FAILING}
+
+
+def test_token_bucket() -> None:
+    bucket = TokenBucket(100.0, 2)
+
+    assert not bucket.reserve()
+    assert not bucket.reserve()
+
+    assert bucket.reserve() > 0.0
+
+
+def test_token_bucket_invalid() -> None:
+    with pytest.raises(ValueError):
+        TokenBucket(0.0)
+
+    with pytest.raises(ValueError):
+        TokenBucket(capacity=0)
+
+
+class CountingClient(Client):
+    def __init__(self) -> None:
+        super().__init__()
+
+        self.active = 0
+        self.peak = 0
+
+    async def fetch_data(self, key: Key, headers: Optional[Dict[str, str]] = None) -> Response:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+
+        try:
+            return await super().fetch_data(key, headers)
+
+        finally:
+            self.active -= 1
+
+
+def test_download_missing(tmp_path: Path) -> None:
+    dump_data(DATA, PRESENT, tmp_path)
+
+    keys = [Key(Year(2016), Day(day)) for day in range(1, 11)]
+
+    client = CountingClient()
+
+    downloader = Downloader(
+        client,  # type: ignore[arg-type]
+        tmp_path,
+        concurrency=3,
+        bucket=TokenBucket(1000.0, 5),
+    )
+
+    downloaded = run(downloader.download_missing([PRESENT, FAILING, *keys]))
+
+    assert set(downloaded) == set(keys)
+    assert client.downloaded == set(keys)
+    assert client.peak <= 3
+
+    assert set(downloader.failures) == {FAILING}
+
+    assert all(load_data(key, tmp_path) == DATA for key in keys)
+
+    assert not run(downloader.download_missing(keys))
+
+
+def test_download_missing_force(tmp_path: Path) -> None:
+    dump_data(DATA, PRESENT, tmp_path)  # no metadata, so downloaded again
+
+    client = Client()
+
+    downloader = Downloader(client, tmp_path)  # type: ignore[arg-type]
+
+    downloaded = run(downloader.download_missing([PRESENT, MISSING], force=True))
+
+    assert set(downloaded) == {PRESENT, MISSING}
+
+    client.downloaded.clear()
+
+    assert not run(downloader.download_missing([PRESENT, MISSING], force=True))  # not modified
+
+    assert not client.downloaded
+    assert downloader.unchanged == {PRESENT, MISSING}
+
+
+class BrokenClient(Client):
+    async def __aenter__(self) -> BrokenClient:
+        raise ConnectionError
+
+
+def test_iter_ready_stopped(tmp_path: Path) -> None:
+    present = create_module(tmp_path, PRESENT)
+    missing = create_module(tmp_path, MISSING)
+
+    dump_data(DATA, PRESENT, tmp_path)
+
+    downloader = Downloader(BrokenClient(), tmp_path, Index(None))  # type: ignore[arg-type]
+
+    ready = downloader.iter_ready([missing, present])
+
+    assert next(ready) == present
+
+    with pytest.raises(ConnectionError):
+        next(ready)
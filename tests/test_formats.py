@@ -0,0 +1,74 @@
+from io import StringIO
+from json import loads
+from pathlib import Path
+
+from attrs import evolve
+
+from aoc.formats import Format, Writer, serialize_final_result, serialize_result
+from aoc.primitives import Day, Key, Year
+from aoc.solutions import FinalResult, Result
+from aoc.timers import Elapsed
+
+KEY = Key(Year(2015), Day(1))
+FINAL_KEY = Key(Year(2015), Day(25))
+
+PATH = Path("solution.py")
+
+
+def create_records() -> list:
+    result = Result(13, 42, Elapsed(1), Elapsed(2, process_nanoseconds=3), Elapsed(4))
+    final_result = FinalResult(KEY, Elapsed(5), Elapsed(6))  # answers are not always JSON
+
+    return [
+        serialize_result(PATH, KEY, result),
+        serialize_final_result(PATH, FINAL_KEY, evolve(final_result, cached=True)),
+    ]
+
+
+def test_serialize() -> None:
+    record, final_record = create_records()
+
+    assert record["key"] == str(KEY)
+    assert record["answer_two"] == 42
+    assert record["solve_one_time"] == {"wall": 2, "process": 3, "thread": None}
+    assert record["parse_memory"] is None
+
+    assert final_record["cached"]
+
+
+def test_writer_ndjson() -> None:
+    file = StringIO()
+
+    writer = Writer(file, Format.NDJSON)
+
+    for record in create_records():
+        writer.write(record)
+
+    writer.close()
+
+    lines = file.getvalue().splitlines()
+
+    assert [loads(line)["type"] for line in lines] == ["result", "final_result"]
+
+    assert loads(lines[1])["answer"] == str(KEY)
+
+
+def test_writer_json() -> None:
+    file = StringIO()
+
+    writer = Writer(file, Format.JSON)
+
+    for record in create_records():
+        writer.write(record)
+
+    writer.close()
+
+    assert len(loads(file.getvalue())) == 2
+
+
+def test_writer_json_empty() -> None:
+    file = StringIO()
+
+    Writer(file, Format.JSON).close()
+
+    assert loads(file.getvalue()) == []
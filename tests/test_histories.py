@@ -0,0 +1,57 @@
+from pathlib import Path
+
+from aoc.benchmarks import Statistics
+from aoc.histories import History, compare
+from aoc.primitives import Day, Key, Phase, Year
+from aoc.runners import Benchmarks
+from aoc.solutions import FinalBenchmark
+from aoc.timers import Measure
+
+KEY = Key(Year(2015), Day(25))
+
+MACHINE = "machine"
+
+BASELINE_COMMIT = "baseline"
+CURRENT_COMMIT = "current"
+
+ANSWER = 13
+
+BASELINE = [100, 101, 102, 103, 104, 105, 106, 107, 108, 109]
+SLOWER = [sample * 2 for sample in BASELINE]
+
+
+def create_benchmarks(samples: list) -> Benchmarks:
+    final_benchmark = FinalBenchmark(ANSWER, Statistics(BASELINE), Statistics(samples))
+
+    return Benchmarks({}, {KEY: final_benchmark})
+
+
+def test_history(tmp_path: Path) -> None:
+    history = History(tmp_path / "history.sqlite")
+
+    baseline_run = history.append(create_benchmarks(BASELINE), BASELINE_COMMIT, MACHINE)
+    current_run = history.append(create_benchmarks(SLOWER), CURRENT_COMMIT, MACHINE)
+
+    assert history.phases(MACHINE) == [(KEY, Phase.PARSE), (KEY, Phase.SOLVE)]
+
+    assert not history.phases(MACHINE, Measure.PROCESS)
+
+    current = history.latest(KEY, Phase.SOLVE, MACHINE)
+
+    assert current is not None
+    assert current.run == current_run
+    assert current.commit == CURRENT_COMMIT
+    assert current.samples == SLOWER
+
+    baseline = history.latest(KEY, Phase.SOLVE, MACHINE, before=current.run)
+
+    assert baseline is not None
+    assert baseline.run == baseline_run
+
+    by_commit = history.latest(KEY, Phase.SOLVE, MACHINE, commit=BASELINE_COMMIT[:4])
+
+    assert by_commit == baseline
+
+    assert compare(baseline, current).regressed
+    assert not compare(current, baseline).regressed
+    assert not compare(baseline, baseline).regressed
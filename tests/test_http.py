@@ -0,0 +1,305 @@
+from asyncio import TimeoutError as AsyncTimeoutError
+from asyncio import gather, get_running_loop, run, sleep
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+from time import monotonic
+from typing import Awaitable, Callable, List, Tuple
+
+import pytest
+from aiohttp import ClientError, ClientResponseError, ClientSession, web
+
+from aoc.http import HTTPClient
+from aoc.primitives import Day, Key, Year
+from aoc.retries import RetryPolicy
+
+KEY = Key(Year(2015), Day(1))
+
+DATA = "(()"
+
+TOKEN = "token"
+
+HOST = "127.0.0.1"
+
+BASE_URL = "http://{}:{}/"
+base_url = BASE_URL.format
+
+
+async def handle(request: web.Request) -> web.Response:
+    return web.Response(text=DATA)
+
+
+async def download() -> None:
+    application = web.Application()
+    application.router.add_get("/{year}/day/{day}/input", handle)
+
+    runner = web.AppRunner(application)
+
+    await runner.setup()
+
+    site = web.TCPSite(runner, HOST, 0)
+
+    await site.start()
+
+    _, port = runner.addresses[0][:2]
+
+    client = HTTPClient(TOKEN, retries=0, base_url=base_url(HOST, port))
+
+    try:
+        assert await client.download_data(KEY) == DATA  # short-lived session
+
+        assert client.session is None
+
+        async with client:
+            session = client.session
+
+            assert session is not None
+
+            async with client:  # entering again reuses the session
+                assert client.session is session
+
+            assert await client.download_data(KEY) == DATA
+            assert await client.download_data(KEY) == DATA
+
+        assert client.session is None
+        assert session.closed
+
+    finally:
+        await runner.cleanup()
+
+
+def test_pooled_session() -> None:
+    run(download())
+
+
+Handler = Callable[[web.Request], Awaitable[web.Response]]
+
+POLICY = RetryPolicy(backoff=0.0, jitter=0.0)
+
+
+async def download_with(handler: Handler, retries: int, policy: RetryPolicy = POLICY) -> str:
+    application = web.Application()
+    application.router.add_get("/{year}/day/{day}/input", handler)
+
+    runner = web.AppRunner(application)
+
+    await runner.setup()
+
+    site = web.TCPSite(runner, HOST, 0)
+
+    await site.start()
+
+    _, port = runner.addresses[0][:2]
+
+    client = HTTPClient(TOKEN, retries=retries, base_url=base_url(HOST, port), policy=policy)
+
+    try:
+        return await client.download_data(KEY)
+
+    finally:
+        await runner.cleanup()
+
+
+def failing(statuses: List[int], retry_after: str = "0") -> Handler:
+    async def handle_failing(request: web.Request) -> web.Response:
+        if statuses:
+            return web.Response(status=statuses.pop(0), headers={"Retry-After": retry_after})
+
+        return web.Response(text=DATA)
+
+    return handle_failing
+
+
+def test_retry_transient() -> None:
+    statuses = [503, 429]
+
+    assert run(download_with(failing(statuses), retries=2)) == DATA
+
+    assert not statuses
+
+
+def test_retries_exhausted() -> None:
+    with pytest.raises(ClientResponseError) as info:
+        run(download_with(failing([503, 503]), retries=1))
+
+    assert info.value.status == 503
+
+
+def test_fatal_not_retried() -> None:
+    statuses = [404]
+
+    with pytest.raises(ClientResponseError) as info:
+        run(download_with(failing(statuses), retries=3))
+
+    assert info.value.status == 404
+
+
+def test_deadline() -> None:
+    statuses = [503]
+
+    policy = RetryPolicy(jitter=0.0, deadline=1.0)
+
+    with pytest.raises(ClientResponseError):  # retrying after 5 seconds misses the deadline
+        run(download_with(failing(statuses, retry_after="5"), retries=3, policy=policy))
+
+
+def enter_and_download(client: HTTPClient, barrier: Barrier) -> Tuple[ClientSession, str]:
+    async def download_within() -> Tuple[ClientSession, str]:
+        async with client:
+            session = client.session
+
+            assert session is not None
+
+            barrier.wait()  # both threads have entered
+
+            data = await client.download_data(KEY)
+
+            barrier.wait()  # neither thread exits before the other one downloads
+
+        return (session, data)
+
+    return run(download_within())
+
+
+async def download_from_threads() -> None:
+    application = web.Application()
+    application.router.add_get("/{year}/day/{day}/input", handle)
+
+    runner = web.AppRunner(application)
+
+    await runner.setup()
+
+    site = web.TCPSite(runner, HOST, 0)
+
+    await site.start()
+
+    _, port = runner.addresses[0][:2]
+
+    client = HTTPClient(TOKEN, retries=0, base_url=base_url(HOST, port))
+
+    barrier = Barrier(2)
+
+    loop = get_running_loop()
+
+    try:
+        with ThreadPoolExecutor(2) as executor:
+            (session, data), (other_session, other_data) = await gather(
+                loop.run_in_executor(executor, enter_and_download, client, barrier),
+                loop.run_in_executor(executor, enter_and_download, client, barrier),
+            )
+
+    finally:
+        await runner.cleanup()
+
+    assert data == other_data == DATA
+
+    assert session is not other_session  # each event loop owns its session
+
+    assert session.closed
+    assert other_session.closed
+
+    assert not client.sessions
+    assert not client.entered
+
+
+def test_sessions_across_threads() -> None:
+    run(download_from_threads())
+
+
+BROKEN_PATH = "/broken"
+
+LENGTH = 100
+
+
+async def request_broken(method: str, retries: int) -> int:
+    calls = 0
+
+    async def handle_broken(request: web.Request) -> web.StreamResponse:
+        nonlocal calls
+
+        calls += 1
+
+        response = web.StreamResponse(headers={"Content-Length": str(LENGTH)})
+
+        await response.prepare(request)
+        await response.write(DATA.encode())
+
+        assert request.transport is not None
+
+        request.transport.close()  # the payload is cut short
+
+        return response
+
+    application = web.Application()
+    application.router.add_route(method, BROKEN_PATH, handle_broken)
+
+    runner = web.AppRunner(application)
+
+    await runner.setup()
+
+    site = web.TCPSite(runner, HOST, 0)
+
+    await site.start()
+
+    _, port = runner.addresses[0][:2]
+
+    client = HTTPClient(TOKEN, retries=retries, base_url=base_url(HOST, port), policy=POLICY)
+
+    try:
+        with pytest.raises(ClientError):
+            await client.request(method, BROKEN_PATH)
+
+    finally:
+        await runner.cleanup()
+
+    return calls
+
+
+def test_idempotent_retried() -> None:
+    assert run(request_broken("GET", retries=2)) == 3
+
+
+def test_not_idempotent_not_retried() -> None:
+    assert run(request_broken("POST", retries=2)) == 1
+
+
+WAIT = 2.0
+
+
+async def handle_slow(request: web.Request) -> web.Response:
+    await sleep(WAIT)
+
+    return web.Response(text=DATA)
+
+
+async def download_slow(policy: RetryPolicy) -> float:
+    application = web.Application()
+    application.router.add_get("/{year}/day/{day}/input", handle_slow)
+
+    runner = web.AppRunner(application)
+
+    await runner.setup()
+
+    site = web.TCPSite(runner, HOST, 0)
+
+    await site.start()
+
+    _, port = runner.addresses[0][:2]
+
+    client = HTTPClient(TOKEN, retries=3, base_url=base_url(HOST, port), policy=policy)
+
+    start = monotonic()
+
+    try:
+        with pytest.raises(AsyncTimeoutError):
+            await client.download_data(KEY)
+
+        return monotonic() - start
+
+    finally:
+        await runner.cleanup()
+
+
+def test_deadline_limits_attempts() -> None:
+    policy = RetryPolicy(backoff=0.0, jitter=0.0, deadline=0.5)
+
+    assert run(download_slow(policy)) < WAIT
@@ -0,0 +1,51 @@
+from subprocess import run
+from sys import executable
+from typing import Set
+
+import pytest
+
+IMPORT_TIME = "import time:"
+SEPARATOR = "|"
+
+HEAVY = ("aiohttp", "pendulum", "textual", "trogon", "versions", "wraps", "yarl")
+
+STANDARD = ("asyncio", "cProfile", "multiprocessing", "pstats", "sqlite3", "tracemalloc")
+
+
+def imported_modules(module: str) -> Set[str]:
+    completed = run(
+        [executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    names = set()
+
+    for line in completed.stderr.splitlines():
+        if line.startswith(IMPORT_TIME):
+            *_, name = line.split(SEPARATOR)
+
+            names.add(name.strip())
+
+    return names
+
+
+@pytest.mark.parametrize("module", ("aoc", "aoc.main"))
+def test_heavy_imports_are_lazy(module: str) -> None:
+    modules = imported_modules(module)
+
+    assert module in modules
+
+    for heavy in HEAVY:
+        assert heavy not in modules
+
+
+@pytest.mark.parametrize("module", ("aoc", "aoc.solutions", "aoc.main"))
+def test_standard_imports_are_lazy(module: str) -> None:
+    modules = imported_modules(module)
+
+    assert module in modules
+
+    for standard in STANDARD:
+        assert standard not in modules
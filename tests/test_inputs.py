@@ -0,0 +1,70 @@
+from pathlib import Path
+
+from aoc.data import dump_data
+from aoc.inputs import InputCache
+from aoc.primitives import Day, Key, Year
+from aoc.registries import Registry
+from aoc.runners import Runner
+from aoc.solutions import Result
+
+SOURCE = """
+from aoc.solutions import Solution
+
+PARSED = []
+
+
+class Year2015Day01(Solution[list, int, int]):
+    def parse(self, data: str) -> list:
+        PARSED.append(data)
+
+        return list(map(int, data.split()))
+
+    def solve_one(self, input: list) -> int:
+        return sum(input)
+
+    def solve_two(self, input: list) -> int:
+        return len(PARSED)
+"""
+
+CHANGED = SOURCE + "\n# changed\n"
+
+DATA = "1 2 3"
+
+KEY = Key(Year(2015), Day(1))
+
+
+def run(path: Path, data_path: Path, inputs: InputCache) -> Result:
+    with Registry().scope():
+        runner = Runner(inputs=inputs)
+
+        ((_, result),) = runner.iter_path(path, data_path)
+
+    assert isinstance(result, Result)
+
+    return result
+
+
+def test_input_cache(tmp_path: Path) -> None:
+    data_path = tmp_path / "data"
+
+    dump_data(DATA, KEY, data_path)
+
+    path = tmp_path / "solution.py"
+    path.write_text(SOURCE)
+
+    inputs = InputCache(tmp_path / "inputs")
+
+    result = run(path, data_path, inputs)
+
+    assert not result.parse_cached
+    assert result.answer_two == 1  # parsed
+
+    cached_result = run(path, data_path, inputs)
+
+    assert cached_result.parse_cached
+    assert cached_result.answer_one == result.answer_one
+    assert cached_result.answer_two == 0  # not parsed
+
+    path.write_text(CHANGED)  # changing the source invalidates the input
+
+    assert not run(path, data_path, inputs).parse_cached
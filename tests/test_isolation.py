@@ -0,0 +1,53 @@
+from functools import partial
+from threading import Event, Thread
+from time import sleep
+
+import pytest
+
+from aoc.isolation import Failure, Limits, can_fork, run_isolated
+
+VALUE = 13
+
+
+def identity(value: int) -> int:
+    return value
+
+
+def fail() -> None:
+    raise ValueError
+
+
+def allocate() -> bytearray:
+    return bytearray(1 << 34)
+
+
+def test_run_isolated() -> None:
+    assert run_isolated(partial(identity, VALUE), Limits()) == VALUE
+
+
+def test_run_isolated_error() -> None:
+    with pytest.raises(ValueError):
+        run_isolated(fail, Limits())
+
+
+def test_run_isolated_timeout() -> None:
+    assert run_isolated(partial(sleep, 10.0), Limits(time=0.1)) is Failure.TIMEOUT
+
+
+def test_run_isolated_memory() -> None:
+    assert run_isolated(allocate, Limits(memory=1 << 28)) is Failure.MEMORY
+
+
+def test_can_fork_with_threads() -> None:
+    event = Event()
+
+    thread = Thread(target=event.wait)
+    thread.start()
+
+    try:
+        assert not can_fork()
+
+    finally:
+        event.set()
+
+        thread.join()
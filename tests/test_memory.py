@@ -0,0 +1,109 @@
+import cProfile
+import pstats
+from pathlib import Path
+from runpy import run_path
+from typing import List
+
+from aoc.memory import Size, Tracker
+from aoc.profiles import Profiler
+from aoc.registries import Registry
+from aoc.solutions import Solution
+
+SIZE = 1 << 20
+
+DATA = "13"
+
+
+def allocate(data: str) -> List[int]:
+    return list(range(SIZE // 8))
+
+
+def test_size() -> None:
+    assert str(Size(13)) == "13B"
+    assert str(Size(SIZE)) == "1.0MiB"
+
+
+def test_tracker() -> None:
+    value, memory = Tracker().call(allocate, DATA)
+
+    assert len(value) == SIZE // 8
+
+    assert memory.peak.bytes >= SIZE
+
+    assert any(allocation.size.bytes >= SIZE for allocation in memory.allocations)
+
+
+def test_execute_tracked() -> None:
+    with Registry().scope():
+
+        class Year2015Day01(Solution[List[int], int, int]):
+            def parse(self, data: str) -> List[int]:
+                return allocate(data)
+
+            def solve_one(self, input: List[int]) -> int:
+                return len(input)
+
+            def solve_two(self, input: List[int]) -> int:
+                return sum(input)
+
+    solution = Year2015Day01()
+
+    result = solution.execute(DATA)
+
+    assert result.parse_memory is None
+
+    result = solution.execute(DATA, tracker=Tracker())
+
+    assert result.parse_memory is not None
+    assert result.parse_memory.peak.bytes >= SIZE
+
+    assert result.solve_one_memory is not None
+    assert result.solve_two_memory is not None
+
+
+def test_tracker_excludes_profiling(tmp_path: Path) -> None:
+    with Registry().scope():
+
+        class Year2015Day02(Solution[List[int], int, int]):
+            def parse(self, data: str) -> List[int]:
+                return allocate(data)
+
+            def solve_one(self, input: List[int]) -> int:
+                return len(input)
+
+            def solve_two(self, input: List[int]) -> int:
+                return sum(input)
+
+    result = Year2015Day02().execute(DATA, Profiler(tmp_path), Tracker())
+
+    profiling = {cProfile.__file__, pstats.__file__}
+
+    for memory in (result.parse_memory, result.solve_one_memory, result.solve_two_memory):
+        assert memory is not None
+
+        for allocation in memory.allocations:
+            assert allocation.location.rpartition(":")[0] not in profiling
+
+
+HOOK = """
+def allocate(size):
+    return [bytes(size) for _ in range(8)]
+"""
+
+HOOK_SIZE = 1 << 16
+
+
+def test_tracker_excludes_import_hooks(tmp_path: Path) -> None:
+    hook_path = tmp_path / "_distutils_hack" / "__init__.py"
+    hook_path.parent.mkdir()
+    hook_path.write_text(HOOK)
+
+    hook = run_path(str(hook_path))
+
+    _, memory = Tracker().call(hook["allocate"], HOOK_SIZE)
+
+    for allocation in memory.allocations:
+        filename = allocation.location.rpartition(":")[0]
+
+        assert filename != str(hook_path)
+        assert not filename.startswith("<")
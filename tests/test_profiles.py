@@ -0,0 +1,68 @@
+from cProfile import Profile
+from pathlib import Path
+
+from aoc.primitives import Day, Key, Phase, Year
+from aoc.profiles import Profiler
+from aoc.registries import Registry
+from aoc.solutions import FinalSolution
+
+KEY = Key(Year(2015), Day(25))
+
+DATA = "13"
+ANSWER = 13
+
+
+def convert(data: str) -> int:
+    return int(data)
+
+
+def test_profiler(tmp_path: Path) -> None:
+    with Registry().scope():
+
+        class Year2015Day25(FinalSolution[int, int]):
+            def parse(self, data: str) -> int:
+                return convert(data)
+
+            def solve(self, input: int) -> int:
+                return input
+
+    profiler = Profiler(tmp_path)
+
+    final_result = Year2015Day25().execute(DATA, profiler)
+
+    assert final_result.answer == ANSWER
+    assert final_result.profiled
+
+    assert profiler.get_path(KEY, Phase.PARSE).exists()
+    assert profiler.get_path(KEY, Phase.SOLVE).exists()
+
+    locations = [hotspot.location for hotspot in profiler.hotspots(KEY, Phase.PARSE)]
+
+    assert any(location.endswith(f"({convert.__name__})") for location in locations)
+
+    assert not profiler.hotspots(KEY, Phase.SOLVE_ONE)
+
+    assert not Year2015Day25().execute(DATA).profiled
+
+
+def test_profiler_clears_stale_profiles(tmp_path: Path) -> None:
+    with Registry().scope():
+
+        class Year2015Day25(FinalSolution[int, int]):
+            def parse(self, data: str) -> int:
+                return convert(data)
+
+            def solve(self, input: int) -> int:
+                return input
+
+    profiler = Profiler(tmp_path)
+
+    stale = profiler.get_path(KEY, Phase.SOLVE_ONE)  # never run by final solutions
+
+    Profile().dump_stats(stale)
+
+    Year2015Day25().execute(DATA, profiler)
+
+    assert not stale.exists()
+
+    assert not profiler.hotspots(KEY, Phase.SOLVE_ONE)
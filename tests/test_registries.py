@@ -0,0 +1,40 @@
+from aoc.primitives import Day, Key, Year
+from aoc.registries import REGISTRY, Registry, get_registry
+from aoc.solutions import FinalSolution
+
+KEY = Key(Year(2015), Day(25))
+
+
+def define_solution() -> type:
+    class Year2015Day25(FinalSolution[str, str]):
+        def parse(self, data: str) -> str:
+            return data
+
+        def solve(self, input: str) -> str:
+            return input
+
+    return Year2015Day25
+
+
+def test_registry_scope() -> None:
+    registry = Registry()
+
+    with registry.scope():
+        assert get_registry() is registry
+
+        first = define_solution()
+        second = define_solution()
+
+    assert get_registry() is REGISTRY
+
+    assert registry.final_solutions[KEY] == [first, second]
+    assert registry.get_final_solution(KEY) is second
+    assert registry.primary_final_solutions() == {KEY: second}
+
+    assert registry.get_solution(KEY) is None
+
+    assert second not in REGISTRY.final_solutions.get(KEY, [])
+
+    registry.clear()
+
+    assert not registry.final_solutions
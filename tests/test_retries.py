@@ -0,0 +1,63 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from aoc.retries import RetryPolicy, parse_retry_after
+
+NOW = datetime(2015, 12, 1, 5, 0, 0, tzinfo=timezone.utc)
+
+
+def test_parse_retry_after() -> None:
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("invalid") is None
+
+    assert parse_retry_after("13") == 13.0
+    assert parse_retry_after("Tue, 01 Dec 2015 05:00:42 GMT", NOW) == 42.0
+    assert parse_retry_after("Tue, 01 Dec 2015 04:59:00 GMT", NOW) == 0.0
+
+
+def test_backoff() -> None:
+    policy = RetryPolicy(backoff=1.0, factor=2.0, maximum=5.0, jitter=0.0)
+
+    assert [policy.get_delay(attempt) for attempt in range(4)] == [1.0, 2.0, 4.0, 5.0]
+
+    assert policy.get_delay(0, retry_after=7.0) == 7.0
+
+
+def test_jitter() -> None:
+    policy = RetryPolicy(backoff=1.0, jitter=0.5, random=lambda: 1.0)
+
+    assert policy.get_delay(0) == 0.5
+
+
+def test_statuses() -> None:
+    policy = RetryPolicy()
+
+    assert policy.is_retryable(429)
+    assert policy.is_retryable(503)
+
+    assert not policy.is_retryable(400)
+    assert not policy.is_retryable(404)
+
+
+def test_deadline() -> None:
+    policy = RetryPolicy(deadline=10.0)
+
+    assert policy.allows(5.0, 5.0)
+    assert not policy.allows(5.0, 6.0)
+
+    assert RetryPolicy(deadline=None).allows(1000.0, 1000.0)
+
+    assert policy.get_remaining(4.0) == 6.0
+    assert RetryPolicy(deadline=None).get_remaining(4.0) is None
+
+
+def test_invalid() -> None:
+    with pytest.raises(ValueError):
+        RetryPolicy(backoff=-1.0)
+
+    with pytest.raises(ValueError):
+        RetryPolicy(factor=0.5)
+
+    with pytest.raises(ValueError):
+        RetryPolicy(jitter=2.0)
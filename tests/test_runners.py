@@ -0,0 +1,271 @@
+import sys
+from asyncio import run
+from pathlib import Path
+from threading import Event
+from typing import Iterator, List
+
+import pytest
+
+from aoc.caches import ResultCache
+from aoc.data import dump_data
+from aoc.errors import DataNotFound
+from aoc.isolation import Failure, Limits
+from aoc.primitives import Day, Key, Year
+from aoc.runners import Item, ParallelRunner, Runner
+from aoc.solutions import Result
+
+SOURCE = """
+from aoc.solutions import Solution
+
+
+class Year2015Day01(Solution[str, int, int]):
+    def parse(self, data: str) -> str:
+        return data
+
+    def solve_one(self, input: str) -> int:
+        return len(input)
+
+    def solve_two(self, input: str) -> int:
+        return input.count("x")
+"""
+
+BROKEN = """
+raise ValueError("broken")
+"""
+
+DATA = "xyxzx"
+
+KEY = Key(Year(2015), Day(1))
+
+
+@pytest.mark.parametrize("runner", (Runner(), ParallelRunner(2)))
+def test_run_paths(runner: Runner, tmp_path: Path) -> None:
+    data_path = tmp_path / "data"
+
+    dump_data(DATA, KEY, data_path)
+
+    path = tmp_path / "solution.py"
+    path.write_text(SOURCE)
+
+    broken = tmp_path / "broken.py"
+    broken.write_text(BROKEN)
+
+    (first, fetch_first), (second, fetch_second) = runner.run_paths([path, broken], data_path)
+
+    assert first == path
+    assert second == broken
+
+    result = fetch_first().results[KEY]
+
+    assert result.answer_one == len(DATA)
+    assert result.answer_two == DATA.count("x")
+
+    with pytest.raises(ValueError):
+        fetch_second()
+
+
+WAIT = 5.0
+
+
+def test_parallel_run_paths_lazy(tmp_path: Path) -> None:
+    data_path = tmp_path / "data"
+
+    dump_data(DATA, KEY, data_path)
+
+    path = tmp_path / "solution.py"
+    path.write_text(SOURCE)
+
+    fetched = Event()
+    waited: List[bool] = []
+
+    def iter_paths() -> Iterator[Path]:
+        yield path
+
+        # the next module only becomes available once the first one is fetched
+        waited.append(fetched.wait(WAIT))
+
+        yield path
+
+    runner = ParallelRunner(2)
+
+    results = runner.run_paths(iter_paths(), data_path)
+
+    _, fetch = next(results)
+
+    assert fetch().results[KEY].answer_one == len(DATA)
+
+    fetched.set()
+
+    assert [fetch().results[KEY].answer_one for _, fetch in results] == [len(DATA)]
+
+    assert waited == [True]
+
+
+def test_parallel_run_paths_error(tmp_path: Path) -> None:
+    def iter_paths() -> Iterator[Path]:
+        raise ConnectionError
+        yield
+
+    with pytest.raises(ConnectionError):
+        list(ParallelRunner(2).run_paths(iter_paths(), tmp_path))
+
+
+@pytest.mark.parametrize("runner", (Runner(), ParallelRunner(2)))
+def test_run_paths_data_not_found(runner: Runner, tmp_path: Path) -> None:
+    path = tmp_path / "solution.py"
+    path.write_text(SOURCE)
+
+    ((_, fetch),) = runner.run_paths([path], tmp_path / "data")
+
+    with pytest.raises(DataNotFound):
+        fetch()
+
+
+@pytest.mark.parametrize("runner", (Runner(), ParallelRunner(2)))
+def test_iter_paths(runner: Runner, tmp_path: Path) -> None:
+    data_path = tmp_path / "data"
+
+    dump_data(DATA, KEY, data_path)
+
+    path = tmp_path / "solution.py"
+    path.write_text(SOURCE)
+
+    broken = tmp_path / "broken.py"
+    broken.write_text(BROKEN)
+
+    (first, first_items), (second, second_items) = runner.iter_paths([path, broken], data_path)
+
+    assert first == path
+    assert second == broken
+
+    ((key, result),) = first_items
+
+    assert key == KEY
+
+    assert isinstance(result, Result)
+    assert result.answer_one == len(DATA)
+
+    with pytest.raises(ValueError):
+        next(second_items)
+
+
+def test_iter_path_cached(tmp_path: Path) -> None:
+    data_path = tmp_path / "data"
+
+    dump_data(DATA, KEY, data_path)
+
+    path = tmp_path / "solution.py"
+    path.write_text(SOURCE)
+
+    runner = Runner(cache=ResultCache(tmp_path / "results"))
+
+    ((_, result),) = runner.iter_path(path, data_path)
+
+    assert isinstance(result, Result)
+    assert not result.cached
+
+    ((_, cached_result),) = runner.iter_path(path, data_path)
+
+    assert isinstance(cached_result, Result)
+    assert cached_result.cached
+    assert cached_result.answer_one == result.answer_one
+
+
+def test_async_iter_path(tmp_path: Path) -> None:
+    data_path = tmp_path / "data"
+
+    dump_data(DATA, KEY, data_path)
+
+    path = tmp_path / "solution.py"
+    path.write_text(SOURCE)
+
+    async def collect() -> List[Item]:
+        return [item async for item in Runner().async_iter_path(path, data_path)]
+
+    ((key, result),) = run(collect())
+
+    assert key == KEY
+
+    assert isinstance(result, Result)
+    assert result.answer_two == DATA.count("x")
+
+
+HELPER = """
+from aoc.solutions import Solution
+
+
+def helper(data: str) -> str:
+    return data
+
+
+class Year2015Day01(Solution[str, int, int]):
+    def parse(self, data: str) -> str:
+        return data
+
+    def solve_one(self, input: str) -> int:
+        return len(input)
+
+    def solve_two(self, input: str) -> int:
+        return input.count("x")
+"""
+
+IMPORTING = """
+from aoc.solutions import Solution
+
+from helper_day01 import helper
+
+
+class Year2015Day02(Solution[str, int, int]):
+    def parse(self, data: str) -> str:
+        return helper(data)
+
+    def solve_one(self, input: str) -> int:
+        return len(input)
+
+    def solve_two(self, input: str) -> int:
+        return input.count("y")
+"""
+
+IMPORTED_KEY = Key(Year(2015), Day(2))
+
+
+def test_find_solutions_defined_only(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / "helper_day01.py").write_text(HELPER)
+
+    path = tmp_path / "day02.py"
+    path.write_text(IMPORTING)
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    monkeypatch.delitem(sys.modules, "helper_day01", raising=False)
+
+    solutions = Runner().find_solutions(path)
+
+    assert list(solutions.solutions) == [IMPORTED_KEY]  # not the imported module's solution
+
+
+HANGING = (
+    SOURCE
+    + """
+while True:
+    pass
+"""
+)
+
+
+def test_run_path_isolated(tmp_path: Path) -> None:
+    data_path = tmp_path / "data"
+
+    dump_data(DATA, KEY, data_path)
+
+    path = tmp_path / "solution.py"
+    path.write_text(SOURCE)
+
+    hanging = tmp_path / "hanging.py"
+    hanging.write_text(HANGING)
+
+    runner = Runner(limits=Limits(time=1.0))
+
+    assert runner.run_path(path, data_path).results[KEY].answer_one == len(DATA)
+
+    assert runner.run_path(hanging, data_path).failures == {KEY: Failure.TIMEOUT}
@@ -0,0 +1,181 @@
+from pathlib import Path
+from typing import Any, Iterator, List
+
+import pytest
+
+from aoc import solutions
+from aoc.data import Buffer, dump_data
+from aoc.primitives import Day, Key, Year
+from aoc.registries import REGISTRY, Registry
+from aoc.solutions import BytesSolution, LineSolution, Solution
+
+DATA = "1 2 3 4"
+
+
+class Year2015Day03(Solution[List[int], int, int]):
+    concurrent = True
+
+    def parse(self, data: str) -> List[int]:
+        return list(map(int, data.split()))
+
+    def solve_one(self, input: List[int]) -> int:
+        return sum(input)
+
+    def solve_two(self, input: List[int]) -> int:
+        return max(input)
+
+
+def test_execute_concurrent() -> None:
+    result = Year2015Day03().execute(DATA)
+
+    assert result.answer_one == 10
+    assert result.answer_two == 4
+
+
+class Year2015Day04(LineSolution[List[int], int, int]):
+    def parse_lines(self, lines: Iterator[str]) -> List[int]:
+        return [int(line) for line in lines]
+
+    def solve_one(self, input: List[int]) -> int:
+        return sum(input)
+
+    def solve_two(self, input: List[int]) -> int:
+        return len(input)
+
+
+LINES = "1\n2\n3\n"
+
+KEY = Key(Year(2015), Day(4))
+
+
+def test_line_solution_is_registered() -> None:
+    assert REGISTRY.get_solution(KEY) is Year2015Day04
+
+
+def test_line_solution_load_and_execute(tmp_path: Path) -> None:
+    dump_data(LINES, KEY, tmp_path)
+
+    result = Year2015Day04().load_and_execute(tmp_path)
+
+    assert result.answer_one == 6
+    assert result.answer_two == 3
+
+    assert Year2015Day04().execute(LINES).answer_two == 3
+
+
+class Year2015Day05(BytesSolution[int, int, int]):
+    mapped = True
+
+    def parse_bytes(self, data: Buffer) -> int:
+        content = data[:]
+
+        return content.count(b"(") - content.count(b")")
+
+    def solve_one(self, input: int) -> int:
+        return input
+
+    def solve_two(self, input: int) -> int:
+        return -input
+
+
+BYTES_KEY = Key(Year(2015), Day(5))
+
+
+def test_bytes_solution_load_and_execute(tmp_path: Path) -> None:
+    dump_data("(()(", BYTES_KEY, tmp_path)
+
+    result = Year2015Day05().load_and_execute(tmp_path)
+
+    assert result.answer_one == 2
+    assert result.answer_two == -2
+
+    assert Year2015Day05().execute("())").answer_one == -1
+
+
+def test_execute_concurrent_without_fork(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(solutions, "can_fork", lambda: False)
+
+    def fail(*arguments: Any, **keywords: Any) -> None:
+        raise AssertionError("child processes should not be started")
+
+    monkeypatch.setattr(solutions, "start_isolated", fail)
+
+    result = Year2015Day03().execute(DATA)
+
+    assert result.answer_one == 10
+    assert result.answer_two == 4
+
+
+def test_line_solution_splits_on_new_lines_only(tmp_path: Path) -> None:
+    with Registry().scope():
+
+        class Year2015Day06(LineSolution[List[str], int, str]):
+            def parse_lines(self, lines: Iterator[str]) -> List[str]:
+                return list(lines)
+
+            def solve_one(self, input: List[str]) -> int:
+                return len(input)
+
+            def solve_two(self, input: List[str]) -> str:
+                return input[0]
+
+    data = "1\x0c2\x1c3 4\n5\n"
+
+    dump_data(data, Key(Year(2015), Day(6)), tmp_path)
+
+    result = Year2015Day06().execute(data)
+
+    assert result.answer_one == 2
+    assert result.answer_two == "1\x0c2\x1c3 4"
+
+    loaded = Year2015Day06().load_and_execute(tmp_path)
+
+    assert loaded.answer_one == result.answer_one
+    assert loaded.answer_two == result.answer_two
+
+
+ROUNDS = 3
+
+
+def test_benchmark_parses_with_data_protocol(tmp_path: Path) -> None:
+    def fail(*arguments: Any, **keywords: Any) -> Any:
+        raise AssertionError("the data should not be parsed as a string")
+
+    with Registry().scope():
+
+        class Year2015Day07(LineSolution[List[int], int, int]):
+            parse = fail
+
+            def parse_lines(self, lines: Iterator[str]) -> List[int]:
+                return [int(line) for line in lines]
+
+            def solve_one(self, input: List[int]) -> int:
+                return sum(input)
+
+            def solve_two(self, input: List[int]) -> int:
+                return len(input)
+
+        class Year2015Day08(BytesSolution[int, int, int]):
+            parse = fail
+
+            def parse_bytes(self, data: Buffer) -> int:
+                return bytes(data).count(b"(")
+
+            def solve_one(self, input: int) -> int:
+                return input
+
+            def solve_two(self, input: int) -> int:
+                return -input
+
+    dump_data(LINES, Key(Year(2015), Day(7)), tmp_path)
+    dump_data("(()(", Key(Year(2015), Day(8)), tmp_path)
+
+    line_benchmark = Year2015Day07().load_and_execute_benchmark(tmp_path, ROUNDS, warmup=0)
+
+    assert line_benchmark.answer_one == 6
+    assert line_benchmark.rounds == ROUNDS
+
+    bytes_benchmark = Year2015Day08().load_and_execute_benchmark(tmp_path, ROUNDS, warmup=0)
+
+    assert bytes_benchmark.answer_one == 3
+    assert bytes_benchmark.rounds == ROUNDS
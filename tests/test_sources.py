@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from asyncio import run
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from aoc.data import dump_data, load_data
+from aoc.http import Response
+from aoc.primitives import Day, Key, Year
+from aoc.sources import DataSource, Metadata, dump_metadata, load_metadata
+
+KEY = Key(Year(2015), Day(1))
+
+DATA = "(()"
+CHANGED = "())"
+
+ETAG = "etag"
+LAST_MODIFIED = "Tue, 01 Dec 2015 05:00:00 GMT"
+
+OK = 200
+NOT_MODIFIED = 304
+
+
+class Client:
+    def __init__(self, data: str) -> None:
+        self.data = data
+        self.requests: List[Dict[str, str]] = []
+
+    async def fetch_data(self, key: Key, headers: Optional[Dict[str, str]] = None) -> Response:
+        headers = headers or {}
+
+        self.requests.append(headers)
+
+        if headers.get("If-None-Match") == ETAG and self.data == DATA:
+            return Response(NOT_MODIFIED, "", {})
+
+        return Response(OK, self.data, {"ETag": ETAG, "Last-Modified": LAST_MODIFIED})
+
+
+def test_metadata(tmp_path: Path) -> None:
+    assert load_metadata(KEY, tmp_path) == Metadata()
+
+    metadata = Metadata(ETAG, LAST_MODIFIED)
+
+    dump_metadata(metadata, KEY, tmp_path)
+
+    assert load_metadata(KEY, tmp_path) == metadata
+
+    assert metadata.to_headers() == {
+        "If-None-Match": ETAG,
+        "If-Modified-Since": LAST_MODIFIED,
+    }
+
+    assert not Metadata().to_headers()
+
+
+def test_cache_first(tmp_path: Path) -> None:
+    dump_data(DATA, KEY, tmp_path)
+
+    client = Client(CHANGED)
+
+    source = DataSource(client, tmp_path)  # type: ignore[arg-type]
+
+    fetched = run(source.get(KEY))
+
+    assert fetched.data == DATA
+    assert not fetched.modified
+
+    assert not client.requests
+
+
+def test_revalidate(tmp_path: Path) -> None:
+    client = Client(DATA)
+
+    source = DataSource(client, tmp_path)  # type: ignore[arg-type]
+
+    fetched = run(source.get(KEY))
+
+    assert fetched.data == DATA
+    assert fetched.modified
+
+    assert load_metadata(KEY, tmp_path) == Metadata(ETAG, LAST_MODIFIED)
+
+    fetched = run(source.get(KEY, force=True))
+
+    assert fetched.data == DATA
+    assert not fetched.modified
+
+    assert client.requests[-1]["If-None-Match"] == ETAG
+
+    client.data = CHANGED
+
+    fetched = run(source.get(KEY, force=True))
+
+    assert fetched.data == CHANGED
+    assert fetched.modified
+
+    assert load_data(KEY, tmp_path) == CHANGED
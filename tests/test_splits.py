@@ -0,0 +1,33 @@
+import pytest
+
+from aoc.ext.splits import (
+    iter_blocks,
+    iter_fields,
+    iter_split_at,
+    iter_split_lines,
+    split_double_lines,
+    split_lines,
+    split_whitespace,
+)
+
+STRINGS = ("", "\n", "a", "a\nb", "a\n\nb c\nd\n", "\n\n\n", " a \t b\n\n  c  ")
+
+
+@pytest.mark.parametrize("string", STRINGS)
+def test_iter_split_lines(string: str) -> None:
+    assert list(iter_split_lines(string)) == split_lines(string)
+
+
+@pytest.mark.parametrize("string", STRINGS)
+def test_iter_blocks(string: str) -> None:
+    assert list(iter_blocks(string)) == split_double_lines(string)
+
+
+@pytest.mark.parametrize("string", STRINGS)
+def test_iter_fields(string: str) -> None:
+    assert list(iter_fields(string)) == split_whitespace(string)
+
+
+def test_iter_split_at_empty_separator() -> None:
+    with pytest.raises(ValueError):
+        iter_split_at("")
@@ -0,0 +1,53 @@
+from os import utime
+from pathlib import Path
+
+from aoc.stores import Store, write_atomic
+
+CONTENT = b"content"
+OTHER = b"other"
+
+SUFFIX = ".entry"
+
+DIGEST = "13"
+OTHER_DIGEST = "42"
+
+
+def test_write_atomic(tmp_path: Path) -> None:
+    path = tmp_path / "nested" / "file.json"
+
+    write_atomic(path, CONTENT)
+    write_atomic(path, OTHER)
+
+    assert path.read_bytes() == OTHER
+
+    assert [child.name for child in path.parent.iterdir()] == [path.name]
+
+
+def test_store(tmp_path: Path) -> None:
+    store = Store(tmp_path, SUFFIX, len(CONTENT) + len(OTHER))
+
+    assert store.read(DIGEST) is None
+
+    store.write(DIGEST, CONTENT)
+
+    assert store.get_path(DIGEST) == tmp_path / (DIGEST + SUFFIX)
+    assert store.read(DIGEST) == CONTENT
+
+
+def test_store_evict(tmp_path: Path) -> None:
+    store = Store(tmp_path, SUFFIX, len(CONTENT) + len(OTHER))
+
+    store.write(DIGEST, CONTENT)
+
+    utime(store.get_path(DIGEST), (0, 0))  # the least recently used
+
+    store.write(OTHER_DIGEST, OTHER)
+
+    assert store.read(DIGEST) == CONTENT
+
+    utime(store.get_path(DIGEST), (0, 0))
+
+    store.write(OTHER_DIGEST + DIGEST, CONTENT)
+
+    assert store.read(DIGEST) is None
+    assert store.read(OTHER_DIGEST) == OTHER
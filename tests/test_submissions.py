@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from asyncio import run
+from pathlib import Path
+from time import time
+from typing import Any, List, Tuple
+
+from aoc.primitives import Day, Key, Part, Year
+from aoc.states import Reply, State, parse_wait
+from aoc.submissions import Submission, SubmissionQueue, resubmit_answers, submit_answer
+
+KEY = Key(Year(2015), Day(1))
+
+ANSWER = "42"
+
+TIMEOUT = (
+    "You gave an answer too recently; you have to wait after submitting an answer "
+    "before trying again. You have 1m 5s left to wait."
+)
+
+
+class Client:
+    def __init__(self, replies: List[Reply]) -> None:
+        self.replies = replies
+        self.submitted: List[Tuple[Key, Part, Any]] = []
+
+    async def __aenter__(self) -> Client:
+        return self
+
+    async def __aexit__(self, *arguments: Any) -> None:
+        pass
+
+    async def submit_answer_reply(self, key: Key, part: Part, answer: Any) -> Reply:
+        self.submitted.append((key, part, answer))
+
+        return self.replies.pop(0)
+
+
+def test_parse_wait() -> None:
+    assert parse_wait(TIMEOUT) == 65.0
+    assert parse_wait("You have 34s left to wait.") == 34.0
+    assert parse_wait("That's the right answer!") is None
+
+    assert Reply.match(TIMEOUT) == Reply(State.TIMEOUT, 65.0)
+
+
+def test_queue_persistence(tmp_path: Path) -> None:
+    path = tmp_path / "submissions.json"
+
+    queue = SubmissionQueue(path)
+
+    later = Submission(KEY, Part.TWO, ANSWER, 2.0)
+    sooner = Submission(KEY, Part.ONE, ANSWER, 1.0)
+
+    queue.push(later)
+    queue.push(sooner)
+
+    assert SubmissionQueue(path).submissions == [sooner, later]
+
+    queue.push(Submission(KEY, Part.TWO, "13", 3.0))  # replaces the pending answer
+
+    assert len(queue) == 2
+
+    queue.discard(KEY, Part.ONE)
+
+    assert [submission.answer for submission in SubmissionQueue(path).submissions] == ["13"]
+
+
+def test_submit_queues_timeout() -> None:
+    queue = SubmissionQueue(None)
+
+    client = Client([Reply(State.TIMEOUT, 5.0), Reply(State.CORRECT)])
+
+    reply = run(submit_answer(client, queue, KEY, Part.ONE, 42))  # type: ignore[arg-type]
+
+    assert reply.state is State.TIMEOUT
+
+    (submission,) = queue.submissions
+
+    assert submission.answer == ANSWER
+    assert submission.due > time()
+
+    run(submit_answer(client, queue, KEY, Part.ONE, 42))  # type: ignore[arg-type]
+
+    assert not queue
+
+
+def test_resubmit() -> None:
+    queue = SubmissionQueue(None)
+
+    queue.push(Submission(KEY, Part.ONE, ANSWER, 0.0))
+
+    client = Client([Reply(State.TIMEOUT, 0.0), Reply(State.CORRECT)])
+
+    done: List[State] = []
+
+    run(resubmit_answers(client, queue, lambda submission, reply: done.append(reply.state)))  # type: ignore[arg-type]
+
+    assert done == [State.TIMEOUT, State.CORRECT]
+
+    assert not queue
+
+    assert client.submitted == [(KEY, Part.ONE, ANSWER)] * 2
+
+
+def test_resubmit_no_wait() -> None:
+    queue = SubmissionQueue(None)
+
+    queue.push(Submission(KEY, Part.ONE, ANSWER, time() + 60.0))
+
+    client = Client([])
+
+    run(resubmit_answers(client, queue, lambda submission, reply: None, wait=False))  # type: ignore[arg-type]
+
+    assert len(queue) == 1
+    assert not client.submitted
+
+
+def test_resubmit_pushed_only(tmp_path: Path) -> None:
+    path = tmp_path / "submissions.json"
+
+    stale = Submission(KEY, Part.TWO, ANSWER, time() + 60.0)
+
+    SubmissionQueue(path).push(stale)  # queued by the earlier run
+
+    queue = SubmissionQueue(path)
+
+    assert not queue.pushed
+
+    client = Client([Reply(State.TIMEOUT, 0.0), Reply(State.CORRECT)])
+
+    run(submit_answer(client, queue, KEY, Part.ONE, 42))  # type: ignore[arg-type]
+
+    assert queue.pushed == {(KEY, Part.ONE)}
+
+    done: List[State] = []
+
+    run(
+        resubmit_answers(
+            client,  # type: ignore[arg-type]
+            queue,
+            lambda submission, reply: done.append(reply.state),
+            parts=queue.pushed,
+        )
+    )
+
+    assert done == [State.CORRECT]
+
+    assert queue.submissions == [stale]  # not waited for
@@ -0,0 +1,55 @@
+from itertools import count
+
+import pytest
+
+from aoc.timers import Elapsed, Measure, Overhead, Timer, calibrate
+
+STEP = 10
+
+
+def create_clock(step: int = STEP) -> count:
+    return count(0, step)
+
+
+def test_timer_measures() -> None:
+    clock = create_clock()
+    process_clock = create_clock(2 * STEP)
+
+    timer = Timer(clock.__next__, process_clock.__next__, None)
+
+    elapsed = timer.elapsed()
+
+    assert elapsed.nanoseconds == STEP
+    assert elapsed.process_nanoseconds == 2 * STEP
+    assert elapsed.thread_nanoseconds is None
+
+    assert elapsed.get_nanoseconds(Measure.PROCESS) == 2 * STEP
+
+    with pytest.raises(ValueError):
+        elapsed.get_nanoseconds(Measure.THREAD)
+
+
+def test_timer_overhead() -> None:
+    clock = create_clock()
+
+    timer = Timer(clock.__next__, None, None, Overhead(wall=3 * STEP))
+
+    assert timer.elapsed().nanoseconds == 0  # never negative
+
+
+def test_calibrate() -> None:
+    clock = create_clock()
+    thread_clock = create_clock(3 * STEP)
+
+    overhead = calibrate(clock.__next__, None, thread_clock.__next__, rounds=5)
+
+    assert overhead == Overhead(wall=STEP, thread=3 * STEP)
+
+
+def test_elapsed_cpu_times() -> None:
+    elapsed = Elapsed(STEP, process_nanoseconds=STEP, thread_nanoseconds=STEP)
+
+    assert elapsed.process_time == Elapsed(STEP)
+    assert elapsed.thread_time == Elapsed(STEP)
+
+    assert Elapsed(STEP).process_time is None
@@ -0,0 +1,37 @@
+from os import utime
+from pathlib import Path
+
+from aoc.watchers import Watcher
+
+SOURCE = "import helper\n"
+HELPER = "VALUE = 13\n"
+
+LATER = 2_000_000_000
+
+
+def touch(path: Path) -> None:
+    status = path.stat()
+
+    utime(path, ns=(status.st_atime_ns, status.st_mtime_ns + LATER))
+
+
+def test_watcher_changed(tmp_path: Path) -> None:
+    path = tmp_path / "solution.py"
+    path.write_text(SOURCE)
+
+    helper = tmp_path / "helper.py"
+    helper.write_text(HELPER)
+
+    other = tmp_path / "other.py"
+    other.write_text(HELPER)
+
+    watcher = Watcher([path, other])
+
+    assert not watcher.changed()
+
+    touch(helper)
+
+    assert watcher.changed() == [path]
+    assert not watcher.changed()
+
+    assert helper.resolve() in watcher.get_files([path])